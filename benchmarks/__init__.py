@@ -0,0 +1,4 @@
+"""Offline benchmarks for the givenergy_modbus hot paths.
+
+Each module is runnable on its own from the repository root, e.g. `python -m benchmarks.framer`.
+"""
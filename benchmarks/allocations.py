@@ -0,0 +1,115 @@
+"""Measure memory allocated while applying register responses, with and without interned registers.
+
+Run from the repository root with `python -m benchmarks.allocations`. Uses tracemalloc to report, per variant:
+
+* the memory a plant holds after a full refresh of its register caches
+* the transient peak while applying one 60-register response whose values all changed, and one whose values did not
+
+The "before" figures swap in a register class that allocates a new instance per call and hashes a tuple, as
+`Register` used to.
+"""
+
+import gc
+import logging
+import tracemalloc
+from unittest.mock import patch
+
+from custom_components.givenergy_local.givenergy_modbus.model.plant import Plant
+from custom_components.givenergy_local.givenergy_modbus.pdu import (
+    ReadHoldingRegistersRequest,
+    ReadInputRegistersRequest,
+)
+from devtools.simulator import SimulatedInverter
+
+
+class LegacyRegister:
+    """Register as it was before interning."""
+
+    _type: str
+
+    def __init__(self, idx):
+        self._idx = idx
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, LegacyRegister)
+            and self._type == other._type
+            and self._idx == other._idx
+        )
+
+    def __hash__(self):
+        return hash((self._type, self._idx))
+
+
+class LegacyHR(LegacyRegister):
+    _type = "HR"
+
+
+class LegacyIR(LegacyRegister):
+    _type = "IR"
+
+
+def _measure(responses, changed) -> tuple[int, int, int]:
+    gc.collect()
+    tracemalloc.start()
+    plant = Plant()
+    for response in responses:
+        plant.update(response)
+    retained = tracemalloc.get_traced_memory()[0]
+
+    peaks = []
+    # the second time round, none of the values change
+    for response in (changed, changed):
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        plant.update(response)
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    tracemalloc.stop()
+    return retained, peaks[0], peaks[1]
+
+
+def main() -> None:
+    """Entry point."""
+    logging.getLogger("custom_components.givenergy_local").setLevel(logging.CRITICAL)
+
+    inverter = SimulatedInverter()
+    responses = [
+        inverter.respond(request_class(base_register=base_register, register_count=60))
+        for request_class, registers in (
+            (ReadHoldingRegistersRequest, 360),
+            (ReadInputRegistersRequest, 240),
+        )
+        for base_register in range(0, registers, 60)
+    ]
+    changed = inverter.respond(
+        ReadInputRegistersRequest(base_register=0, register_count=60)
+    )
+    changed.register_values = [v + 1 for v in changed.register_values]
+
+    rows = []
+    with (
+        patch(
+            "custom_components.givenergy_local.givenergy_modbus.model.plant.HR",
+            LegacyHR,
+        ),
+        patch(
+            "custom_components.givenergy_local.givenergy_modbus.model.plant.IR",
+            LegacyIR,
+        ),
+    ):
+        rows.append(("before", *_measure(responses, changed)))
+    rows.append(("after", *_measure(responses, changed)))
+
+    print(
+        f"{'registers':<10} {'plant (KiB)':>12} {'changed peak (KiB)':>19} "
+        f"{'unchanged peak (KiB)':>21}"
+    )
+    for label, retained, changed_peak, unchanged_peak in rows:
+        print(
+            f"{label:<10} {retained / 1024:>12.1f} {changed_peak / 1024:>19.1f} "
+            f"{unchanged_peak / 1024:>21.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
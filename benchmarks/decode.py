@@ -0,0 +1,92 @@
+"""Micro-benchmark register response decoding, per-value unpacking versus the bulk array decoder.
+
+Run from the repository root with `python -m benchmarks.decode`. The "before" figures swap in a decoder that
+unpacks each register with its own slice and `struct.unpack` call, as PayloadDecoder used to.
+"""
+
+import argparse
+import logging
+import random
+import struct
+import timeit
+from unittest.mock import patch
+
+from custom_components.givenergy_local.givenergy_modbus.codec import PayloadDecoder
+from custom_components.givenergy_local.givenergy_modbus.pdu import (
+    ClientIncomingMessage,
+    ReadInputRegistersResponse,
+)
+
+from .streams import register_response_frame
+
+
+class LegacyPayloadDecoder(PayloadDecoder):
+    """PayloadDecoder as it was before precompiled structs and bulk decoding."""
+
+    def decode_8bit_uint(self):
+        self._pointer += 1
+        handle = self._payload[self._pointer - 1 : self._pointer]
+        return struct.unpack(self._byteorder + "B", handle)[0]
+
+    def decode_16bit_uint(self):
+        self._pointer += 2
+        handle = self._payload[self._pointer - 2 : self._pointer]
+        return struct.unpack(self._byteorder + "H", handle)[0]
+
+    def decode_16bit_uint_array(self, count: int) -> tuple[int, ...]:
+        return tuple(self.decode_16bit_uint() for _ in range(count))
+
+    def decode_64bit_uint(self):
+        self._pointer += 8
+        handle = self._payload[self._pointer - 8 : self._pointer]
+        return struct.unpack(self._byteorder + "Q", handle)[0]
+
+
+def _best(stmt, number: int, repeat: int) -> float:
+    """Best time per call in microseconds."""
+    return min(timeit.repeat(stmt, number=number, repeat=repeat)) * 1e6 / number
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.getLogger("custom_components.givenergy_local").setLevel(logging.CRITICAL)
+
+    rng = random.Random(1)
+    values = [rng.randrange(0x10000) for _ in range(60)]
+    frame = register_response_frame(ReadInputRegistersResponse, 0x32, 0, values)
+    block = frame[42:162]  # the 60 register values
+
+    rows = []
+    for label, decoder_class in (
+        ("before", LegacyPayloadDecoder),
+        ("after", PayloadDecoder),
+    ):
+        registers = _best(
+            lambda: decoder_class(block).decode_16bit_uint_array(60),
+            args.number,
+            args.repeat,
+        )
+        with patch(
+            "custom_components.givenergy_local.givenergy_modbus.pdu.base.PayloadDecoder",
+            decoder_class,
+        ):
+            assert ClientIncomingMessage.decode_bytes(frame).register_values == values
+            full_frame = _best(
+                lambda: ClientIncomingMessage.decode_bytes(frame),
+                args.number,
+                args.repeat,
+            )
+        rows.append((label, registers, full_frame))
+
+    print(f"{'decoder':<8} {'60 regs (us)':>13} {'frame (us)':>11}")
+    for label, registers, full_frame in rows:
+        print(f"{label:<8} {registers:>13.2f} {full_frame:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
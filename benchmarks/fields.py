@@ -0,0 +1,162 @@
+"""Micro-benchmark deriving model fields from registers, interpreted versus compiled REGISTER_LUT definitions.
+
+Run from the repository root with `python -m benchmarks.fields`. "decode" derives every field of a model from a
+populated register cache, "model" builds the pydantic model the same way `Plant.inverter` and `Plant.batteries` do.
+The "before" figures swap in a getter that interprets each `RegisterDefinition` on every access, as
+`RegisterGetter.get` used to.
+
+"tick" then times a coordinator tick's worth of model work after an input register poll in which a few values
+changed: rebuilding the inverter model from scratch, versus `Plant.inverter` recomputing only the fields that depend
+on the changed registers.
+"""
+
+import argparse
+import logging
+import timeit
+from typing import Any
+from unittest.mock import patch
+
+from custom_components.givenergy_local.givenergy_modbus.exceptions import (
+    ConversionError,
+)
+from custom_components.givenergy_local.givenergy_modbus.model.battery import (
+    Battery,
+    BatteryRegisterGetter,
+)
+from custom_components.givenergy_local.givenergy_modbus.model.inverter import (
+    Inverter,
+    InverterRegisterGetter,
+)
+from custom_components.givenergy_local.givenergy_modbus.model.plant import Plant
+from custom_components.givenergy_local.givenergy_modbus.model.register import (
+    IR,
+    RegisterGetter,
+)
+from custom_components.givenergy_local.givenergy_modbus.pdu import (
+    ReadHoldingRegistersRequest,
+    ReadInputRegistersRequest,
+)
+from devtools.simulator import SimulatedInverter, example_register_caches
+
+
+class InterpretingGetter(RegisterGetter):
+    """RegisterGetter.get as it was before definitions were compiled."""
+
+    REGISTER_LUT: dict = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            r = self.REGISTER_LUT[key]
+        except KeyError:
+            return default
+        regs = [self._obj.get(r) for r in r.registers]
+        if None in regs:
+            return None
+        try:
+            if r.pre_conv:
+                if isinstance(r.pre_conv, tuple):
+                    val = r.pre_conv[0](*(regs + list(r.pre_conv[1:])))
+                else:
+                    val = r.pre_conv(*regs)
+            else:
+                val = regs
+            if r.post_conv:
+                if isinstance(r.post_conv, tuple):
+                    return r.post_conv[0](val, *r.post_conv[1:])
+                return r.post_conv(val)
+            return val
+        except ValueError as err:
+            raise ConversionError(key, regs, str(err)) from err
+
+
+class InterpretingInverterGetter(InterpretingGetter):
+    REGISTER_LUT = InverterRegisterGetter.REGISTER_LUT
+
+
+class InterpretingBatteryGetter(InterpretingGetter):
+    REGISTER_LUT = BatteryRegisterGetter.REGISTER_LUT
+
+
+def _best(stmt, number: int, repeat: int) -> float:
+    """Best time per call in microseconds."""
+    return min(timeit.repeat(stmt, number=number, repeat=repeat)) * 1e6 / number
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.getLogger("custom_components.givenergy_local").setLevel(logging.CRITICAL)
+
+    register_caches = example_register_caches(number_batteries=1)
+    rows = []
+    for name, model, cache, getters in (
+        (
+            "inverter",
+            Inverter,
+            register_caches[0x32],
+            (InterpretingInverterGetter, InverterRegisterGetter),
+        ),
+        (
+            "battery",
+            Battery,
+            register_caches[0x32],
+            (InterpretingBatteryGetter, BatteryRegisterGetter),
+        ),
+    ):
+        for label, getter in zip(("before", "after"), getters):
+
+            def decode() -> None:
+                fields = getter(cache)
+                for key in getter.REGISTER_LUT:
+                    fields.get(key)
+
+            decode_time = _best(decode, args.number, args.repeat)
+            with patch.object(model.__config__, "getter_dict", getter):
+                model_time = _best(
+                    lambda: model.from_orm(cache), args.number, args.repeat
+                )
+            rows.append((f"{name} {label}", decode_time, model_time))
+
+    print(f"{'getter':<16} {'decode (us)':>12} {'model (us)':>11}")
+    for label, decode_time, model_time in rows:
+        print(f"{label:<16} {decode_time:>12.2f} {model_time:>11.2f}")
+
+    # alternate between two polls that differ in a handful of measurements, as consecutive polls do
+    inverter = SimulatedInverter()
+    plant = Plant()
+    for request in (
+        ReadHoldingRegistersRequest(base_register=0, register_count=60),
+        ReadInputRegistersRequest(base_register=0, register_count=60),
+    ):
+        plant.update(inverter.respond(request))
+    polls = []
+    for i in range(2):
+        for register in (5, 13, 24, 30, 42, 52):
+            inverter.register_caches[0x32][IR(register)] = 100 * i + register
+        polls.append(
+            inverter.respond(
+                ReadInputRegistersRequest(base_register=0, register_count=60)
+            )
+        )
+    assert plant.inverter
+
+    def tick(rebuild: bool) -> None:
+        for poll in polls:
+            plant.update(poll)
+            if rebuild:
+                Inverter.from_orm(plant.register_caches[0x32])
+            else:
+                _ = plant.inverter
+
+    full = _best(lambda: tick(True), args.number, args.repeat) / 2
+    incremental = _best(lambda: tick(False), args.number, args.repeat) / 2
+    print(f"\n{'tick':<16} {'full (us)':>12} {'incremental (us)':>17}")
+    print(f"{'inverter':<16} {full:>12.2f} {incremental:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Benchmark Framer.decode CPU cost per frame over multi-frame, fragmented and garbage-laden streams.
+
+Run from the repository root with `python -m benchmarks.framer`. The previous bytes-concatenating framer is
+replicated here as a baseline so both can be compared on identical input. A real capture (one hex-encoded socket
+read per line) can be supplied with `--capture`.
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import time
+from typing import AsyncIterator, Callable
+
+from custom_components.givenergy_local.givenergy_modbus.exceptions import (
+    ExceptionBase,
+    InvalidFrame,
+    InvalidPduState,
+)
+from custom_components.givenergy_local.givenergy_modbus.framer import (
+    HEADER_START_MARKER,
+    ClientFramer,
+    Framer,
+)
+from custom_components.givenergy_local.givenergy_modbus.pdu import BasePDU
+
+from .streams import fragmented_stream, garbage_stream, load_capture, multi_frame_stream
+
+_logger = logging.getLogger("custom_components.givenergy_local.givenergy_modbus.framer")
+
+
+class LegacyClientFramer(ClientFramer):
+    """The framer as it was before the cursor-based buffer: every frame and resync reslices the whole buffer."""
+
+    _legacy_buffer: bytes = b""
+
+    async def decode(self, data: bytes) -> AsyncIterator[BasePDU | ExceptionBase]:
+        self._legacy_buffer += data
+        while len(self._legacy_buffer) >= 18:
+            frame_start_offset = self._legacy_buffer.find(HEADER_START_MARKER)
+            if frame_start_offset < 0:
+                _logger.info("No frame header found, await more data")
+                break
+            elif frame_start_offset > 0:
+                _logger.warning(
+                    f"Candidate frame found {frame_start_offset} bytes into buffer, "
+                    f"discarding leading garbage: 0x{self._legacy_buffer[:frame_start_offset].hex()}"
+                )
+                self._legacy_buffer = self._legacy_buffer[frame_start_offset:]
+                continue
+
+            _logger.debug(
+                f"Found next frame: 0x{self._legacy_buffer[:8].hex()}..., buffer_len={len(self._legacy_buffer)}"
+            )
+
+            next_frame_start_offset = self._legacy_buffer.find(HEADER_START_MARKER, 1)
+            if 0 < next_frame_start_offset < 18:
+                _logger.error(
+                    "Next frame start found implausibly near, current frame likely corrupt/invalid. "
+                    f"Skipping forward {next_frame_start_offset}b. "
+                    f"Buffer={len(self._legacy_buffer)}b: 0x{self._legacy_buffer.hex()}"
+                )
+                self._legacy_buffer = self._legacy_buffer[next_frame_start_offset:]
+                continue
+
+            hdr_len = int.from_bytes(self._legacy_buffer[4:6], byteorder="big")
+            u_id, f_id = self._legacy_buffer[6], self._legacy_buffer[7]
+            if hdr_len > 300 or u_id not in (0, 1) or f_id not in (1, 2):
+                _logger.warning(
+                    f"Unexpected header values found (len={hdr_len:04x}, u_id={u_id:02x}, f_id={f_id:02x}), "
+                    f"discarding candidate frame and resuming search"
+                )
+                self._legacy_buffer = self._legacy_buffer[4:]
+                continue
+
+            frame_len = 6 + hdr_len
+            if len(self._legacy_buffer) < frame_len:
+                _logger.debug(
+                    f"Buffer ({len(self._legacy_buffer)}b) insufficient for frame of length {frame_len}b, "
+                    "await more data"
+                )
+                break
+
+            frame = self._legacy_buffer[:frame_len]
+            self._legacy_buffer = self._legacy_buffer[frame_len:]
+            try:
+                yield self.pdu_class.decode_bytes(frame)
+            except (InvalidPduState, InvalidFrame) as e:
+                yield e
+
+
+async def _run(framer: Framer, reads: list[bytes]) -> tuple[int, int]:
+    messages = errors = 0
+    for data in reads:
+        async for message in framer.decode(data):
+            if isinstance(message, ExceptionBase):
+                errors += 1
+            else:
+                messages += 1
+    return messages, errors
+
+
+class _PassThroughDecoder:
+    """Stands in for the PDU decoder when measuring framing on its own."""
+
+    @staticmethod
+    def decode_bytes(data: bytes) -> bytes:
+        return data
+
+
+def bench(
+    factory: Callable[[], Framer],
+    reads: list[bytes],
+    rounds: int,
+    framing_only: bool = False,
+) -> tuple[float, int, int]:
+    """Return the best CPU time per decoded frame in microseconds, with message and error counts."""
+    best = float("inf")
+    messages = errors = 0
+    for _ in range(rounds):
+        framer = factory()
+        if framing_only:
+            framer.pdu_class = _PassThroughDecoder  # type: ignore[assignment]
+        start = time.process_time()
+        messages, errors = asyncio.run(_run(framer, reads))
+        best = min(best, time.process_time() - start)
+    return best * 1e6 / max(messages + errors, 1), messages, errors
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--refreshes",
+        type=int,
+        default=200,
+        help="Plant refreshes per synthetic stream",
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=5, help="Repetitions, the best is reported"
+    )
+    parser.add_argument(
+        "--capture",
+        help="Hex-per-line capture file to benchmark instead of synthetic streams",
+    )
+    parser.add_argument(
+        "--framing-only",
+        action="store_true",
+        help="Skip PDU decoding to isolate framing cost",
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    # Framing and PDU warnings are part of normal garbage handling; keep them out of the measurement output.
+    logging.getLogger("custom_components.givenergy_local").setLevel(logging.CRITICAL)
+
+    rng = random.Random(args.seed)
+    if args.capture:
+        streams = {"capture": load_capture(args.capture)}
+    else:
+        streams = {
+            "multi-frame": multi_frame_stream(rng, args.refreshes),
+            "fragmented": fragmented_stream(rng, args.refreshes),
+            "garbage": garbage_stream(rng, args.refreshes),
+        }
+
+    print(f"{'stream':<12} {'framer':<8} {'frames':>7} {'errors':>7} {'us/frame':>9}")
+    for name, reads in streams.items():
+        for label, factory in (
+            ("legacy", LegacyClientFramer),
+            ("current", ClientFramer),
+        ):
+            per_frame, messages, errors = bench(
+                factory, reads, args.rounds, args.framing_only
+            )
+            print(f"{name:<12} {label:<8} {messages:>7} {errors:>7} {per_frame:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
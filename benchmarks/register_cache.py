@@ -0,0 +1,77 @@
+"""Micro-benchmark applying register responses to a plant, dict-backed versus array-backed register caches.
+
+Run from the repository root with `python -m benchmarks.register_cache`. "apply" times `Plant.update()` for one
+60-register input register response whose values differ from the cached ones, "unchanged" the same response applied
+again, and "model" building the `Inverter` model from the populated cache.
+"""
+
+import argparse
+import logging
+import timeit
+
+from custom_components.givenergy_local.givenergy_modbus.model.inverter import Inverter
+from custom_components.givenergy_local.givenergy_modbus.model.plant import Plant
+from custom_components.givenergy_local.givenergy_modbus.pdu import (
+    ReadHoldingRegistersRequest,
+    ReadInputRegistersRequest,
+)
+from devtools.simulator import SimulatedInverter
+
+
+def _best(stmt, number: int, repeat: int) -> float:
+    """Best time per call in microseconds."""
+    return min(timeit.repeat(stmt, number=number, repeat=repeat)) * 1e6 / number
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.getLogger("custom_components.givenergy_local").setLevel(logging.CRITICAL)
+
+    inverter = SimulatedInverter()
+    responses = [
+        inverter.respond(request_class(base_register=base_register, register_count=60))
+        for request_class, registers in (
+            (ReadHoldingRegistersRequest, 360),
+            (ReadInputRegistersRequest, 240),
+        )
+        for base_register in range(0, registers, 60)
+    ]
+    first = inverter.respond(
+        ReadInputRegistersRequest(base_register=0, register_count=60)
+    )
+    first.register_values = [v + 1 for v in first.register_values]
+    second = inverter.respond(
+        ReadInputRegistersRequest(base_register=0, register_count=60)
+    )
+
+    rows = []
+    for label, array_register_caches in (("dict", False), ("array", True)):
+        plant = Plant(array_register_caches=array_register_caches)
+        for response in responses:
+            plant.update(response)
+
+        def apply() -> None:
+            plant.update(first)
+            plant.update(second)
+
+        changed = _best(apply, args.number, args.repeat) / 2
+        unchanged = _best(lambda: plant.update(second), args.number, args.repeat)
+        model = _best(
+            lambda: Inverter.from_orm(plant.register_caches[0x32]),
+            max(1, args.number // 10),
+            args.repeat,
+        )
+        rows.append((label, changed, unchanged, model))
+
+    print(f"{'cache':<6} {'apply (us)':>11} {'unchanged (us)':>15} {'model (us)':>11}")
+    for label, changed, unchanged, model in rows:
+        print(f"{label:<6} {changed:>11.2f} {unchanged:>15.2f} {model:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
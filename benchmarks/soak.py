@@ -0,0 +1,316 @@
+"""Load and soak test the polling path against simulated inverters.
+
+Run from the repository root with `python -m benchmarks.soak`. Each scenario starts its simulated inverters in a
+separate process, so CPU figures only cover the polling side, then polls every inverter on a fixed cadence for
+`--duration` seconds. Polling goes through `Client.refresh_plant`, or with `--mode coordinator` through the
+integration's `GivEnergyUpdateCoordinator._async_update_data` (which needs Home Assistant installed).
+
+Reported per scenario:
+
+* refresh wall time percentiles, and the share of refreshes that failed
+* CPU time per refresh, for the whole polling process
+* memory blocks per refresh (net growth, so a leak shows up as a steady non-zero figure) and gen-0 garbage
+  collections per refresh (a proxy for allocation churn); with `--tracemalloc`, also the peak traced memory
+* event loop lag percentiles, sampled by a task that sleeps for `--lag-interval` seconds at a time
+
+Results are printed and written as JSON to `--output`, so runs can be compared by a script.
+
+For a soak run at the production cadence, use e.g. `--duration 14400 --interval 10`.
+"""
+
+import argparse
+import asyncio
+from dataclasses import asdict, dataclass, field
+import gc
+import json
+import logging
+import multiprocessing
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Optional
+
+from custom_components.givenergy_local.givenergy_modbus.client.client import Client
+from devtools.simulator import Faults, SimulatedInverter, example_register_caches
+
+
+@dataclass
+class Scenario:
+    """A set of simulated inverters, all behaving the same way."""
+
+    description: str
+    inverters: int = 1
+    batteries: int = 1
+    faults: Faults = field(default_factory=Faults)
+
+
+SCENARIOS = {
+    "baseline": Scenario("one inverter with one battery over a clean link"),
+    "batteries": Scenario("one inverter with five batteries", batteries=5),
+    "lossy": Scenario(
+        "a slow, lossy link that fragments and corrupts frames",
+        batteries=2,
+        faults=Faults(
+            latency=0.05,
+            jitter=0.2,
+            fragment_size=32,
+            garbage=0.05,
+            null_responses=0.02,
+            bad_crc=0.02,
+            timeouts=0.05,
+        ),
+    ),
+    "fleet": Scenario(
+        "many inverters polled from one process",
+        inverters=20,
+        batteries=2,
+        faults=Faults(latency=0.02, jitter=0.05),
+    ),
+}
+
+
+def _serve(scenario: Scenario, seed: int, ports, stop) -> None:
+    async def main() -> None:
+        inverters = [
+            SimulatedInverter(
+                example_register_caches(scenario.batteries),
+                inverter_serial_number=f"SA{i:04d}G567",
+                faults=scenario.faults,
+                heartbeat_interval=180,
+                seed=seed + i,
+            )
+            for i in range(scenario.inverters)
+        ]
+        for inverter in inverters:
+            await inverter.start()
+        ports.put([inverter.port for inverter in inverters])
+        while not stop.is_set():
+            await asyncio.sleep(0.2)
+        for inverter in inverters:
+            await inverter.close()
+
+    logging.getLogger("custom_components.givenergy_local").setLevel(logging.CRITICAL)
+    asyncio.run(main())
+
+
+def _percentiles(samples: list[float]) -> dict[str, Optional[float]]:
+    if not samples:
+        return {"p50": None, "p90": None, "p99": None, "max": None}
+    ordered = sorted(samples)
+
+    def at(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    return {"p50": at(0.5), "p90": at(0.9), "p99": at(0.99), "max": ordered[-1]}
+
+
+async def _monitor_loop_lag(interval: float, lags: list[float]) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+Refresh = Callable[[], Awaitable[Any]]
+
+
+async def _client_targets(ports: list[int]) -> tuple[list[Refresh], Callable]:
+    clients = [Client("127.0.0.1", port) for port in ports]
+    for client in clients:
+        await client.connect()
+    await asyncio.gather(*(c.detect_plant(timeout=1.0, retries=3) for c in clients))
+
+    def target(client: Client) -> Refresh:
+        refreshes = 0
+
+        async def refresh() -> None:
+            nonlocal refreshes
+            # a full refresh every 30 polls, as the coordinator does every 5 minutes at its 10s cadence
+            full_refresh = refreshes % 30 == 0
+            refreshes += 1
+            await client.refresh_plant(full_refresh=full_refresh, retries=2)
+
+        return refresh
+
+    async def close() -> None:
+        for client in clients:
+            await client.close()
+
+    return [target(c) for c in clients], close
+
+
+async def _coordinator_targets(ports: list[int]) -> tuple[list[Refresh], Callable]:
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.givenergy_local.coordinator import (
+        GivEnergyUpdateCoordinator,
+    )
+
+    hass = HomeAssistant(tempfile.mkdtemp(prefix="givenergy-soak-"))
+    coordinators = []
+    for i, port in enumerate(ports):
+        coordinator = GivEnergyUpdateCoordinator(hass, "127.0.0.1", f"soak-{i}")
+        coordinator.client = Client("127.0.0.1", port)
+        coordinators.append(coordinator)
+    # the first update connects and detects the plant
+    await asyncio.gather(*(c._async_update_data() for c in coordinators))
+
+    async def close() -> None:
+        for coordinator in coordinators:
+            await coordinator.client.close()
+        await hass.async_stop(force=True)
+
+    return [c._async_update_data for c in coordinators], close
+
+
+async def _run(
+    scenario: Scenario, ports: list[int], args: argparse.Namespace
+) -> dict[str, Any]:
+    if args.mode == "coordinator":
+        targets, close = await _coordinator_targets(ports)
+    else:
+        targets, close = await _client_targets(ports)
+
+    wall_times: list[float] = []
+    failures = 0
+    lags: list[float] = []
+    monitor = asyncio.create_task(_monitor_loop_lag(args.lag_interval, lags))
+    deadline = asyncio.get_running_loop().time() + args.duration
+
+    async def poll(refresh: Refresh) -> None:
+        nonlocal failures
+        loop = asyncio.get_running_loop()
+        while loop.time() < deadline:
+            started = time.perf_counter()
+            try:
+                await refresh()
+            except Exception:  # pylint: disable=broad-except
+                failures += 1
+            elapsed = time.perf_counter() - started
+            wall_times.append(elapsed)
+            await asyncio.sleep(max(0.0, args.interval - elapsed))
+
+    gc.collect()
+    if args.tracemalloc:
+        tracemalloc.start()
+    blocks_before = sys.getallocatedblocks()
+    gen0_before = gc.get_stats()[0]["collections"]
+    cpu_before = time.process_time()
+    await asyncio.gather(*(poll(target) for target in targets))
+    cpu = time.process_time() - cpu_before
+    gen0 = gc.get_stats()[0]["collections"] - gen0_before
+    blocks = sys.getallocatedblocks() - blocks_before
+    traced_peak = None
+    if args.tracemalloc:
+        traced_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    monitor.cancel()
+    await close()
+
+    refreshes = len(wall_times)
+    per_refresh = max(refreshes, 1)
+    return {
+        "description": scenario.description,
+        "inverters": scenario.inverters,
+        "batteries": scenario.batteries,
+        "faults": asdict(scenario.faults),
+        "refreshes": refreshes,
+        "failures": failures,
+        "failure_rate": failures / per_refresh,
+        "wall_seconds": _percentiles(wall_times),
+        "cpu_seconds_per_refresh": cpu / per_refresh,
+        "memory_blocks_per_refresh": blocks / per_refresh,
+        "gc_gen0_collections_per_refresh": gen0 / per_refresh,
+        "traced_peak_bytes": traced_peak,
+        "loop_lag_seconds": _percentiles(lags),
+    }
+
+
+def run_scenario(scenario: Scenario, args: argparse.Namespace) -> dict[str, Any]:
+    """Start the simulated inverters for a scenario in their own process, and poll them from this one."""
+    ports: multiprocessing.Queue = multiprocessing.Queue()
+    stop = multiprocessing.Event()
+    server = multiprocessing.Process(
+        target=_serve, args=(scenario, args.seed, ports, stop), daemon=True
+    )
+    server.start()
+    try:
+        return asyncio.run(_run(scenario, ports.get(timeout=30), args))
+    finally:
+        stop.set()
+        server.join(timeout=5)
+        if server.is_alive():
+            server.terminate()
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "scenarios",
+        nargs="*",
+        help=f"Scenarios to run, of {', '.join(SCENARIOS)}; all by default",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=("client", "coordinator"),
+        default="client",
+        help="Poll through Client.refresh_plant or the coordinator",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=60, help="Seconds to poll each scenario for"
+    )
+    parser.add_argument(
+        "--interval", type=float, default=1.0, help="Seconds between polls of a plant"
+    )
+    parser.add_argument("--lag-interval", type=float, default=0.01)
+    parser.add_argument(
+        "--tracemalloc",
+        action="store_true",
+        help="Also trace peak memory; slows everything down",
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", default="soak-results.json")
+    args = parser.parse_args()
+    for name in args.scenarios:
+        if name not in SCENARIOS:
+            parser.error(f"unknown scenario: {name}")
+
+    logging.getLogger("custom_components.givenergy_local").setLevel(logging.CRITICAL)
+
+    results: dict[str, Any] = {
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "mode": args.mode,
+        "duration": args.duration,
+        "interval": args.interval,
+        "scenarios": {},
+    }
+    print(
+        f"{'scenario':<10} {'refreshes':>9} {'failed':>7} {'p50 ms':>8} {'p99 ms':>8} "
+        f"{'cpu ms':>7} {'blocks':>7} {'lag p99 ms':>10}"
+    )
+    for name in args.scenarios or SCENARIOS:
+        result = run_scenario(SCENARIOS[name], args)
+        results["scenarios"][name] = result
+        wall, lag = result["wall_seconds"], result["loop_lag_seconds"]
+        print(
+            f"{name:<10} {result['refreshes']:>9} {result['failures']:>7} "
+            f"{(wall['p50'] or 0) * 1e3:>8.1f} {(wall['p99'] or 0) * 1e3:>8.1f} "
+            f"{result['cpu_seconds_per_refresh'] * 1e3:>7.2f} "
+            f"{result['memory_blocks_per_refresh']:>7.1f} {(lag['p99'] or 0) * 1e3:>10.2f}"
+        )
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Synthetic GivEnergy wire traffic for benchmarks."""
+
+import random
+from typing import Iterator
+
+from custom_components.givenergy_local.givenergy_modbus.codec import PayloadEncoder
+from custom_components.givenergy_local.givenergy_modbus.pdu import (
+    HeartbeatRequest,
+    NullResponse,
+    ReadHoldingRegistersResponse,
+    ReadInputRegistersResponse,
+    ReadRegistersResponse,
+)
+
+INVERTER_SERIAL_NUMBER = "SA1234G567"
+DATA_ADAPTER_SERIAL_NUMBER = "WF1234G567"
+
+
+def register_response_frame(
+    cls: type[ReadRegistersResponse],
+    slave_address: int,
+    base_register: int,
+    register_values: list[int],
+) -> bytes:
+    """Encode a register response frame carrying a valid CRC."""
+    crc_builder = PayloadEncoder()
+    crc_builder.add_8bit_uint(slave_address)
+    crc_builder.add_8bit_uint(cls.transparent_function_code)
+    crc_builder.add_string(INVERTER_SERIAL_NUMBER, len(INVERTER_SERIAL_NUMBER))
+    crc_builder.add_16bit_uint(base_register)
+    crc_builder.add_16bit_uint(len(register_values))
+    [crc_builder.add_16bit_uint(r) for r in register_values]
+    check = int.from_bytes(crc_builder.crc.to_bytes(2, "little"), "big")
+    pdu = cls(
+        slave_address=slave_address,
+        base_register=base_register,
+        register_count=len(register_values),
+        register_values=register_values,
+        inverter_serial_number=INVERTER_SERIAL_NUMBER,
+        data_adapter_serial_number=DATA_ADAPTER_SERIAL_NUMBER,
+        padding=0x8A,
+        check=check,
+    )
+    return pdu.encode()
+
+
+def plant_frames(rng: random.Random, number_batteries: int = 2) -> list[bytes]:
+    """Frames seen during one complete refresh of a plant, plus the odd unsolicited message."""
+    frames = []
+    for cls, base_register in (
+        (ReadInputRegistersResponse, 0),
+        (ReadHoldingRegistersResponse, 0),
+        (ReadHoldingRegistersResponse, 60),
+        (ReadInputRegistersResponse, 120),
+    ):
+        values = [rng.randrange(0x10000) for _ in range(60)]
+        frames.append(register_response_frame(cls, 0x32, base_register, values))
+    for i in range(number_batteries):
+        values = [rng.randrange(0x10000) for _ in range(60)]
+        frames.append(
+            register_response_frame(ReadInputRegistersResponse, 0x32 + i, 60, values)
+        )
+    null_response = NullResponse(
+        inverter_serial_number="\x00" * 10,
+        data_adapter_serial_number=DATA_ADAPTER_SERIAL_NUMBER,
+    )
+    frames.append(null_response.encode())
+    frames.append(
+        HeartbeatRequest(data_adapter_serial_number=DATA_ADAPTER_SERIAL_NUMBER).encode()
+    )
+    return frames
+
+
+def chunked(
+    data: bytes, rng: random.Random, min_size: int, max_size: int
+) -> Iterator[bytes]:
+    """Split a byte stream into randomly sized reads, as a socket would deliver them."""
+    i = 0
+    while i < len(data):
+        size = rng.randint(min_size, max_size)
+        yield data[i : i + size]
+        i += size
+
+
+def multi_frame_stream(rng: random.Random, refreshes: int) -> list[bytes]:
+    """Back-to-back frames delivered in full 300-byte reads."""
+    data = b"".join(b"".join(plant_frames(rng)) for _ in range(refreshes))
+    return list(chunked(data, rng, 300, 300))
+
+
+def fragmented_stream(rng: random.Random, refreshes: int) -> list[bytes]:
+    """Frames split across many small reads, as seen on congested or GPRS links."""
+    data = b"".join(b"".join(plant_frames(rng)) for _ in range(refreshes))
+    return list(chunked(data, rng, 7, 64))
+
+
+def garbage_stream(rng: random.Random, refreshes: int) -> list[bytes]:
+    """Frames interleaved with garbage bytes and truncated frame headers that force resyncs."""
+    data = bytearray()
+    for _ in range(refreshes):
+        for frame in plant_frames(rng):
+            roll = rng.random()
+            if roll < 0.1:
+                data += frame[: rng.randint(4, 17)]
+            elif roll < 0.3:
+                data += bytes(rng.randrange(256) for _ in range(rng.randint(1, 40)))
+            data += frame
+    return list(chunked(bytes(data), rng, 30, 300))
+
+
+def load_capture(path: str) -> list[bytes]:
+    """Load a capture with one hex-encoded read per line, skipping `#` comment lines."""
+    with open(path, encoding="ascii") as f:
+        return [
+            bytes.fromhex(line.strip())
+            for line in f
+            if line.strip() and not line.startswith("#")
+        ]
@@ -0,0 +1,113 @@
+"""Compare the StreamReader and asyncio.Protocol client transports against a local fake inverter.
+
+Run from the repository root with `python -m benchmarks.transport`. The fake inverter runs in a separate process and
+streams recorded-style response frames as fast as the socket allows, so the CPU figures only cover the client.
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import random
+import socket
+import time
+
+from custom_components.givenergy_local.givenergy_modbus.client.client import Client
+
+from .streams import plant_frames
+
+
+def _serve(port: int, payload: bytes, ready) -> None:
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        for i in range(0, len(payload), 300):
+            writer.write(payload[i : i + 300])
+            await writer.drain()
+        await reader.read()  # hold the connection open until the client goes away
+        writer.close()
+
+    async def main() -> None:
+        server = await asyncio.start_server(handle, "127.0.0.1", port)
+        ready.set()
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(main())
+
+
+async def _receive(port: int, expected: int, use_protocol: bool) -> tuple[float, float]:
+    client = Client("127.0.0.1", port, use_protocol=use_protocol)
+    received = 0
+    done = asyncio.get_running_loop().create_future()
+    dispatch = client.dispatch
+
+    def counting_dispatch(message) -> None:
+        nonlocal received
+        dispatch(message)
+        received += 1
+        if received == expected and not done.done():
+            done.set_result(None)
+
+    client.dispatch = counting_dispatch  # type: ignore[method-assign]
+    start_wall, start_cpu = time.perf_counter(), time.process_time()
+    await client.connect()
+    await done
+    elapsed_wall, elapsed_cpu = (
+        time.perf_counter() - start_wall,
+        time.process_time() - start_cpu,
+    )
+    await client.close()
+    return elapsed_wall, elapsed_cpu
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--refreshes",
+        type=int,
+        default=1000,
+        help="Plant refreshes worth of frames to stream",
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=3, help="Repetitions, the best is reported"
+    )
+    args = parser.parse_args()
+
+    logging.getLogger("custom_components.givenergy_local").setLevel(logging.CRITICAL)
+
+    rng = random.Random(1)
+    frames = [frame for _ in range(args.refreshes) for frame in plant_frames(rng)]
+    payload = b"".join(frames)
+
+    print(f"{'transport':<10} {'events':>7} {'events/s':>10} {'cpu us/event':>13}")
+    for label, use_protocol in (("stream", False), ("protocol", True)):
+        best_wall = best_cpu = float("inf")
+        for _ in range(args.rounds):
+            port = _free_port()
+            ready = multiprocessing.Event()
+            server = multiprocessing.Process(
+                target=_serve, args=(port, payload, ready), daemon=True
+            )
+            server.start()
+            ready.wait()
+            try:
+                wall, cpu = asyncio.run(_receive(port, len(frames), use_protocol))
+            finally:
+                server.terminate()
+                server.join()
+            best_wall, best_cpu = min(best_wall, wall), min(best_cpu, cpu)
+        print(
+            f"{label:<10} {len(frames):>7} {len(frames) / best_wall:>10.0f} {best_cpu * 1e6 / len(frames):>13.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
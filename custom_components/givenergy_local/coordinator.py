@@ -6,21 +6,29 @@ import asyncio
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from logging import getLogger
+from typing import Any
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .const import DOMAIN
 from .givenergy_modbus.client.client import Client
 from .givenergy_modbus.exceptions import CommunicationError, ConversionError
 from .givenergy_modbus.model.plant import Plant
+from .givenergy_modbus.model.profile import PlantProfile
 from .givenergy_modbus.pdu.transparent import TransparentRequest
 
 _LOGGER = getLogger(__name__)
+_UPDATE_INTERVAL = timedelta(seconds=10)
 _FULL_REFRESH_INTERVAL = timedelta(minutes=5)
 _REFRESH_ATTEMPTS = 3
 _REFRESH_DELAY_BETWEEN_ATTEMPTS = 2.0
+# only until the client has learned how quickly the adapter responds
 _COMMAND_TIMEOUT = 3.0
 _COMMAND_RETRIES = 3
+_PROFILE_MAX_AGE = timedelta(days=7)
+_PROFILE_STORAGE_VERSION = 1
 
 
 @dataclass
@@ -48,6 +56,11 @@ class QualityCheck:
         )
 
 
+def profile_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Storage for the plant capability profile of a config entry."""
+    return Store(hass, _PROFILE_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.profile")
+
+
 QC = QualityCheck
 _INVERTER_QUALITY_CHECKS = [
     QC("temp_inverter_heatsink", -10, 100),
@@ -66,13 +79,13 @@ _INVERTER_QUALITY_CHECKS = [
 class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
     """Update coordinator that fetches data from a GivEnergy inverter."""
 
-    def __init__(self, hass: HomeAssistant, host: str) -> None:
+    def __init__(self, hass: HomeAssistant, host: str, entry_id: str) -> None:
         """Initialize my coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name="Inverter",
-            update_interval=timedelta(seconds=10),
+            update_interval=_UPDATE_INTERVAL,
         )
 
         self.host = host
@@ -80,6 +93,13 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
         self.require_full_refresh = True
         self.last_full_refresh = datetime.min
 
+        # Capabilities found by plant detection, persisted so later connections can skip it
+        self._profile_store = profile_store(hass, entry_id)
+        self._profile: PlantProfile | None = None
+        self._profile_loaded = False
+        # set when a stale profile was adopted, so the next update re-detects the plant instead of refreshing it
+        self._redetect_plant = False
+
     async def async_shutdown(self) -> None:
         """Terminate the modbus connection and shut down the coordinator."""
         _LOGGER.debug("Shutting down")
@@ -90,11 +110,21 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
         """Fetch data from the inverter."""
         if not self.client.connected:
             await self.client.connect()
-            await self.client.detect_plant()
-            self.require_full_refresh = False
-            self.last_full_refresh = datetime.now(UTC)
-            # Detection performs a full refresh - no need to trigger another one now
-            return self.client.plant
+            if await self._async_use_profile():
+                self.require_full_refresh = True
+            else:
+                await self._async_detect_plant()
+                self.require_full_refresh = False
+                self.last_full_refresh = datetime.now(UTC)
+                # Detection performs a full refresh - no need to trigger another one now
+                return self.client.plant
+        elif self._redetect_plant:
+            self._redetect_plant = False
+            # runs in place of this update's refresh, so it never shares the connection with one
+            if await self._async_redetect_plant():
+                self.require_full_refresh = False
+                self.last_full_refresh = datetime.now(UTC)
+                return self.client.plant
 
         if self.last_full_refresh < (datetime.now(UTC) - _FULL_REFRESH_INTERVAL):
             self.require_full_refresh = True
@@ -116,8 +146,11 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
                         _REFRESH_ATTEMPTS,
                         self.require_full_refresh,
                     )
+                    # skip blocks that cloud or app traffic has refreshed since our last update
                     plant = await self.client.refresh_plant(
-                        full_refresh=self.require_full_refresh, retries=2
+                        full_refresh=self.require_full_refresh,
+                        retries=2,
+                        passive_max_age=_UPDATE_INTERVAL.total_seconds(),
                     )
             except ValueError as err:
                 _LOGGER.warning("Plant refresh failed due to bad data: %s", err)
@@ -145,6 +178,43 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
             f"Failed to obtain valid data after {_REFRESH_ATTEMPTS} attempts"
         )
 
+    async def _async_use_profile(self) -> bool:
+        """Adopt the stored capability profile, if it belongs to the connected inverter.
+
+        A stale profile is still used, but detection is re-run on the next update to refresh it.
+        """
+        if not self._profile_loaded:
+            self._profile_loaded = True
+            if data := await self._profile_store.async_load():
+                try:
+                    self._profile = PlantProfile.parse_obj(data)
+                except ValueError as err:
+                    _LOGGER.warning("Ignoring invalid stored plant profile: %s", err)
+
+        if self._profile is None or not await self.client.load_profile(self._profile):
+            return False
+
+        if self._profile.is_stale(_PROFILE_MAX_AGE.total_seconds()):
+            self._redetect_plant = True
+        return True
+
+    async def _async_detect_plant(self) -> None:
+        """Detect the plant's capabilities and persist them."""
+        await self.client.detect_plant()
+        self._profile = PlantProfile.from_plant(self.client.plant)
+        await self._profile_store.async_save(self._profile.dict())
+
+    async def _async_redetect_plant(self) -> bool:
+        """Refresh a stale profile, returning whether detection succeeded."""
+        _LOGGER.info("Stored plant profile is stale, detecting plant again")
+        try:
+            await self._async_detect_plant()
+        except Exception as err:  # pylint: disable=broad-except
+            # keep using the stale profile, and try again next time we connect
+            _LOGGER.warning("Plant re-detection failed: %s", err)
+            return False
+        return True
+
     @staticmethod
     def _is_data_valid(plant: Plant) -> bool:
         """Perform checks to ensure returned data actually makes sense.
@@ -196,7 +266,13 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
         return True
 
     async def execute(self, requests: list[TransparentRequest]) -> None:
-        """Execute a set of requests and force an update to read any new values."""
-        self.client.execute(requests, _COMMAND_TIMEOUT, _COMMAND_RETRIES)
-        self.require_full_refresh = True
-        await self.async_request_refresh()
+        """Execute a set of requests and update entities with the values written."""
+        try:
+            await self.client.write(requests, _COMMAND_TIMEOUT, _COMMAND_RETRIES)
+        except (asyncio.TimeoutError, CommunicationError) as err:
+            # we can't tell what was written, so read everything back
+            _LOGGER.warning("Failed to confirm write, refreshing all data: %s", err)
+            self.require_full_refresh = True
+            await self.async_request_refresh()
+            return
+        self.async_set_updated_data(self.client.plant)
@@ -0,0 +1,23 @@
+"""Diagnostics support for GivEnergy."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import GivEnergyUpdateCoordinator
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: GivEnergyUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "connected": coordinator.client.connected,
+        "last_full_refresh": coordinator.last_full_refresh.isoformat(),
+        "client": coordinator.client.stats(),
+    }
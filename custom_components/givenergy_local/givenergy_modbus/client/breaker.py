@@ -0,0 +1,160 @@
+"""Circuit breakers for register blocks that stop responding."""
+
+from enum import Enum
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+from custom_components.givenergy_local.givenergy_modbus.client.metrics import (
+    RequestShape,
+    request_shape,
+)
+from custom_components.givenergy_local.givenergy_modbus.pdu import (
+    TransparentRequest,
+)
+from custom_components.givenergy_local.givenergy_modbus.pdu.read_registers import (
+    ReadRegistersRequest,
+)
+
+_logger = logging.getLogger(__name__)
+
+
+class BreakerState(str, Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"  # requests are made as normal
+    OPEN = "open"  # requests are skipped
+    HALF_OPEN = "half_open"  # requests are made as probes
+
+
+class CircuitBreaker:
+    """Tracks whether a single block of registers is worth requesting."""
+
+    __slots__ = ("state", "failures", "opened_at", "reset_after", "trips")
+
+    def __init__(self, reset_after: float) -> None:
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.reset_after = reset_after
+        self.trips = 0
+
+
+class CircuitBreakers:
+    """Circuit breakers for polled register blocks, keyed by slave address, function and base register.
+
+    A battery that has gone away, or an optional block of holding registers that the inverter no longer answers,
+    would otherwise cost `timeout × (retries + 1)` on every refresh. After `failure_threshold` consecutive failed
+    exchanges a block's breaker opens and polls skip it. Once `reset_after` seconds have passed the breaker is
+    half-open: the next poll includes the block as a probe, which either closes the breaker again or re-opens it for
+    twice as long (up to `max_reset_after`).
+
+    Only reads are subject to breakers; writes are always sent.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_after: float = 30.0,
+        max_reset_after: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self.max_reset_after = max_reset_after
+        self.clock = clock
+        self._breakers: Dict[RequestShape, CircuitBreaker] = {}
+        self.skipped_requests = 0
+
+    def state(self, request: TransparentRequest) -> BreakerState:
+        """Current state of the breaker for a request's block."""
+        breaker = self._breakers.get(request_shape(request))
+        if breaker is None:
+            return BreakerState.CLOSED
+        if (
+            breaker.state is BreakerState.OPEN
+            and self.clock() - breaker.opened_at >= breaker.reset_after
+        ):
+            breaker.state = BreakerState.HALF_OPEN
+        return breaker.state
+
+    def failing(self, request: TransparentRequest) -> bool:
+        """Whether a request's block has failed since it last responded: its breaker is tripping, open or half-open."""
+        breaker = self._breakers.get(request_shape(request))
+        return breaker is not None and (
+            breaker.failures > 0 or breaker.state is not BreakerState.CLOSED
+        )
+
+    def allow(self, request: TransparentRequest) -> bool:
+        """Whether a request should be made."""
+        if not isinstance(request, ReadRegistersRequest):
+            return True
+        return self.state(request) is not BreakerState.OPEN
+
+    def filter(self, requests: list[TransparentRequest]) -> list[TransparentRequest]:
+        """Drop the requests whose breaker is open."""
+        allowed = []
+        for request in requests:
+            if self.allow(request):
+                allowed.append(request)
+            else:
+                self.skipped_requests += 1
+        return allowed
+
+    def on_success(self, request: TransparentRequest) -> None:
+        """Record that an exchange succeeded."""
+        breaker = self._breakers.get(request_shape(request))
+        if breaker is None:
+            return
+        if breaker.state is not BreakerState.CLOSED:
+            _logger.info("%s is responding again", request)
+        breaker.state = BreakerState.CLOSED
+        breaker.failures = 0
+        breaker.reset_after = self.reset_after
+
+    def on_failure(self, request: TransparentRequest) -> None:
+        """Record that an exchange failed, after any retries."""
+        if not isinstance(request, ReadRegistersRequest):
+            return
+        shape = request_shape(request)
+        breaker = self._breakers.get(shape)
+        if breaker is None:
+            breaker = self._breakers[shape] = CircuitBreaker(self.reset_after)
+        breaker.failures += 1
+        if breaker.state is BreakerState.HALF_OPEN:
+            breaker.reset_after = min(2 * breaker.reset_after, self.max_reset_after)
+        elif breaker.failures < self.failure_threshold:
+            return
+        if breaker.state is BreakerState.CLOSED:
+            breaker.trips += 1
+            _logger.warning(
+                "%s failed %d times in a row, skipping it for %.0fs",
+                request,
+                breaker.failures,
+                breaker.reset_after,
+            )
+        breaker.state = BreakerState.OPEN
+        breaker.opened_at = self.clock()
+
+    def stats(self) -> Dict[str, Any]:
+        """State of every breaker that has seen a failure, for diagnostics."""
+        now = self.clock()
+
+        def describe(breaker: CircuitBreaker) -> Dict[str, Any]:
+            retry_in: Optional[float] = None
+            if breaker.state is BreakerState.OPEN:
+                retry_in = max(0.0, breaker.opened_at + breaker.reset_after - now)
+            return {
+                "state": breaker.state.value,
+                "failures": breaker.failures,
+                "trips": breaker.trips,
+                "retry_in": retry_in,
+            }
+
+        return {
+            "skipped_requests": self.skipped_requests,
+            "blocks": {
+                f"0x{slave:02x}/{function}/{base}": describe(breaker)
+                for (slave, function, base), breaker in sorted(self._breakers.items())
+            },
+        }
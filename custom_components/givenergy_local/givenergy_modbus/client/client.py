@@ -1,12 +1,38 @@
 import asyncio
 import logging
 import socket
-from asyncio import Future, Queue, StreamReader, StreamWriter, Task
-from typing import Callable, Dict, List, Optional, Tuple
+from asyncio import FIRST_COMPLETED, Future, StreamReader, StreamWriter, Task
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
+from custom_components.givenergy_local.givenergy_modbus.client.breaker import (
+    CircuitBreakers,
+)
 from custom_components.givenergy_local.givenergy_modbus.client.commands import (
     CommandBuilder,
 )
+from custom_components.givenergy_local.givenergy_modbus.client.metrics import (
+    RequestMetrics,
+)
+from custom_components.givenergy_local.givenergy_modbus.client.pacing import (
+    TransmitPacer,
+)
+from custom_components.givenergy_local.givenergy_modbus.client.passive import (
+    PassiveRefreshTracker,
+)
+from custom_components.givenergy_local.givenergy_modbus.client.protocol import (
+    ClientProtocol,
+)
+from custom_components.givenergy_local.givenergy_modbus.client.scheduler import (
+    Priority,
+    TransmitScheduler,
+)
+from custom_components.givenergy_local.givenergy_modbus.client.subscription import (
+    RegisterSubscription,
+)
+from custom_components.givenergy_local.givenergy_modbus.client.timeouts import (
+    AdaptiveTimeouts,
+)
 from custom_components.givenergy_local.givenergy_modbus.exceptions import (
     CommunicationError,
     ExceptionBase,
@@ -18,65 +44,166 @@ from custom_components.givenergy_local.givenergy_modbus.framer import (
 )
 from custom_components.givenergy_local.givenergy_modbus.model.inverter import Model
 from custom_components.givenergy_local.givenergy_modbus.model.plant import Plant
+from custom_components.givenergy_local.givenergy_modbus.model.profile import (
+    PlantProfile,
+)
 from custom_components.givenergy_local.givenergy_modbus.pdu import (
     HeartbeatRequest,
+    ReadHoldingRegistersRequest,
+    ReadInputRegistersRequest,
     TransparentRequest,
     TransparentResponse,
+    WriteHoldingRegisterRequest,
     WriteHoldingRegisterResponse,
+    WriteHoldingRegistersRequest,
+    WriteHoldingRegistersResponse,
 )
 from custom_components.givenergy_local.givenergy_modbus.pdu.read_registers import (
+    ReadRegistersRequest,
     ReadRegistersResponse,
 )
 
 _logger = logging.getLogger(__name__)
 
 
+def _is_battery_read(request: TransparentRequest) -> bool:
+    """Whether a request reads from a battery BMS, which goes unanswered if there is no battery at that address."""
+    if not isinstance(request, ReadRegistersRequest):
+        return False
+    if 0x33 <= request.slave_address <= 0x37:
+        return True
+    # the first battery answers at the inverter's own address
+    return (
+        isinstance(request, ReadInputRegistersRequest)
+        and request.slave_address == 0x32
+        and request.base_register == 60
+    )
+
+
 class Client:
     """Asynchronous client utilising long-lived connections to a network device."""
 
     framer: Framer
-    expected_responses: "Dict[int, Future[TransparentResponse]]" = {}
+    expected_responses: "Dict[int, Future[TransparentResponse]]"
+    # shape hashes of responses whose attempt timed out, with the loop time until which a reply counts as late
+    expired_responses: Dict[int, float]
+    # how long after giving up on an attempt a reply to it is treated as late rather than unsolicited
+    late_response_window: float = 10.0
+    late_responses: int = 0
+    # unanswered multi-register writes in a row; batching is switched off after `max_batch_write_failures`
+    batch_write_failures: int = 0
+    max_batch_write_failures: int = 3
+    # identical requests share one exchange: keyed by encoded frame
+    in_flight_requests: "Dict[bytes, Task[TransparentResponse]]"
+    # frames waiting in tx_queue, with the send futures of any duplicates dropped in their favour
+    queued_frames: "Dict[bytes, List[Future]]"
+    # send futures of request frames that were transmitted and are awaiting a response, at most `max_in_flight`
+    in_flight_frames: "Set[Future]"
+    coalesced_requests: int = 0
+    dropped_duplicate_frames: int = 0
+    metrics: RequestMetrics
+    # outcomes of applying responses to the plant
+    plant_updates: int = 0
+    plant_updates_ignored: int = 0
+    registers_changed: int = 0
     plant: Plant
     command_builder: CommandBuilder
+    pacer: TransmitPacer
+    # learned response timeouts; None to always use the timeouts callers ask for
+    timeouts: Optional[AdaptiveTimeouts]
+    passive_refreshes: PassiveRefreshTracker
+    breakers: CircuitBreakers
+    subscriptions: List[RegisterSubscription]
     # refresh_count: int = 0
     # debug_frames: Dict[str, Queue]
     connected = False
     reader: StreamReader
-    writer: StreamWriter
+    writer: "StreamWriter | ClientProtocol"
     network_consumer_task: Task
     network_producer_task: Task
 
-    tx_queue: "Queue[Tuple[bytes, Optional[Future]]]"
+    tx_queue: "TransmitScheduler[Tuple[bytes, Optional[Future]]]"
 
-    def __init__(self, host: str, port: int, connect_timeout: float = 2.0) -> None:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        connect_timeout: float = 2.0,
+        use_protocol: bool = False,
+        batch_writes: bool = True,
+        adaptive_timeouts: bool = True,
+        max_in_flight: int = 4,
+    ) -> None:
         self.host = host
         self.port = port
         self.connect_timeout = connect_timeout
+        self.use_protocol = use_protocol
+        # merge writes to consecutive registers into one frame; switched off until the next connection if the
+        # inverter rejects them
+        self.batch_writes = batch_writes
+        self._batch_writes_requested = batch_writes
         self.framer = ClientFramer()
         self.plant = Plant()
         self.command_builder = CommandBuilder()
-        self.tx_queue = Queue(maxsize=20)
+        self.pacer = TransmitPacer()
+        # the adapter-wide RTT estimate is learned once, by the pacer, and timeouts fall back on it
+        self.timeouts = (
+            AdaptiveTimeouts(adapter=self.pacer.rtt) if adaptive_timeouts else None
+        )
+        self.metrics = RequestMetrics()
+        self.passive_refreshes = PassiveRefreshTracker()
+        self.breakers = CircuitBreakers()
+        self.subscriptions = []
+        self.expected_responses = {}
+        self.expired_responses = {}
+        self.in_flight_requests = {}
+        self.queued_frames = {}
+        self.max_in_flight = max_in_flight
+        self.in_flight_frames = set()
+        self.tx_queue = TransmitScheduler(maxsize=20, max_in_flight=max_in_flight)
         # self.debug_frames = {
         #     'all': Queue(maxsize=1000),
         #     'error': Queue(maxsize=1000),
         # }
 
     async def connect(self) -> None:
-        """Connect to the remote host and start background tasks."""
+        """Connect to the remote host and start background tasks.
+
+        By default, incoming data is read through an asyncio stream by a consumer task. With `use_protocol` set, a
+        `ClientProtocol` receives data straight into the framer's buffer instead and dispatches decoded messages from
+        the event loop callback, without a consumer task.
+        """
         try:
-            connection = asyncio.open_connection(
-                host=self.host, port=self.port, flags=socket.TCP_NODELAY
-            )
-            self.reader, self.writer = await asyncio.wait_for(
-                connection, timeout=self.connect_timeout
-            )
+            if self.use_protocol:
+                connection = asyncio.get_running_loop().create_connection(
+                    lambda: ClientProtocol(self),
+                    host=self.host,
+                    port=self.port,
+                    flags=socket.TCP_NODELAY,
+                )
+                _, self.writer = await asyncio.wait_for(
+                    connection, timeout=self.connect_timeout
+                )
+            else:
+                connection = asyncio.open_connection(
+                    host=self.host, port=self.port, flags=socket.TCP_NODELAY
+                )
+                self.reader, self.writer = await asyncio.wait_for(
+                    connection, timeout=self.connect_timeout
+                )
         except OSError as e:
             raise CommunicationError(
                 f"Error connecting to {self.host}:{self.port}"
             ) from e
-        self.network_consumer_task = asyncio.create_task(
-            self._task_network_consumer(), name="network_consumer"
-        )
+        self.in_flight_frames = set()
+        self.tx_queue.reset_window()
+        # the adapter or firmware behind it may have changed
+        self.batch_writes = self._batch_writes_requested
+        self.batch_write_failures = 0
+        if not self.use_protocol:
+            self.network_consumer_task = asyncio.create_task(
+                self._task_network_consumer(), name="network_consumer"
+            )
         self.network_producer_task = asyncio.create_task(
             self._task_network_producer(), name="network_producer"
         )
@@ -124,12 +251,18 @@ class Client:
         for hr in possible_additional_holding_registers:
             try:
                 reqs = self.command_builder.refresh_additional_holding_registers(hr)
-                await self.execute(reqs, timeout=timeout, retries=retries)
+                await self.execute(
+                    reqs,
+                    timeout=timeout,
+                    retries=retries,
+                    priority=Priority.BACKGROUND,
+                )
                 _logger.info(
                     "Detected additional holding register support (base_register=%d)",
                     hr,
                 )
-                self.plant.additional_holding_registers.append(hr)
+                if hr not in self.plant.additional_holding_registers:
+                    self.plant.additional_holding_registers.append(hr)
             except asyncio.TimeoutError:
                 _logger.debug(
                     "Inverter did not respond to holding register query (base_register=%d)",
@@ -139,6 +272,44 @@ class Client:
             "Finished checking whether your inverter supports additonal features"
         )
 
+    async def load_profile(
+        self, profile: PlantProfile, timeout: float = 1.0, retries: int = 3
+    ) -> bool:
+        """Adopt the capabilities in a previously detected profile, instead of running `detect_plant`.
+
+        The profile is only adopted if it belongs to the connected inverter, which is checked with a single request
+        for the first block of holding registers. Returns whether the profile was adopted."""
+        command_builder = CommandBuilder(Model(profile.model))
+        response = await self.send_request_and_await_response(
+            ReadHoldingRegistersRequest(
+                slave_address=command_builder.main_slave_address,
+                base_register=0,
+                register_count=60,
+            ),
+            timeout=timeout,
+            retries=retries,
+        )
+        if response.inverter_serial_number != profile.inverter_serial_number:
+            _logger.info(
+                "Ignoring profile for %s, connected to %s",
+                profile.inverter_serial_number,
+                response.inverter_serial_number,
+            )
+            return False
+        self.command_builder = command_builder
+        self.plant.number_batteries = profile.number_batteries
+        self.plant.additional_holding_registers = list(
+            profile.additional_holding_registers
+        )
+        _logger.info(
+            "Using profile for %s: model=%s, %d %s",
+            profile.inverter_serial_number,
+            Model(profile.model).name,
+            profile.number_batteries,
+            "battery" if profile.number_batteries == 1 else "batteries",
+        )
+        return True
+
     async def close(self) -> None:
         """Disconnect from the remote host and clean up tasks and queues."""
         if not self.connected:
@@ -149,10 +320,17 @@ class Client:
         self.connected = False
 
         if self.tx_queue:
-            while not self.tx_queue.empty():
-                _, future = self.tx_queue.get_nowait()
+            for _, future in self.tx_queue.clear():
                 if future:
                     future.cancel()
+        for waiters in self.queued_frames.values():
+            for future in waiters:
+                future.cancel()
+        self.queued_frames = {}
+
+        for task in self.in_flight_requests.values():
+            task.cancel()
+        self.in_flight_requests = {}
 
         if self.network_producer_task:
             self.network_producer_task.cancel()
@@ -162,7 +340,7 @@ class Client:
             await self.writer.wait_closed()
             del self.writer
 
-        if self.network_producer_task:
+        if hasattr(self, "network_consumer_task") and self.network_consumer_task:
             self.network_consumer_task.cancel()
 
         if hasattr(self, "reader") and self.reader:
@@ -171,6 +349,7 @@ class Client:
             del self.reader
 
         self.expected_responses = {}
+        self.expired_responses = {}
         # self.debug_frames = {
         #     'all': Queue(maxsize=1000),
         #     'error': Queue(maxsize=1000),
@@ -182,12 +361,23 @@ class Client:
         max_batteries: int = 5,
         timeout: float = 1.0,
         retries: int = 0,
+        passive_max_age: Optional[float] = None,
     ) -> Plant:
-        """Refresh data about the Plant."""
-        reqs = self.command_builder.refresh_plant_data(
-            full_refresh, self.plant.number_batteries, max_batteries
+        """Refresh data about the Plant.
+
+        With `passive_max_age` set, blocks of registers that cloud or app traffic refreshed within that many seconds
+        are not requested again. Blocks that have stopped responding are skipped while their circuit breaker is
+        open."""
+        reqs = self.breakers.filter(
+            self.command_builder.refresh_plant_data(
+                full_refresh, self.plant.number_batteries, max_batteries
+            )
+        )
+        if passive_max_age is not None:
+            reqs = self.passive_refreshes.filter(reqs, passive_max_age)
+        await self.execute(
+            reqs, timeout=timeout, retries=retries, priority=Priority.BACKGROUND
         )
-        await self.execute(reqs, timeout=timeout, retries=retries)
         return self.plant
 
     async def watch_plant(
@@ -198,8 +388,12 @@ class Client:
         timeout: float = 1.0,
         retries: int = 0,
         passive: bool = False,
+        passive_max_age: Optional[float] = None,
     ):
-        """Refresh data about the Plant."""
+        """Refresh data about the Plant.
+
+        With `passive` set, only listen to responses to cloud and app traffic and never poll. Otherwise, with
+        `passive_max_age` set, only poll for blocks of registers that such traffic has not refreshed recently."""
         await self.connect()
         self.plant.detect_batteries()
         while True:
@@ -207,13 +401,56 @@ class Client:
                 handler()
             await asyncio.sleep(refresh_period)
             if not passive:
-                reqs = self.command_builder.refresh_plant_data(
-                    False, self.plant.number_batteries
+                reqs = self.breakers.filter(
+                    self.command_builder.refresh_plant_data(
+                        False, self.plant.number_batteries
+                    )
                 )
+                if passive_max_age is not None:
+                    reqs = self.passive_refreshes.filter(reqs, passive_max_age)
                 await self.execute(
-                    reqs, timeout=timeout, retries=retries, return_exceptions=True
+                    reqs,
+                    timeout=timeout,
+                    retries=retries,
+                    return_exceptions=True,
+                    priority=Priority.BACKGROUND,
                 )
 
+    def subscribe(
+        self, maxsize: int = 100, slave_addresses: Optional[Iterable[int]] = None
+    ) -> RegisterSubscription:
+        """Subscribe to the registers changed by each response, as it is applied to the plant.
+
+        Subscriptions outlive reconnections, and only end when closed. Restrict them to some devices with
+        `slave_addresses`."""
+        subscription = RegisterSubscription(
+            self.subscriptions.remove, maxsize, slave_addresses
+        )
+        self.subscriptions.append(subscription)
+        return subscription
+
+    async def write(
+        self,
+        requests: list[TransparentRequest],
+        timeout: float,
+        retries: int,
+        readback: bool = True,
+    ) -> None:
+        """Perform writes, then read back the blocks of holding registers they touched.
+
+        Each write response updates the plant as soon as it arrives. The readback confirms what the inverter
+        actually stored, without a full refresh of the plant. Failing to read back (e.g. because the inverter is
+        rebooting) is not an error."""
+        await self.execute(requests, timeout=timeout, retries=retries)
+        if readback:
+            await self.execute(
+                self.command_builder.refresh_written_registers(requests),
+                timeout=timeout,
+                retries=retries,
+                return_exceptions=True,
+                priority=Priority.INTERACTIVE,
+            )
+
     async def one_shot_command(
         self, requests: list[TransparentRequest], timeout=1.5, retries=0
     ) -> None:
@@ -226,54 +463,134 @@ class Client:
         while hasattr(self, "reader") and self.reader and not self.reader.at_eof():
             frame = await self.reader.read(300)
             # await self.debug_frames['all'].put(frame)
-            async for message in self.framer.decode(frame):
-                if isinstance(message, ExceptionBase):
-                    self._log_error_response(message)
-                    continue
-                else:
-                    _logger.debug("Processing %s", message)
-
-                if isinstance(message, HeartbeatRequest):
-                    _logger.debug("Responding to HeartbeatRequest")
-                    await self.tx_queue.put(
-                        (message.expected_response().encode(), None)
-                    )
-                    continue
-                if not isinstance(message, TransparentResponse):
-                    _logger.warning(
-                        "Received unexpected message type for a client: %s", message
-                    )
-                    continue
-                if isinstance(message, WriteHoldingRegisterResponse):
-                    if message.error:
-                        _logger.warning("%s", message)
-                    else:
-                        _logger.info("%s", message)
-
-                future = self.expected_responses.get(message.shape_hash())
-
-                if future and not future.done():
-                    future.set_result(message)
-                # try:
-                self.plant.update(message)
-                # except RegisterCacheUpdateFailed as e:
-                #     # await self.debug_frames['error'].put(frame)
-                #     _logger.debug(f'Ignoring {message}: {e}')
+            for message in self.framer.decode_frames(frame):
+                self.dispatch(message)
         _logger.debug(
             "network_consumer reader at EOF, cannot continue, closing connection"
         )
         await self.close()
 
-    async def _task_network_producer(self, tx_message_wait: float = 0.25):
-        """Producer loop to transmit queued frames with an appropriate delay."""
+    def dispatch(
+        self, message: "TransparentResponse | HeartbeatRequest | ExceptionBase"
+    ) -> None:
+        """Handle a single decoded incoming message."""
+        if isinstance(message, ExceptionBase):
+            self._log_error_response(message)
+            return
+        else:
+            _logger.debug("Processing %s", message)
+
+        if isinstance(message, HeartbeatRequest):
+            _logger.debug("Responding to HeartbeatRequest")
+            heartbeat_response = (message.expected_response().encode(), None)
+            if self._coalesce_queued_frame(*heartbeat_response):
+                return
+            self.tx_queue.put_nowait(heartbeat_response, Priority.HEARTBEAT)
+            return
+        if not isinstance(message, TransparentResponse):
+            _logger.warning(
+                "Received unexpected message type for a client: %s", message
+            )
+            return
+        if isinstance(
+            message, (WriteHoldingRegisterResponse, WriteHoldingRegistersResponse)
+        ):
+            if message.error:
+                _logger.warning("%s", message)
+            else:
+                _logger.info("%s", message)
+
+        future = self.expected_responses.get(message.shape_hash())
+
+        if future and not future.done():
+            future.set_result(message)
+        elif self._is_late_response(message):
+            # the reply to an attempt already given up on, not someone else's traffic
+            self.late_responses += 1
+            _logger.debug("Late response to an expired request: %s", message)
+        elif isinstance(message, ReadRegistersResponse):
+            # nobody is waiting for this: most likely cloud or mobile app traffic
+            self.passive_refreshes.record(message)
+        # try:
+        self._update_plant(message)
+        # except RegisterCacheUpdateFailed as e:
+        #     # await self.debug_frames['error'].put(frame)
+        #     _logger.debug(f'Ignoring {message}: {e}')
+
+    def _is_late_response(self, message: TransparentResponse) -> bool:
+        shape_hash = message.shape_hash()
+        expires_at = self.expired_responses.get(shape_hash)
+        if expires_at is None:
+            return False
+        if expires_at < asyncio.get_event_loop().time():
+            del self.expired_responses[shape_hash]
+            return False
+        return True
+
+    def _update_plant(self, message: TransparentResponse) -> None:
+        """Apply a response to the plant and let subscribers know what changed."""
+        delta = self.plant.update(message)
+        if delta is None:
+            self.plant_updates_ignored += 1
+            return
+        self.plant_updates += 1
+        if delta.changes:
+            self.registers_changed += len(delta.changes)
+            for subscription in self.subscriptions:
+                subscription.publish(delta)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of metrics and counters across the client, e.g. for diagnostics."""
+        return {
+            "requests": self.metrics.snapshot(),
+            "coalesced_requests": self.coalesced_requests,
+            "dropped_duplicate_frames": self.dropped_duplicate_frames,
+            "late_responses": self.late_responses,
+            "plant_updates": self.plant_updates,
+            "plant_updates_ignored": self.plant_updates_ignored,
+            "registers_changed": self.registers_changed,
+            "framer": self.framer.stats(),
+            "pacer": self.pacer.stats(),
+            "timeouts": self.timeouts.stats() if self.timeouts else None,
+            "tx_queue": {
+                **self.tx_queue.qsizes(),
+                "promoted": self.tx_queue.promoted,
+                "in_flight": len(self.in_flight_frames),
+                "max_in_flight": self.max_in_flight,
+            },
+            "passive": self.passive_refreshes.stats(),
+            "breakers": self.breakers.stats(),
+        }
+
+    async def _task_network_producer(self):
+        """Producer loop to transmit queued frames with an appropriate delay.
+
+        The delay after each request frame is the current gap learned by `self.pacer`; heartbeat responses are not
+        followed by one, since the adapter asked for them rather than having to keep up with them. Request frames are only taken off the
+        queue while fewer than `max_in_flight` requests await a response, so heartbeat responses (which carry no send
+        future and take no slot) are never stuck behind one waiting for the window."""
         while hasattr(self, "writer") and self.writer and not self.writer.is_closing():
             message, future = await self.tx_queue.get()
+            waiters = [
+                f
+                for f in (future, *self.queued_frames.pop(message, ()))
+                if f and not f.done()
+            ]
+            if future is not None and not waiters:
+                # everyone waiting for this frame gave up while it was queued
+                self.tx_queue.release()
+                self.tx_queue.task_done()
+                continue
             self.writer.write(message)
             await self.writer.drain()
             self.tx_queue.task_done()
-            if future:
-                future.set_result(True)
-            await asyncio.sleep(tx_message_wait)
+            if waiters:
+                # the slot is held on behalf of the first waiter, and freed when its attempt ends
+                self.in_flight_frames.add(waiters[0])
+            for f in waiters:
+                f.set_result(True)
+            if future is not None:
+                await asyncio.sleep(self.pacer.gap)
         _logger.debug(
             "network_producer writer is closing, cannot continue, closing connection"
         )
@@ -299,31 +616,196 @@ class Client:
         timeout: float,
         retries: int,
         return_exceptions: bool = False,
+        priority: Optional[Priority] = None,
     ) -> "Future[List[TransparentResponse | BaseException]]":
-        """Helper to perform multiple requests in bulk."""
+        """Helper to perform multiple requests in bulk.
+
+        With `batch_writes` enabled, writes to consecutive registers are merged first, so there is one result per
+        frame sent rather than per request. However many requests there are, at most `max_in_flight` await a response
+        at once, and each one's timeout only runs from when its frame is sent. Getting every frame sent shares one
+        deadline, sized for the whole batch going through the window (see `send_deadline`)."""
+        if self.batch_writes:
+            requests = CommandBuilder.batch_writes(requests)
+        deadline = self.send_deadline(len(requests), timeout, retries)
         return asyncio.gather(
             *[
-                self.send_request_and_await_response(
-                    m, timeout=timeout, retries=retries
+                self._send_batched_write(m, timeout, retries, priority, deadline)
+                if isinstance(m, WriteHoldingRegistersRequest)
+                else self.send_request_and_await_response(
+                    m,
+                    timeout=timeout,
+                    retries=retries,
+                    priority=priority,
+                    deadline=deadline,
                 )
                 for m in requests
             ],
             return_exceptions=return_exceptions,
         )
 
+    def send_deadline(self, count: int, timeout: float, retries: int) -> float:
+        """Event loop time by which `count` requests should all have been sent, or their callers give up.
+
+        Allows for every in-flight window's worth of requests using up all their attempts, plus the longest pacing gap
+        after each frame (the gap in force can still grow, or the producer already be sleeping off a longer one)."""
+        rounds = -(-max(count, 1) // max(self.max_in_flight, 1))
+        return asyncio.get_running_loop().time() + (retries + 1) * (
+            rounds * timeout + count * self.pacer.max_gap
+        )
+
+    async def _send_batched_write(
+        self,
+        request: WriteHoldingRegistersRequest,
+        timeout: float,
+        retries: int,
+        priority: Optional[Priority],
+        deadline: Optional[float] = None,
+    ) -> TransparentResponse:
+        """Send merged writes as one frame, falling back to single writes if the inverter does not accept it.
+
+        Batching is switched off for the rest of the connection as soon as the inverter answers a merged write with
+        an error, or once `max_batch_write_failures` in a row go unanswered; a single lost response only falls back
+        for this write. Returns the response to the last register written."""
+        if self.batch_writes:
+            try:
+                response = await self.send_request_and_await_response(
+                    request,
+                    timeout=timeout,
+                    retries=0,
+                    priority=priority,
+                    deadline=deadline,
+                )
+                self.batch_write_failures = 0
+                return response
+            except asyncio.TimeoutError:
+                self.batch_write_failures += 1
+                if self._error_response_to(request):
+                    _logger.warning(
+                        "Inverter rejected writing multiple registers, writing registers individually from now on"
+                    )
+                    self.batch_writes = False
+                elif self.batch_write_failures >= self.max_batch_write_failures:
+                    _logger.warning(
+                        "No response to writing multiple registers %d times in a row, writing registers "
+                        "individually from now on",
+                        self.batch_write_failures,
+                    )
+                    self.batch_writes = False
+                else:
+                    _logger.debug(
+                        "No response to writing multiple registers, writing them individually this time"
+                    )
+        response = None
+        for single in request.split():
+            # one after the other, so each gets the time to send a request of its own
+            response = await self.send_request_and_await_response(
+                single, timeout=timeout, retries=retries, priority=priority
+            )
+        assert response is not None
+        return response
+
+    def _error_response_to(self, request: TransparentRequest) -> bool:
+        """Whether the last response received for a request (that is, of its expected response shape) was an error."""
+        future = self.expected_responses.get(request.expected_response().shape_hash())
+        return (
+            future is not None
+            and future.done()
+            and not future.cancelled()
+            and future.result().error
+        )
+
     async def send_request_and_await_response(
-        self, request: TransparentRequest, timeout: float, retries: int
+        self,
+        request: TransparentRequest,
+        timeout: float,
+        retries: int,
+        priority: Optional[Priority] = None,
+        deadline: Optional[float] = None,
     ) -> TransparentResponse:
-        """Send a request to the remote, await and return the response."""
+        """Send a request to the remote, await and return the response.
+
+        The request is transmitted at the given priority: by default, `Priority.WRITE` for writes and
+        `Priority.INTERACTIVE` for anything else. Periodic polling should use `Priority.BACKGROUND` so it cannot delay
+        writes a user is waiting on.
+
+        If an identical request is already in flight, no new frame is sent: this call awaits the outcome of the
+        outstanding exchange (including its retries) instead.
+
+        With adaptive timeouts enabled, `timeout` only applies until response times from the adapter have been
+        measured: each attempt then waits as long as the RTT observed for the request's slave address warrants, backing
+        off after every unanswered attempt, and retries are spaced out by a jittered exponential delay.
+
+        `deadline` (in event loop time, defaulting to `send_deadline()` for one request) bounds how long the request
+        may wait in the transmit queue and for an in-flight slot: `asyncio.TimeoutError` is raised if a frame has not
+        been sent by then.
+        """
+        if priority is None:
+            priority = (
+                Priority.WRITE
+                if isinstance(
+                    request, (WriteHoldingRegisterRequest, WriteHoldingRegistersRequest)
+                )
+                else Priority.INTERACTIVE
+            )
+        if deadline is None:
+            deadline = self.send_deadline(1, timeout, retries)
         raw_frame = request.encode()
-
+        in_flight = self.in_flight_requests.get(raw_frame)
+        if in_flight is None or in_flight.done():
+            in_flight = asyncio.get_event_loop().create_task(
+                self._send_request_and_await_response(
+                    request, raw_frame, timeout, retries, priority, deadline
+                )
+            )
+            self.in_flight_requests[raw_frame] = in_flight
+            in_flight.add_done_callback(partial(self._request_done, raw_frame))
+        else:
+            self.coalesced_requests += 1
+            _logger.debug("Coalescing with identical in-flight request: %s", request)
+        return await asyncio.shield(in_flight)
+
+    def _request_done(self, raw_frame: bytes, task: "Task[TransparentResponse]"):
+        if self.in_flight_requests.get(raw_frame) is task:
+            del self.in_flight_requests[raw_frame]
+        if not task.cancelled():
+            # mark any exception as retrieved: all interested callers have already seen it via shield()
+            task.exception()
+
+    def _coalesce_queued_frame(self, frame: bytes, future: Optional[Future]) -> bool:
+        """Attach to an identical frame still waiting in the transmit queue, if there is one.
+
+        Returns whether the frame was coalesced, in which case it must not be queued again: `future` gets resolved
+        when the queued copy is sent."""
+        waiters = self.queued_frames.get(frame)
+        if waiters is None:
+            self.queued_frames[frame] = []
+            return False
+        if future:
+            waiters.append(future)
+        self.dropped_duplicate_frames += 1
+        _logger.debug("Dropping duplicate of queued frame")
+        return True
+
+    async def _send_request_and_await_response(
+        self,
+        request: TransparentRequest,
+        raw_frame: bytes,
+        timeout: float,
+        retries: int,
+        priority: Priority,
+        deadline: float,
+    ) -> TransparentResponse:
         # mark the expected response
         expected_response = request.expected_response()
         expected_shape_hash = expected_response.shape_hash()
+        started_at = asyncio.get_event_loop().time()
+        self.metrics.requests += 1
 
         tries = 0
         while tries <= retries:
             tries += 1
+            if tries > 1:
+                self.metrics.retries += 1
             existing_response_future = self.expected_responses.get(expected_shape_hash)
             if existing_response_future and not existing_response_future.done():
                 _logger.debug(
@@ -336,25 +818,70 @@ class Client:
             self.expected_responses[expected_shape_hash] = response_future
 
             frame_sent = asyncio.get_event_loop().create_future()
-            await self.tx_queue.put((raw_frame, frame_sent))
-            await asyncio.wait_for(
-                frame_sent, timeout=self.tx_queue.qsize() + 1
-            )  # this should only happen if the producer task is stuck
-
-            _logger.debug("Request sent (attempt %d): %s", tries, request)
-
+            if not self._coalesce_queued_frame(raw_frame, frame_sent):
+                await self.tx_queue.put((raw_frame, frame_sent), priority)
             try:
-                await asyncio.wait_for(response_future, timeout=timeout)
-                if response_future.done():
-                    response = response_future.result()
-                    if tries > 1:
-                        _logger.debug("Received %s after %d attempts", response, tries)
-                    if response.error:
-                        _logger.error("Received error response, retrying: %s", response)
-                    else:
-                        return response
-            except asyncio.TimeoutError:
-                pass
+                # the response timeout only starts once the frame has left the transmit queue
+                try:
+                    await self._await_frame_sent(frame_sent, deadline)
+                except asyncio.TimeoutError:
+                    _logger.warning("Gave up waiting to send %s", request)
+                    self.metrics.failures += 1
+                    raise
+                sent_at = asyncio.get_event_loop().time()
+
+                _logger.debug("Request sent (attempt %d): %s", tries, request)
+
+                attempt_timeout = (
+                    self.timeouts.timeout(request.slave_address, timeout)
+                    if self.timeouts
+                    else timeout
+                )
+                try:
+                    await asyncio.wait_for(response_future, timeout=attempt_timeout)
+                    if response_future.done():
+                        response = response_future.result()
+                        if tries > 1:
+                            _logger.debug(
+                                "Received %s after %d attempts", response, tries
+                            )
+                        if response.error:
+                            if self._blames_pacing(request):
+                                self.pacer.on_error()
+                            self.metrics.error_responses += 1
+                            _logger.error(
+                                "Received error response, retrying: %s", response
+                            )
+                        else:
+                            now = asyncio.get_event_loop().time()
+                            # after a retry, the response could be to either attempt (Karn's algorithm)
+                            self.pacer.on_response(
+                                now - sent_at,
+                                ambiguous=tries > 1,
+                                judge_latency=not _is_battery_read(request),
+                            )
+                            if self.timeouts and tries == 1:
+                                self.timeouts.on_response(
+                                    request.slave_address, now - sent_at
+                                )
+                            self.metrics.observe(request, now - started_at)
+                            self.breakers.on_success(request)
+                            if isinstance(response, WriteHoldingRegistersResponse):
+                                # the response only echoes the range, so record what the request wrote
+                                response.register_values = list(request.register_values)
+                                self._update_plant(response)
+                            return response
+                except asyncio.TimeoutError:
+                    self.expired_responses[expected_shape_hash] = (
+                        asyncio.get_event_loop().time() + self.late_response_window
+                    )
+                    if self._blames_pacing(request):
+                        self.pacer.on_timeout()
+                    self.metrics.timeouts += 1
+                    if self.timeouts:
+                        self.timeouts.on_timeout(request.slave_address)
+            finally:
+                self._release_in_flight_slot(frame_sent)
 
             if tries <= retries:
                 _logger.debug(
@@ -363,15 +890,55 @@ class Client:
                     tries,
                     retries,
                 )
+                if self.timeouts:
+                    await asyncio.sleep(self.timeouts.retry_delay(tries))
 
         _logger.warning(
-            "Timeout awaiting %s after %d tries at %ds, giving up",
+            "Timeout awaiting %s after %d tries at %.1fs, giving up",
             expected_response,
             tries,
-            timeout,
+            attempt_timeout,
         )
+        self.metrics.failures += 1
+        self.breakers.on_failure(request)
         raise asyncio.TimeoutError()
 
+    def _blames_pacing(self, request: TransparentRequest) -> bool:
+        """Whether a failed attempt suggests frames are being sent too closely, so the pacer should back off.
+
+        Reads from battery BMSs time out whenever a battery is missing, and a block that has already failed since it
+        last responded (whose breaker is tripping, open or half-open) is most likely just not answering. Backing off
+        for either would slow every other request down for nothing."""
+        return not _is_battery_read(request) and not self.breakers.failing(request)
+
+    async def _await_frame_sent(self, frame_sent: Future, deadline: float) -> None:
+        """Wait until the producer has transmitted a frame, however long the queue and in-flight window make that.
+
+        Raises `asyncio.TimeoutError` if the frame is still waiting at `deadline`."""
+        producer = getattr(self, "network_producer_task", None)
+        if not frame_sent.done():
+            remaining = max(0.0, deadline - asyncio.get_running_loop().time())
+            waitables = {frame_sent} if producer is None else {frame_sent, producer}
+            await asyncio.wait(
+                waitables, timeout=remaining, return_when=FIRST_COMPLETED
+            )
+            if not frame_sent.done():
+                if producer is not None and producer.done():
+                    raise CommunicationError(
+                        "Transmit loop stopped before request was sent"
+                    )
+                raise asyncio.TimeoutError()
+        await frame_sent
+
+    def _release_in_flight_slot(self, frame_sent: Future) -> None:
+        """Free the in-flight window slot a frame holds, once its attempt is answered or given up on."""
+        if not frame_sent.done():
+            # tell the producer not to bother sending it
+            frame_sent.cancel()
+        elif frame_sent in self.in_flight_frames:
+            self.in_flight_frames.discard(frame_sent)
+            self.tx_queue.release()
+
     def _log_error_response(self, exception: ExceptionBase):
         """Log error responses in a helpful way to aid debugging."""
         if isinstance(exception, InvalidPduState):
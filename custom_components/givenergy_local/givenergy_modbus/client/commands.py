@@ -16,6 +16,7 @@ from custom_components.givenergy_local.givenergy_modbus.pdu import (
     ReadInputRegistersRequest,
     TransparentRequest,
     WriteHoldingRegisterRequest,
+    WriteHoldingRegistersRequest,
 )
 
 
@@ -133,6 +134,61 @@ class CommandBuilder:
 
         return requests
 
+    def refresh_written_registers(
+        self, requests: list[TransparentRequest]
+    ) -> list[TransparentRequest]:
+        """Requests to read back only the blocks of holding registers that some writes touched."""
+        registers: set[int] = set()
+        for request in requests:
+            if isinstance(request, WriteHoldingRegisterRequest):
+                registers.add(request.register)
+            elif isinstance(request, WriteHoldingRegistersRequest):
+                registers.update(request.to_dict())
+        return [
+            ReadHoldingRegistersRequest(
+                slave_address=self.main_slave_address,
+                base_register=base_register,
+                register_count=60,
+            )
+            for base_register in sorted({r - r % 60 for r in registers})
+        ]
+
+    @staticmethod
+    def batch_writes(requests: list[TransparentRequest]) -> list[TransparentRequest]:
+        """Merge runs of single register writes into multiple register writes.
+
+        Only writes that follow each other, to consecutive registers of the same device, are merged, so requests are
+        still carried out in the order given."""
+        ret: list[TransparentRequest] = []
+        run: list[WriteHoldingRegisterRequest] = []
+
+        def flush():
+            if len(run) > 1:
+                ret.append(
+                    WriteHoldingRegistersRequest(
+                        base_register=run[0].register,
+                        register_values=[r.value for r in run],
+                        slave_address=run[0].slave_address,
+                    )
+                )
+            else:
+                ret.extend(run)
+            run.clear()
+
+        for request in requests:
+            if not isinstance(request, WriteHoldingRegisterRequest):
+                flush()
+                ret.append(request)
+                continue
+            if run and (
+                request.slave_address != run[-1].slave_address
+                or request.register != run[-1].register + 1
+            ):
+                flush()
+            run.append(request)
+        flush()
+        return ret
+
     @staticmethod
     def disable_charge_target() -> list[TransparentRequest]:
         """Removes SOC limit and target 100% charging."""
@@ -0,0 +1,100 @@
+"""Cheap always-on metrics for requests made by a client."""
+
+from bisect import bisect_left
+import math
+from typing import Any, Dict, Tuple
+
+from custom_components.givenergy_local.givenergy_modbus.pdu import TransparentRequest
+
+# upper bounds (in seconds) of the latency histogram buckets; the last catches everything slower
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.0,
+    5.0,
+    10.0,
+    math.inf,
+)
+
+# (slave address, transparent function code, base register)
+RequestShape = Tuple[int, int, int]
+
+
+def request_shape(request: TransparentRequest) -> RequestShape:
+    """The key a request's metrics are recorded under."""
+    base_register = getattr(request, "base_register", None)
+    if base_register is None:
+        base_register = getattr(request, "register", 0)
+    return (request.slave_address, request.transparent_function_code, base_register)
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of latencies, in the style of a Prometheus histogram (but not cumulative)."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "buckets": {
+                f"le_{bound:g}": n for bound, n in zip(LATENCY_BUCKETS, self.counts)
+            },
+            "count": self.count,
+            "sum": self.total,
+            "max": self.max,
+        }
+
+
+class RequestMetrics:
+    """Latency histograms per request shape, and counters of how requests fared.
+
+    Latency covers a whole exchange as the caller sees it: from queueing the request, through any retries, to the
+    response being received.
+    """
+
+    def __init__(self) -> None:
+        self.latency: Dict[RequestShape, LatencyHistogram] = {}
+        self.requests = 0
+        self.responses = 0
+        self.retries = 0
+        self.timeouts = 0
+        self.error_responses = 0
+        self.failures = 0
+
+    def observe(self, request: TransparentRequest, seconds: float) -> None:
+        """Record a request that got a valid response after `seconds`."""
+        shape = request_shape(request)
+        histogram = self.latency.get(shape)
+        if histogram is None:
+            histogram = self.latency[shape] = LatencyHistogram()
+        histogram.observe(seconds)
+        self.responses += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "responses": self.responses,
+            "retries": self.retries,
+            "timeouts": self.timeouts,
+            "error_responses": self.error_responses,
+            "failures": self.failures,
+            "latency": {
+                f"0x{slave:02x}/{function}/{base}": histogram.snapshot()
+                for (slave, function, base), histogram in sorted(self.latency.items())
+            },
+        }
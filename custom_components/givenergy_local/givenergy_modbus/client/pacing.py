@@ -0,0 +1,150 @@
+"""Adaptive pacing of transmitted frames."""
+
+import logging
+from typing import Any, Optional
+
+from custom_components.givenergy_local.givenergy_modbus.client.timeouts import (
+    RttEstimator,
+)
+
+_logger = logging.getLogger(__name__)
+
+
+class TransmitPacer:
+    """Learns how closely frames can be sent to a data adapter without losing responses.
+
+    Data adapters are slow and drop requests that arrive too quickly, so the client waits for a gap after every
+    frame it transmits. Rather than a fixed gap, this tracks the outcome of every request: each healthy response
+    tightens the gap a little, while every timeout or error response backs it off sharply and raises a learned floor
+    just above the gap that caused the loss. The floor decays slowly back towards `min_gap` as responses stay healthy,
+    so the pacer keeps probing for a faster safe rate.
+
+    Response latency is part of the decision too, since an adapter that is queueing frames answers more and more
+    slowly well before it starts dropping them. Latency is compared against a base RTT, the fastest recent response:
+    a response slower than `latency_ratio` times the base RTT (plus `latency_slack`, to ride out jitter) holds the gap
+    where it is instead of tightening it, and once the smoothed latency is that slow too, each response backs the gap
+    off gently by `latency_backoff_factor`, without raising the floor. The base RTT creeps up towards slower responses
+    by `base_rtt_drift`, so a lasting change in the link's latency does not hold the gap up for ever.
+
+    Response latency is also tracked as a smoothed RTT and RTT variance by an `RttEstimator`, in the same way as TCP
+    (RFC 6298). The estimator is the adapter-wide one `AdaptiveTimeouts` falls back on, so pass it in to share it.
+    """
+
+    def __init__(
+        self,
+        initial_gap: float = 0.25,
+        min_gap: float = 0.05,
+        max_gap: float = 2.0,
+        tighten_factor: float = 0.9,
+        backoff_factor: float = 2.0,
+        floor_decay: float = 0.98,
+        latency_ratio: float = 1.5,
+        latency_slack: float = 0.05,
+        latency_backoff_factor: float = 1.1,
+        base_rtt_drift: float = 0.01,
+        rtt: Optional[RttEstimator] = None,
+    ) -> None:
+        self.min_gap = min_gap
+        self.max_gap = max_gap
+        self.tighten_factor = tighten_factor
+        self.backoff_factor = backoff_factor
+        self.floor_decay = floor_decay
+        self.latency_ratio = latency_ratio
+        self.latency_slack = latency_slack
+        self.latency_backoff_factor = latency_backoff_factor
+        self.base_rtt_drift = base_rtt_drift
+        self.gap = initial_gap
+        self.floor = min_gap
+        self.rtt = rtt if rtt is not None else RttEstimator()
+        self.min_rtt: Optional[float] = None
+        self.max_rtt: Optional[float] = None
+        self.base_rtt: Optional[float] = None
+        # smoothed like srtt, but only over the responses whose latency is judged
+        self.latency: Optional[float] = None
+        self.responses = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.latency_holds = 0
+        self.latency_backoffs = 0
+
+    def on_response(
+        self, rtt: float, ambiguous: bool = False, judge_latency: bool = True
+    ) -> None:
+        """Record a healthy response that arrived `rtt` seconds after its request was sent.
+
+        An `ambiguous` RTT, of a response to a retried request that could be answering either attempt, tightens the
+        gap but is neither fed to the estimator (Karn's algorithm) nor judged for queueing. Pass `judge_latency=False`
+        for responses that are expected to be slower than the rest, e.g. from battery BMSs, so that they neither set
+        nor fail the base RTT."""
+        self.responses += 1
+        if not ambiguous:
+            self.rtt.on_sample(rtt)
+        self.min_rtt = rtt if self.min_rtt is None else min(self.min_rtt, rtt)
+        self.max_rtt = rtt if self.max_rtt is None else max(self.max_rtt, rtt)
+        if not ambiguous and judge_latency and self._queueing(rtt):
+            return
+        self.floor = max(self.min_gap, self.floor * self.floor_decay)
+        self.gap = max(self.floor, self.gap * self.tighten_factor)
+
+    def _queueing(self, rtt: float) -> bool:
+        """Update the latency baseline with `rtt`, and hold or gently back off the gap if it looks like queueing."""
+        if self.base_rtt is None or self.latency is None:
+            self.base_rtt = self.latency = rtt
+            return False
+        if rtt < self.base_rtt:
+            self.base_rtt = rtt
+        else:
+            self.base_rtt += self.base_rtt_drift * (rtt - self.base_rtt)
+        self.latency = 0.875 * self.latency + 0.125 * rtt
+        threshold = self.base_rtt * self.latency_ratio + self.latency_slack
+        if self.latency > threshold:
+            self.latency_backoffs += 1
+            self.gap = min(self.max_gap, self.gap * self.latency_backoff_factor)
+            _logger.debug(
+                "Responses slowing to %.3fs (base %.3fs), backing off transmit gap to %.3fs",
+                self.latency,
+                self.base_rtt,
+                self.gap,
+            )
+            return True
+        if rtt > threshold:
+            self.latency_holds += 1
+            return True
+        return False
+
+    def on_timeout(self) -> None:
+        """Record a request that received no response in time."""
+        self.timeouts += 1
+        self._back_off()
+
+    def on_error(self) -> None:
+        """Record a request that received an error response."""
+        self.errors += 1
+        self._back_off()
+
+    def _back_off(self) -> None:
+        self.floor = min(
+            self.max_gap, max(self.floor, self.gap * self.backoff_factor**0.5)
+        )
+        self.gap = min(self.max_gap, max(self.floor, self.gap * self.backoff_factor))
+        _logger.debug(
+            "Backing off transmit gap to %.3fs (floor %.3fs)", self.gap, self.floor
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of the current gap and RTT statistics."""
+        return {
+            "gap": self.gap,
+            "floor": self.floor,
+            "srtt": self.rtt.srtt,
+            "rttvar": self.rtt.rttvar,
+            "min_rtt": self.min_rtt,
+            "max_rtt": self.max_rtt,
+            "base_rtt": self.base_rtt,
+            "latency": self.latency,
+            "responses": self.responses,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "latency_holds": self.latency_holds,
+            "latency_backoffs": self.latency_backoffs,
+        }
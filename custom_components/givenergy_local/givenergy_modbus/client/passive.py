@@ -0,0 +1,86 @@
+"""Tracking of register blocks refreshed by traffic we did not request."""
+
+import logging
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from custom_components.givenergy_local.givenergy_modbus.model.plant import (
+    canonical_slave_address,
+)
+from custom_components.givenergy_local.givenergy_modbus.pdu import (
+    TransparentRequest,
+)
+from custom_components.givenergy_local.givenergy_modbus.pdu.read_registers import (
+    ReadRegistersRequest,
+    ReadRegistersResponse,
+)
+
+_logger = logging.getLogger(__name__)
+
+# (slave address, transparent function code, base register)
+BlockKey = Tuple[int, int, int]
+
+
+class PassiveRefreshTracker:
+    """Remembers which register blocks unsolicited responses have refreshed, and when.
+
+    The data adapter forwards responses to requests made by the GivEnergy cloud and mobile app to every connected
+    client. Those responses update the plant just like our own, so a poll for a block that such traffic refreshed
+    recently is wasted effort for the adapter. Cloud and app traffic uses slave addresses 0x11 and 0x00; these are
+    tracked as 0x32, in the same way `Plant.update` stores them.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self.clock = clock
+        self._refreshed: Dict[BlockKey, Tuple[float, int]] = {}
+        self.responses = 0
+        self.skipped_requests = 0
+
+    def record(self, response: ReadRegistersResponse) -> None:
+        """Note that an unsolicited response has refreshed a block of registers."""
+        if response.error:
+            return
+        self.responses += 1
+        key = (
+            canonical_slave_address(response.slave_address),
+            response.transparent_function_code,
+            response.base_register,
+        )
+        self._refreshed[key] = (self.clock(), response.register_count)
+
+    def age(self, request: ReadRegistersRequest) -> Optional[float]:
+        """Seconds since unsolicited traffic last refreshed all registers a request would read, or None if never."""
+        key = (
+            canonical_slave_address(request.slave_address),
+            request.transparent_function_code,
+            request.base_register,
+        )
+        refreshed = self._refreshed.get(key)
+        if refreshed is None or refreshed[1] < request.register_count:
+            return None
+        return self.clock() - refreshed[0]
+
+    def filter(
+        self, requests: list[TransparentRequest], max_age: float
+    ) -> list[TransparentRequest]:
+        """Drop the read requests whose registers unsolicited traffic refreshed within the last `max_age` seconds."""
+        remaining = []
+        for request in requests:
+            if isinstance(request, ReadRegistersRequest):
+                age = self.age(request)
+                if age is not None and age <= max_age:
+                    _logger.debug(
+                        "Skipping %s, passively refreshed %.1fs ago", request, age
+                    )
+                    self.skipped_requests += 1
+                    continue
+            remaining.append(request)
+        return remaining
+
+    def stats(self) -> dict[str, int]:
+        """Counters for diagnostics."""
+        return {
+            "responses": self.responses,
+            "skipped_requests": self.skipped_requests,
+            "blocks": len(self._refreshed),
+        }
@@ -0,0 +1,174 @@
+"""Manage connections to many inverters from a single process."""
+
+import asyncio
+import logging
+from typing import Callable, Optional
+
+from custom_components.givenergy_local.givenergy_modbus.client.client import Client
+from custom_components.givenergy_local.givenergy_modbus.exceptions import (
+    CommunicationError,
+)
+from custom_components.givenergy_local.givenergy_modbus.model.plant import Plant
+
+_logger = logging.getLogger(__name__)
+
+RefreshResult = Plant | BaseException
+RefreshHandler = Callable[[str, RefreshResult], None]
+
+
+class ClientPool:
+    """Own one `Client` per inverter and refresh them concurrently.
+
+    Every client keeps its own connection, framer, plant, pacing and in-flight response tracking, so identically
+    shaped requests to different inverters never interfere. The pool adds a shared schedule on top: refreshes for all
+    plants are started together, each runs under its own deadline, and a plant that is still busy with a slow refresh
+    is simply skipped on the next tick rather than holding up the others.
+    """
+
+    clients: dict[str, Client]
+
+    def __init__(
+        self,
+        connect_timeout: float = 2.0,
+        use_protocol: bool = False,
+        detect_timeout: float = 1.0,
+        detect_retries: int = 3,
+    ) -> None:
+        self.connect_timeout = connect_timeout
+        self.use_protocol = use_protocol
+        self.detect_timeout = detect_timeout
+        self.detect_retries = detect_retries
+        self.clients = {}
+        self._refreshing: dict[str, asyncio.Task] = {}
+
+    def add(self, host: str, port: int = 8899, name: Optional[str] = None) -> Client:
+        """Register an inverter, keyed by `name` (or its host if not given), and return its client."""
+        key = name or host
+        if key in self.clients:
+            raise ValueError(f"{key} is already part of the pool")
+        client = Client(
+            host,
+            port,
+            connect_timeout=self.connect_timeout,
+            use_protocol=self.use_protocol,
+        )
+        self.clients[key] = client
+        return client
+
+    async def remove(self, name: str) -> None:
+        """Stop managing an inverter and close its connection."""
+        client = self.clients.pop(name)
+        if task := self._refreshing.pop(name, None):
+            task.cancel()
+        await client.close()
+
+    async def _refresh_one(
+        self, name: str, full_refresh: bool, timeout: float, retries: int
+    ) -> Plant:
+        client = self.clients[name]
+        try:
+            if not client.connected:
+                await client.connect()
+                await client.detect_plant(
+                    timeout=self.detect_timeout, retries=self.detect_retries
+                )
+                return client.plant
+            return await client.refresh_plant(
+                full_refresh=full_refresh, timeout=timeout, retries=retries
+            )
+        except (CommunicationError, asyncio.TimeoutError, asyncio.CancelledError):
+            # drop the connection so the next refresh starts afresh, rather than with a half-detected plant or a
+            # response to an abandoned request still on its way
+            await client.close()
+            raise
+
+    async def refresh_all(
+        self,
+        full_refresh: bool = False,
+        timeout: float = 1.0,
+        retries: int = 0,
+        deadline: Optional[float] = None,
+    ) -> dict[str, RefreshResult]:
+        """Refresh every plant concurrently, connecting and detecting plants as needed.
+
+        Each plant gets at most `deadline` seconds. Results are keyed by name: the refreshed `Plant`, or the exception
+        that refresh ended with.
+        """
+        names = list(self.clients)
+        results = await asyncio.gather(
+            *[
+                asyncio.wait_for(
+                    self._refresh_one(name, full_refresh, timeout, retries), deadline
+                )
+                for name in names
+            ],
+            return_exceptions=True,
+        )
+        return dict(zip(names, results))
+
+    async def watch(
+        self,
+        handler: RefreshHandler,
+        refresh_period: float = 15.0,
+        full_refresh_every: int = 20,
+        timeout: float = 1.0,
+        retries: int = 0,
+        deadline: Optional[float] = None,
+    ) -> None:
+        """Refresh all plants on one shared timer, calling `handler(name, result)` as each refresh completes.
+
+        Refreshes are independent: each plant's handler fires as soon as its own refresh is done, and a plant whose
+        previous refresh is still running when the timer fires is left to finish instead of being refreshed again.
+        Each refresh gets at most `deadline` seconds, which is not tied to `refresh_period`: a slow plant can take
+        several ticks over one refresh without being cut short. Every `full_refresh_every` ticks a full refresh is
+        requested.
+        """
+        loop = asyncio.get_running_loop()
+        tick = 0
+        next_tick = loop.time()
+        try:
+            while True:
+                full_refresh = tick % full_refresh_every == 0
+                for name in self.clients:
+                    if name in self._refreshing:
+                        _logger.debug(
+                            "%s is still refreshing, skipping this tick", name
+                        )
+                        continue
+                    task = loop.create_task(
+                        asyncio.wait_for(
+                            self._refresh_one(name, full_refresh, timeout, retries),
+                            deadline,
+                        ),
+                        name=f"refresh_{name}",
+                    )
+                    self._refreshing[name] = task
+                    task.add_done_callback(
+                        lambda t, n=name: self._on_refreshed(n, t, handler)  # type: ignore[misc]
+                    )
+                tick += 1
+                next_tick += refresh_period
+                await asyncio.sleep(max(0.0, next_tick - loop.time()))
+        finally:
+            for task in self._refreshing.values():
+                task.cancel()
+
+    def _on_refreshed(
+        self, name: str, task: asyncio.Task, handler: RefreshHandler
+    ) -> None:
+        if self._refreshing.get(name) is task:
+            del self._refreshing[name]
+        if task.cancelled():
+            return
+        result: RefreshResult = task.exception() or task.result()
+        try:
+            handler(name, result)
+        except Exception:  # pylint: disable=broad-except
+            _logger.exception("Refresh handler for %s failed", name)
+
+    async def close(self) -> None:
+        """Close every connection in the pool."""
+        for task in self._refreshing.values():
+            task.cancel()
+        self._refreshing.clear()
+        await asyncio.gather(*[client.close() for client in self.clients.values()])
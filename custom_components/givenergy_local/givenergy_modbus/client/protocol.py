@@ -0,0 +1,98 @@
+"""asyncio protocol transport for the client."""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from custom_components.givenergy_local.givenergy_modbus.client.client import (
+        Client,
+    )
+
+_logger = logging.getLogger(__name__)
+
+
+class ClientProtocol(asyncio.BufferedProtocol):
+    """Receive data directly into the client's framer and dispatch decoded messages synchronously.
+
+    The event loop reads straight into the free tail of the framer's buffer (`get_buffer`), and every complete frame
+    is dispatched from within `buffer_updated`, so there is no consumer task, no intermediate bytes object per read
+    and no async iteration per frame. The protocol also stands in for the `StreamWriter` the producer task expects,
+    exposing `write()`, `drain()` and the closing methods on top of the transport.
+    """
+
+    transport: Optional[asyncio.Transport] = None
+    # closes the client once the connection is lost; held so the task is not garbage collected mid-way
+    close_task: Optional[asyncio.Task] = None
+
+    def __init__(self, client: "Client") -> None:
+        self.client = client
+        self._paused = False
+        self._drain_waiter: Optional[asyncio.Future] = None
+        self._closed: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self.client.framer.get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes: int) -> None:
+        for message in self.client.framer.buffer_updated(nbytes):
+            self.client.dispatch(message)
+
+    def eof_received(self) -> bool:
+        _logger.debug("Remote closed the connection")
+        return False  # let the transport close itself
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        _logger.debug("Connection lost, closing client: %s", exc)
+        if not self._closed.done():
+            self._closed.set_result(None)
+        self._wake_drain_waiter(exc)
+        self.close_task = asyncio.get_running_loop().create_task(
+            self.client.close(), name="close_client"
+        )
+
+    def pause_writing(self) -> None:
+        self._paused = True
+
+    def resume_writing(self) -> None:
+        self._paused = False
+        self._wake_drain_waiter(None)
+
+    def _wake_drain_waiter(self, exc: Optional[Exception]) -> None:
+        waiter, self._drain_waiter = self._drain_waiter, None
+        if waiter is not None and not waiter.done():
+            if exc is None:
+                waiter.set_result(None)
+            else:
+                waiter.set_exception(exc)
+
+    # StreamWriter-compatible interface used by the client
+
+    def write(self, data: bytes) -> None:
+        """Queue data on the transport."""
+        if self.transport is not None:
+            self.transport.write(data)
+
+    async def drain(self) -> None:
+        """Wait until the transport's write buffer has drained below its high-water mark."""
+        if self.is_closing():
+            raise ConnectionResetError("Connection lost")
+        if self._paused:
+            self._drain_waiter = asyncio.get_running_loop().create_future()
+            await self._drain_waiter
+
+    def is_closing(self) -> bool:
+        """Return whether the transport is closed or being closed."""
+        return self.transport is None or self.transport.is_closing()
+
+    def close(self) -> None:
+        """Close the transport."""
+        if self.transport is not None:
+            self.transport.close()
+
+    async def wait_closed(self) -> None:
+        """Wait for the connection to be fully closed."""
+        await self._closed
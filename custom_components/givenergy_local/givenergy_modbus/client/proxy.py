@@ -0,0 +1,225 @@
+"""Share one connection to a data adapter between many local clients."""
+
+import asyncio
+from asyncio import StreamReader, StreamWriter, Task
+import logging
+import time
+from typing import Any, Callable, Dict, Optional, Set
+
+from custom_components.givenergy_local.givenergy_modbus.client.client import Client
+from custom_components.givenergy_local.givenergy_modbus.client.passive import (
+    PassiveRefreshTracker,
+)
+from custom_components.givenergy_local.givenergy_modbus.exceptions import (
+    CommunicationError,
+    ExceptionBase,
+)
+from custom_components.givenergy_local.givenergy_modbus.framer import ServerFramer
+from custom_components.givenergy_local.givenergy_modbus.model.plant import (
+    canonical_slave_address,
+)
+from custom_components.givenergy_local.givenergy_modbus.model.register import (
+    HR,
+    IR,
+)
+from custom_components.givenergy_local.givenergy_modbus.pdu import (
+    HeartbeatResponse,
+    ReadHoldingRegistersResponse,
+    ReadInputRegistersResponse,
+    ReadRegistersRequest,
+    ReadRegistersResponse,
+    TransparentRequest,
+)
+
+_logger = logging.getLogger(__name__)
+
+
+class InverterProxy:
+    """Accept local connections and serve them over a single upstream `Client`.
+
+    Data adapters cope poorly with several concurrent sockets, so the Home Assistant integration, the debug CLI and
+    any other tools can all connect here instead. Reads of holding or input registers are answered straight from the
+    upstream plant's register cache when that block was refreshed within `max_age` seconds, whether by an earlier
+    request through the proxy or by cloud and app traffic. Everything else, writes included, is forwarded through the
+    client, and so shares its paced transmit queue, request coalescing and retries. Requests that fail upstream go
+    unanswered, just as they would when talking to the adapter directly.
+    """
+
+    client: Client
+    refreshes: PassiveRefreshTracker
+
+    def __init__(
+        self,
+        client: Client,
+        host: str = "127.0.0.1",
+        port: int = 8899,
+        max_age: float = 5.0,
+        timeout: float = 1.0,
+        retries: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.client = client
+        self.host = host
+        self.port = port
+        self.max_age = max_age
+        self.timeout = timeout
+        self.retries = retries
+        # blocks refreshed by requests forwarded on behalf of local clients
+        self.refreshes = PassiveRefreshTracker(clock)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connecting = asyncio.Lock()
+        self._tasks: Set[Task] = set()
+        self.connections = 0
+        self.cache_hits = 0
+        self.forwarded_requests = 0
+        self.failed_requests = 0
+
+    async def start(self) -> None:
+        """Connect upstream and start accepting local connections."""
+        await self._ensure_connected()
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        _logger.info(
+            "Proxying %s:%d on %s:%d",
+            self.client.host,
+            self.client.port,
+            self.host,
+            self.port,
+        )
+
+    async def close(self) -> None:
+        """Stop accepting connections, abandon outstanding requests and close the upstream connection."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for task in list(self._tasks):
+            task.cancel()
+        await self.client.close()
+
+    async def serve_forever(self) -> None:
+        """Run until cancelled."""
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    async def _ensure_connected(self) -> None:
+        async with self._connecting:
+            if not self.client.connected:
+                await self.client.connect()
+
+    async def _handle_connection(
+        self, reader: StreamReader, writer: StreamWriter
+    ) -> None:
+        self.connections += 1
+        peer = writer.get_extra_info("peername")
+        _logger.info("Local client connected: %s", peer)
+        framer = ServerFramer()
+        try:
+            while not reader.at_eof():
+                data = await reader.read(300)
+                for message in framer.decode_frames(data):
+                    if isinstance(message, ExceptionBase):
+                        _logger.debug("Ignoring bad frame from %s: %s", peer, message)
+                    elif isinstance(message, TransparentRequest):
+                        # requests are answered concurrently, as the adapter itself would
+                        task = asyncio.create_task(
+                            self._handle_request(message, writer)
+                        )
+                        self._tasks.add(task)
+                        task.add_done_callback(self._tasks.discard)
+                    elif not isinstance(message, HeartbeatResponse):
+                        _logger.debug("Ignoring %s from %s", message, peer)
+        except (ConnectionError, OSError) as e:
+            _logger.debug("Local client %s went away: %s", peer, e)
+        finally:
+            self.connections -= 1
+            _logger.info("Local client disconnected: %s", peer)
+            writer.close()
+
+    async def _handle_request(
+        self, request: TransparentRequest, writer: StreamWriter
+    ) -> None:
+        cached = self.cached_response(request)
+        if cached is not None:
+            self.cache_hits += 1
+            frame = cached.encode()
+        else:
+            self.forwarded_requests += 1
+            try:
+                await self._ensure_connected()
+                response = await self.client.send_request_and_await_response(
+                    request,
+                    timeout=self.timeout,
+                    retries=self.retries,
+                )
+            except (asyncio.TimeoutError, CommunicationError, OSError) as e:
+                self.failed_requests += 1
+                _logger.debug("No response to forward for %s: %s", request, e)
+                return
+            if isinstance(response, ReadRegistersResponse):
+                self.refreshes.record(response)
+            frame = getattr(response, "raw_frame", None) or response.encode()
+        if not writer.is_closing():
+            writer.write(frame)
+
+    def _age(self, request: ReadRegistersRequest) -> Optional[float]:
+        ages = [
+            age
+            for age in (
+                self.refreshes.age(request),
+                self.client.passive_refreshes.age(request),
+            )
+            if age is not None
+        ]
+        return min(ages) if ages else None
+
+    def cached_response(
+        self, request: TransparentRequest
+    ) -> Optional[ReadRegistersResponse]:
+        """Build a response to a read request from the plant, if its registers are fresh enough."""
+        if not isinstance(request, ReadRegistersRequest):
+            return None
+        if request.transparent_function_code == 3:
+            response_class, register_class = ReadHoldingRegistersResponse, HR
+        elif request.transparent_function_code == 4:
+            response_class, register_class = ReadInputRegistersResponse, IR
+        else:
+            return None
+        age = self._age(request)
+        if age is None or age > self.max_age:
+            return None
+        plant = self.client.plant
+        register_cache = plant.register_caches.get(
+            canonical_slave_address(request.slave_address)
+        )
+        if register_cache is None:
+            return None
+        return response_class(
+            inverter_serial_number=plant.inverter_serial_number,
+            data_adapter_serial_number=plant.data_adapter_serial_number,
+            slave_address=request.slave_address,
+            base_register=request.base_register,
+            register_count=request.register_count,
+            register_values=[
+                register_cache.get(register_class(i), 0)
+                for i in range(
+                    request.base_register,
+                    request.base_register + request.register_count,
+                )
+            ],
+            padding=0x8A,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for diagnostics, alongside those of the upstream client."""
+        return {
+            "connections": self.connections,
+            "cache_hits": self.cache_hits,
+            "forwarded_requests": self.forwarded_requests,
+            "failed_requests": self.failed_requests,
+            "client": self.client.stats(),
+        }
@@ -0,0 +1,230 @@
+"""Priority scheduling of frames waiting to be transmitted."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Callable, Deque, Dict, Generic, List, Tuple, TypeVar
+
+_logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class Priority(IntEnum):
+    """Transmit priority classes, most urgent first."""
+
+    HEARTBEAT = 0
+    WRITE = 1
+    INTERACTIVE = 2
+    BACKGROUND = 3
+
+
+class TransmitScheduler(Generic[T]):
+    """Drop-in replacement for the transmit `asyncio.Queue` that serves frames by priority class.
+
+    Heartbeat replies go out next, since the data adapter drops the connection if they miss its deadline. Writes,
+    interactive reads and background polls are served in that order, but with aging to stop a steady stream of more
+    urgent frames starving the rest: every `aging_interval` seconds a class has frames waiting without being served
+    promotes it by one level. A class promoted all the way is overdue, and overdue classes are served (longest waiting
+    first) ahead of everything, heartbeat replies included, so not even a flood of heartbeats can hold up a write
+    for more than `aging_interval`. Otherwise classes are served in order, and frames in arrival order within a
+    class.
+
+    Aging applies to classes rather than to individual frames, so a saturated poll whose frames each wait a while
+    (but which is served steadily) does not end up competing with writes.
+
+    `maxsize` bounds only reads: heartbeat replies and writes can always be queued immediately, rather than waiting
+    for space behind a saturated poll.
+
+    With `max_in_flight` set, the scheduler also owns the client's in-flight window: taking a write or read frame
+    takes a window slot, which is handed back with `release()` once its response arrives or is given up on. While all
+    slots are taken only heartbeat replies are served, so they never wait behind a request frame held back for a slot.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 20,
+        aging_interval: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+        max_in_flight: int = 0,
+    ) -> None:
+        self.maxsize = maxsize
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self.aging_interval = aging_interval
+        self.clock = clock
+        self._queues: Dict[Priority, Deque[Tuple[float, T]]] = {
+            p: deque() for p in Priority
+        }
+        # when each non-empty class was last served, or started waiting if it has not been since
+        self._waiting_since: Dict[Priority, float] = {}
+        self._bounded = 0
+        self._unfinished_tasks = 0
+        self._getters: Deque[asyncio.Future] = deque()
+        self._putters: Deque[asyncio.Future] = deque()
+        self._finished = asyncio.Event()
+        self._finished.set()
+        self.promoted = 0
+
+    def qsize(self) -> int:
+        """Number of frames waiting, across all classes."""
+        return sum(len(q) for q in self._queues.values())
+
+    def qsizes(self) -> Dict[str, int]:
+        """Number of frames waiting in each class."""
+        return {p.name.lower(): len(q) for p, q in self._queues.items()}
+
+    def empty(self) -> bool:
+        return not any(self._queues.values())
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= self._bounded
+
+    def window_full(self) -> bool:
+        """Whether every in-flight window slot is taken, so only heartbeat replies can be served."""
+        return 0 < self.max_in_flight <= self.in_flight
+
+    def release(self) -> None:
+        """Hand back the window slot taken when a write or read frame was served."""
+        if self.in_flight <= 0:
+            raise ValueError("release() called too many times")
+        self.in_flight -= 1
+        self._wakeup_next(self._getters)
+
+    def reset_window(self) -> None:
+        """Forget every slot taken, e.g. for frames sent over a connection that has since been replaced."""
+        self.in_flight = 0
+        self._wakeup_next(self._getters)
+
+    def clear(self) -> List[T]:
+        """Remove and return every waiting frame, whatever its class and however full the window is."""
+        items = [item for queue in self._queues.values() for _, item in queue]
+        for queue in self._queues.values():
+            queue.clear()
+        self._waiting_since.clear()
+        self._bounded = 0
+        self._unfinished_tasks -= len(items)
+        if self._unfinished_tasks == 0:
+            self._finished.set()
+        while self._putters:
+            self._wakeup_next(self._putters)
+        return items
+
+    def put_nowait(self, item: T, priority: Priority = Priority.BACKGROUND) -> None:
+        """Queue a frame without waiting, raising `asyncio.QueueFull` if a read finds the queue full."""
+        if priority >= Priority.INTERACTIVE:
+            if self.full():
+                raise asyncio.QueueFull
+            self._bounded += 1
+        now = self.clock()
+        queue = self._queues[priority]
+        if not queue:
+            self._waiting_since[priority] = now
+        queue.append((now, item))
+        self._unfinished_tasks += 1
+        self._finished.clear()
+        self._wakeup_next(self._getters)
+
+    async def put(self, item: T, priority: Priority = Priority.BACKGROUND) -> None:
+        """Queue a frame, waiting for space if needed."""
+        while priority >= Priority.INTERACTIVE and self.full():
+            putter = asyncio.get_running_loop().create_future()
+            self._putters.append(putter)
+            try:
+                await putter
+            except BaseException:
+                putter.cancel()
+                try:
+                    self._putters.remove(putter)
+                except ValueError:
+                    pass
+                if not self.full() and not putter.cancelled():
+                    self._wakeup_next(self._putters)
+                raise
+        self.put_nowait(item, priority)
+
+    def get_nowait(self) -> T:
+        """Remove and return the most urgent frame that can be served, raising `asyncio.QueueEmpty` if there is none.
+
+        Serving anything but a heartbeat reply takes an in-flight window slot."""
+        priority = self._next_priority()
+        queue = self._queues[priority]
+        _, item = queue.popleft()
+        if queue:
+            self._waiting_since[priority] = self.clock()
+        if priority >= Priority.INTERACTIVE:
+            self._bounded -= 1
+            self._wakeup_next(self._putters)
+        if priority != Priority.HEARTBEAT:
+            self.in_flight += 1
+        return item
+
+    async def get(self) -> T:
+        """Remove and return the most urgent frame that can be served, waiting until there is one."""
+        while not self._servable():
+            getter = asyncio.get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                try:
+                    self._getters.remove(getter)
+                except ValueError:
+                    pass
+                if self._servable() and not getter.cancelled():
+                    self._wakeup_next(self._getters)
+                raise
+        return self.get_nowait()
+
+    def task_done(self) -> None:
+        if self._unfinished_tasks <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished_tasks -= 1
+        if self._unfinished_tasks == 0:
+            self._finished.set()
+
+    async def join(self) -> None:
+        await self._finished.wait()
+
+    def _servable(self) -> bool:
+        if self._queues[Priority.HEARTBEAT]:
+            return True
+        return not self.window_full() and not self.empty()
+
+    def _next_priority(self) -> Priority:
+        heartbeat = bool(self._queues[Priority.HEARTBEAT])
+        if self.window_full():
+            if heartbeat:
+                return Priority.HEARTBEAT
+            raise asyncio.QueueEmpty
+        now = self.clock()
+        best = None
+        for priority in (Priority.WRITE, Priority.INTERACTIVE, Priority.BACKGROUND):
+            queue = self._queues[priority]
+            if not queue:
+                continue
+            waiting_since = self._waiting_since[priority]
+            steps = int((now - waiting_since) / self.aging_interval)
+            effective = max(0, priority - steps)
+            key = (effective, priority if effective else 0, waiting_since)
+            if best is None or key < best[0]:
+                best = (key, priority)
+        if heartbeat and (best is None or best[0][0] > 0):
+            return Priority.HEARTBEAT
+        if best is None:
+            raise asyncio.QueueEmpty
+        if best[0][0] != best[1]:
+            self.promoted += 1
+            _logger.debug("Serving aged %s class", best[1].name.lower())
+        return best[1]
+
+    @staticmethod
+    def _wakeup_next(waiters: Deque[asyncio.Future]) -> None:
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
@@ -0,0 +1,98 @@
+"""Streams of register changes for consumers of a client."""
+
+import asyncio
+from collections import deque
+import logging
+from typing import Callable, Deque, Iterable, Optional
+
+from custom_components.givenergy_local.givenergy_modbus.model.plant import (
+    RegisterDelta,
+)
+
+_logger = logging.getLogger(__name__)
+
+
+class RegisterSubscription:
+    """Async iterator over the registers changed by each response a client receives.
+
+    Use via `Client.subscribe()`, either as an async context manager or by calling `close()` when done::
+
+        async with client.subscribe() as deltas:
+            async for delta in deltas:
+                ...
+
+    The same delta instance is handed to every subscription, so consumers must treat it as read-only.
+
+    Deltas are buffered up to `maxsize` per subscription so a slow consumer never holds up the client. Once the buffer
+    is full, a new delta is merged into the newest buffered delta for the same slave address, keeping the oldest old
+    value and the newest new value for each register, so no change is lost. Only if there is no such delta to merge
+    into is the oldest buffered delta discarded, which is counted in `dropped`.
+    """
+
+    def __init__(
+        self,
+        unsubscribe: Callable[["RegisterSubscription"], None],
+        maxsize: int = 100,
+        slave_addresses: Optional[Iterable[int]] = None,
+    ) -> None:
+        self._unsubscribe = unsubscribe
+        self.maxsize = maxsize
+        self.slave_addresses = (
+            frozenset(slave_addresses) if slave_addresses is not None else None
+        )
+        self._deltas: Deque[RegisterDelta] = deque()
+        self._ready = asyncio.Event()
+        self.closed = False
+        self.merged = 0
+        self.dropped = 0
+
+    def publish(self, delta: RegisterDelta) -> None:
+        """Queue a delta for the consumer, if it concerns a slave address of interest and changed anything."""
+        if self.closed or not delta.changes:
+            return
+        if (
+            self.slave_addresses is not None
+            and delta.slave_address not in self.slave_addresses
+        ):
+            return
+        if len(self._deltas) >= self.maxsize:
+            for i in range(len(self._deltas) - 1, -1, -1):
+                queued = self._deltas[i]
+                if queued.slave_address == delta.slave_address:
+                    # deltas are shared between subscriptions, so merge into a copy
+                    merged = RegisterDelta(
+                        queued.slave_address, dict(queued.changes), queued.received_at
+                    )
+                    merged.merge(delta)
+                    self._deltas[i] = merged
+                    self.merged += 1
+                    return
+            self._deltas.popleft()
+            self.dropped += 1
+            _logger.debug("Subscriber is not keeping up, dropped oldest delta")
+        self._deltas.append(delta)
+        self._ready.set()
+
+    def close(self) -> None:
+        """Stop receiving deltas. Iteration ends once any already buffered have been consumed."""
+        if not self.closed:
+            self.closed = True
+            self._unsubscribe(self)
+            self._ready.set()
+
+    def __aiter__(self) -> "RegisterSubscription":
+        return self
+
+    async def __anext__(self) -> RegisterDelta:
+        while not self._deltas:
+            if self.closed:
+                raise StopAsyncIteration
+            self._ready.clear()
+            await self._ready.wait()
+        return self._deltas.popleft()
+
+    async def __aenter__(self) -> "RegisterSubscription":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
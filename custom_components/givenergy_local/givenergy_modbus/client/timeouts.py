@@ -0,0 +1,126 @@
+"""Adaptive response timeouts and retry backoff."""
+
+import random
+from typing import Any, Dict, Optional
+
+
+class RttEstimator:
+    """Smoothed round-trip time and variance, and the retransmission timeout derived from them (RFC 6298)."""
+
+    __slots__ = ("srtt", "rttvar", "backoff", "samples")
+
+    def __init__(self) -> None:
+        self.srtt: Optional[float] = None
+        self.rttvar: Optional[float] = None
+        # doubles with every timeout and resets with the next valid sample, as per Karn's algorithm
+        self.backoff = 1
+        self.samples = 0
+
+    def on_sample(self, rtt: float) -> None:
+        self.samples += 1
+        if self.srtt is None or self.rttvar is None:
+            self.srtt, self.rttvar = rtt, rtt / 2
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - rtt)
+            self.srtt = 0.875 * self.srtt + 0.125 * rtt
+        self.backoff = 1
+
+    def on_timeout(self, max_backoff: int) -> None:
+        self.backoff = min(2 * self.backoff, max_backoff)
+
+    def rto(self, granularity: float) -> Optional[float]:
+        """Timeout before any backoff, or None if there have been no samples yet."""
+        if self.srtt is None or self.rttvar is None:
+            return None
+        return self.srtt + max(granularity, 4 * self.rttvar)
+
+
+class AdaptiveTimeouts:
+    """Per-attempt response timeouts learned from the RTTs of a data adapter and the devices behind it.
+
+    RTT is tracked for every slave address separately, since e.g. battery BMSs can answer more slowly than the
+    inverter itself, and for the adapter as a whole to fall back on for slave addresses not heard from yet. Until
+    there are any samples at all, the timeout requested by the caller is used. Only responses to first attempts are
+    sampled, since a response after a retry could be answering either attempt.
+
+    The adapter-wide estimate can be shared with (and fed by) a `TransmitPacer`, in which case only the per-slave
+    estimates are fed here.
+
+    Between retries, `retry_delay()` gives a "full jitter" exponential backoff, so that a struggling adapter is not
+    hit by several clients (or requests) retrying in lockstep.
+    """
+
+    def __init__(
+        self,
+        min_timeout: float = 0.5,
+        max_timeout: float = 10.0,
+        granularity: float = 0.05,
+        max_backoff: int = 8,
+        retry_base_delay: float = 0.25,
+        retry_max_delay: float = 4.0,
+        rng: Optional[random.Random] = None,
+        adapter: Optional[RttEstimator] = None,
+    ) -> None:
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.granularity = granularity
+        self.max_backoff = max_backoff
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.rng = rng or random.Random()
+        self.adapter = adapter if adapter is not None else RttEstimator()
+        # whether adapter-wide samples are ours to record, rather than recorded by whoever shares the estimator
+        self._owns_adapter = adapter is None
+        self.slaves: Dict[int, RttEstimator] = {}
+
+    def _slave(self, slave_address: int) -> RttEstimator:
+        estimator = self.slaves.get(slave_address)
+        if estimator is None:
+            estimator = self.slaves[slave_address] = RttEstimator()
+        return estimator
+
+    def timeout(self, slave_address: int, default: float) -> float:
+        """How long to await a response from `slave_address` before retrying."""
+        estimator = self.slaves.get(slave_address)
+        rto = estimator.rto(self.granularity) if estimator else None
+        if rto is None:
+            rto = self.adapter.rto(self.granularity)
+        if rto is None:
+            return default
+        backoff = estimator.backoff if estimator else 1
+        return min(max(rto, self.min_timeout) * backoff, self.max_timeout)
+
+    def on_response(self, slave_address: int, rtt: float) -> None:
+        """Record the RTT of a response to a first attempt."""
+        self._slave(slave_address).on_sample(rtt)
+        if self._owns_adapter:
+            self.adapter.on_sample(rtt)
+
+    def on_timeout(self, slave_address: int) -> None:
+        """Back the timeout for `slave_address` off after an attempt went unanswered."""
+        self._slave(slave_address).on_timeout(self.max_backoff)
+
+    def retry_delay(self, attempt: int) -> float:
+        """Randomised delay before retrying after `attempt` attempts failed."""
+        ceiling = min(self.retry_max_delay, self.retry_base_delay * 2 ** (attempt - 1))
+        return self.rng.uniform(0, ceiling)
+
+    def stats(self) -> Dict[str, Any]:
+        """Current estimates, for diagnostics."""
+
+        def describe(estimator: RttEstimator) -> Dict[str, Any]:
+            return {
+                "srtt": estimator.srtt,
+                "rttvar": estimator.rttvar,
+                "backoff": estimator.backoff,
+                "samples": estimator.samples,
+                "rto": estimator.rto(self.granularity),
+            }
+
+        return {
+            "adapter": describe(self.adapter),
+            "slaves": {
+                f"0x{slave:02x}": describe(estimator)
+                for slave, estimator in sorted(self.slaves.items())
+            },
+        }
@@ -1,6 +1,27 @@
 import struct
 
-from crccheck.crc import CrcModbus
+from custom_components.givenergy_local.givenergy_modbus.crc import crc16_modbus
+
+
+# Precompiled big-endian codecs, shared by all decoders.
+_UINT8 = struct.Struct(">B")
+_UINT16 = struct.Struct(">H")
+_UINT32 = struct.Struct(">I")
+_UINT64 = struct.Struct(">Q")
+_UINT16_ARRAYS: dict[int, struct.Struct] = {}
+
+
+def _uint16_array(count: int) -> struct.Struct:
+    """Return a codec for `count` consecutive big-endian 16-bit unsigned ints.
+
+    Codecs are cached for plausible Modbus register counts only, so corrupt frames can't grow the cache unbounded.
+    """
+    codec = _UINT16_ARRAYS.get(count)
+    if codec is None:
+        codec = struct.Struct(f">{count}H")
+        if count <= 125:
+            _UINT16_ARRAYS[count] = codec
+    return codec
 
 
 class PayloadDecoder:
@@ -8,7 +29,7 @@ class PayloadDecoder:
 
     _byteorder = ">"  # big-endian
 
-    def __init__(self, payload: bytes):
+    def __init__(self, payload: bytes | memoryview):
         self._payload = payload
         self._pointer = 0
 
@@ -22,26 +43,28 @@ class PayloadDecoder:
     def decode_8bit_uint(self):
         """Decodes an 8-bit unsigned int from the buffer."""
         self._pointer += 1
-        handle = self._payload[self._pointer - 1 : self._pointer]
-        return struct.unpack(self._byteorder + "B", handle)[0]
+        return _UINT8.unpack_from(self._payload, self._pointer - 1)[0]
 
     def decode_16bit_uint(self):
         """Decodes a 16-bit unsigned int from the buffer."""
         self._pointer += 2
-        handle = self._payload[self._pointer - 2 : self._pointer]
-        return struct.unpack(self._byteorder + "H", handle)[0]
+        return _UINT16.unpack_from(self._payload, self._pointer - 2)[0]
+
+    def decode_16bit_uint_array(self, count: int) -> tuple[int, ...]:
+        """Decodes `count` consecutive 16-bit unsigned ints from the buffer in a single pass."""
+        codec = _uint16_array(count)
+        self._pointer += codec.size
+        return codec.unpack_from(self._payload, self._pointer - codec.size)
 
     def decode_32bit_uint(self):
         """Decodes a 32-bit unsigned int from the buffer."""
         self._pointer += 4
-        handle = self._payload[self._pointer - 4 : self._pointer]
-        return struct.unpack(self._byteorder + "I", handle)[0]
+        return _UINT32.unpack_from(self._payload, self._pointer - 4)[0]
 
     def decode_64bit_uint(self):
         """Decodes a 64-bit unsigned int from the buffer."""
         self._pointer += 8
-        handle = self._payload[self._pointer - 8 : self._pointer]
-        return struct.unpack(self._byteorder + "Q", handle)[0]
+        return _UINT64.unpack_from(self._payload, self._pointer - 8)[0]
 
     def decode_string(self, size=1) -> str:
         """Decodes a string from the buffer."""
@@ -50,7 +73,7 @@ class PayloadDecoder:
                 f"unpack requires a buffer of {size-self.remaining_bytes} bytes, {self.remaining_bytes} bytes remain"
             )
         self._pointer += size
-        return self._payload[self._pointer - size : self._pointer].decode("latin1")
+        return str(self._payload[self._pointer - size : self._pointer], "latin1")
 
     @property
     def decoding_complete(self) -> bool:
@@ -73,7 +96,7 @@ class PayloadDecoder:
         return self.payload_size - self._pointer
 
     @property
-    def remaining_payload(self) -> bytes:
+    def remaining_payload(self) -> bytes | memoryview:
         """Return the unprocessed / remaining tail of the payload."""
         return self._payload[self._pointer :]
 
@@ -99,7 +122,7 @@ class PayloadEncoder:
     @property
     def crc(self) -> int:
         """Calculate a Modbus-compatible CRC based on the buffer contents."""
-        return CrcModbus().process(self.payload).final()  # type: ignore[no-any-return]
+        return crc16_modbus(self.payload)
 
     def add_8bit_uint(self, value: int):
         """Adds an 8-bit unsigned int to the buffer."""
@@ -1,6 +1,6 @@
 import logging
 from abc import ABC
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
 from typing import Callable, Optional, Type, Union
 
 from custom_components.givenergy_local.givenergy_modbus.exceptions import ExceptionBase, InvalidFrame, InvalidPduState
@@ -70,15 +70,98 @@ class Framer(ABC):
         * `0x03` - read holding registers
         * `0x04` - read input registers
         * `0x06` - write single holding register
-        * `0x10` - write multiple holding registers (not implemented by this library)
+        * `0x10` - write multiple holding registers
     * ``data`` (*n* bytes) depends on the function invoked
     * ``crc`` (2 bytes) CRC for a request is calculated using the function id, base register and
       step count, but it is unclear how a response CRC is calculated or should be verified.
     """
 
-    _buffer: bytes = b''
     pdu_class: 'Type[BasePDU]'
 
+    # The receive buffer is preallocated once and reused: ``_read`` marks the start of unconsumed data and ``_write``
+    # the end of valid data. Frames are handed to the decoder as memoryview slices of this buffer, and unconsumed
+    # bytes are only ever moved when the tail runs out of space, which in practice means a partial frame of at most
+    # a few hundred bytes.
+    _buffer: bytearray
+    _view: memoryview
+    _read: int
+    _write: int
+    # buffered length below which there is no point in scanning again, e.g. when awaiting the rest of a known frame
+    _awaiting: int
+    # counters, for diagnosing a degrading connection
+    bytes_received: int
+    bytes_discarded: int
+    frames: int
+    decode_errors: int
+    resyncs: int
+
+    def __init__(self, buffer_size: int = 4096) -> None:
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._read = 0
+        self._write = 0
+        self._awaiting = 18
+        self.bytes_received = 0
+        self.bytes_discarded = 0
+        self.frames = 0
+        self.decode_errors = 0
+        self.resyncs = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return the framing counters."""
+        return {
+            'bytes_received': self.bytes_received,
+            'bytes_discarded': self.bytes_discarded,
+            'bytes_buffered': self._write - self._read,
+            'frames': self.frames,
+            'decode_errors': self.decode_errors,
+            'resyncs': self.resyncs,
+        }
+
+    @property
+    def buffered_bytes(self) -> int:
+        """Return the number of received bytes that have not been consumed by framing yet."""
+        return self._write - self._read
+
+    def _reserve(self, size: int) -> None:
+        """Ensure at least `size` bytes are free at the tail of the buffer, compacting or growing it if necessary."""
+        if self._write + size <= len(self._buffer):
+            return
+        pending = self._write - self._read
+        if pending + size > len(self._buffer):
+            # Grow into a fresh buffer: previously yielded frame views may still reference the old one.
+            new_buffer = bytearray(max(2 * len(self._buffer), pending + size))
+            new_buffer[:pending] = self._view[self._read : self._write]
+            self._buffer = new_buffer
+            self._view = memoryview(new_buffer)
+        elif pending:
+            # source and destination may overlap, so move the (small) unconsumed tail via a temporary copy
+            self._buffer[:pending] = self._buffer[self._read : self._write]
+        self._read, self._write = 0, pending
+
+    def get_buffer(self, sizehint: int = -1) -> memoryview:
+        """Return the free tail of the buffer for a transport to receive into directly.
+
+        This mirrors `asyncio.BufferedProtocol.get_buffer()`: once data has been written into the returned view,
+        `buffer_updated()` must be called with the number of bytes received.
+        """
+        self._reserve(max(sizehint, 1024))
+        return self._view[self._write :]
+
+    def buffer_updated(self, nbytes: int) -> Iterator[Union[BasePDU, ExceptionBase]]:
+        """Account for `nbytes` received into the view returned by `get_buffer()` and decode any complete frames."""
+        self._write += nbytes
+        self.bytes_received += nbytes
+        return self._frames()
+
+    def decode_frames(self, data: bytes) -> Iterator[Union[BasePDU, ExceptionBase]]:
+        """Synchronous equivalent of `decode()`, for callers that don't need an async iterator."""
+        self._reserve(len(data))
+        self._buffer[self._write : self._write + len(data)] = data
+        self._write += len(data)
+        self.bytes_received += len(data)
+        return self._frames()
+
     async def decode(self, data: bytes) -> AsyncIterator[Union[BasePDU, ExceptionBase]]:
         """Receive incoming network data and attempt to decode frames into messages.
 
@@ -87,81 +170,111 @@ class Framer(ABC):
         the buffer ready for unframing and processing. There is also plenty of evidence that garbage and corruption
         is present from time to time which we attempt to skip over. This framer repeatedly attempts sliding window
         framing on the buffer by scanning for a constant start-of-frame marker, extracting the expected frame size,
-        and if the buffer is long enough extracts that frame and trims the buffer. This will extract, decode and
-        yield all complete messages that are able to be unframed this way, and returns when the first partial frame
-        is encountered (i.e., the buffer is too short to contain any viable message due to fragmentation or
+        and if the buffer is long enough extracts that frame and advances the read cursor. This will extract, decode
+        and yield all complete messages that are able to be unframed this way, and returns when the first partial
+        frame is encountered (i.e., the buffer is too short to contain any viable message due to fragmentation or
         buffering), with the expectation that this partial frame will be completed as more data arrives and gets
         passed here.
 
-        Every complete frame gets passed through the decoder – the result (either a valid message or a caught
-        exception) is yielded to the caller for onward processing, dispatching, error handling and debugging,
-        and the frame buffer is always advanced over that frame.
+        Every complete frame gets passed through the decoder as a view over the receive buffer – the result (either a
+        valid message or a caught exception) is yielded to the caller for onward processing, dispatching, error
+        handling and debugging, and the read cursor is always advanced over that frame.
         """
-        self._buffer += data
-        while len(self._buffer) >= 18:  # shortest known message is 18b (heartbeat request)
+        for message in self.decode_frames(data):
+            yield message
+
+    def _frames(self) -> Iterator[Union[BasePDU, ExceptionBase]]:
+        """Extract, decode and yield all complete frames currently in the buffer."""
+        if self._write - self._read < self._awaiting:
+            return
+        self._awaiting = 18  # shortest known message is 18b (heartbeat request)
+        buffer, view = self._buffer, self._view
+        debug = _logger.isEnabledFor(logging.DEBUG)
+        while self._write - self._read >= 18:
+            read, write = self._read, self._write
             # ensure the head of the buffer starts with a valid MBAP header
-            frame_start_offset = self._buffer.find(HEADER_START_MARKER)
-            if frame_start_offset < 0:
+            frame_start = buffer.find(HEADER_START_MARKER, read, write)
+            if frame_start < 0:
                 _logger.info('No frame header found, await more data')
+                # only the last few bytes could still turn out to be the start of a marker
+                self._read = write - len(HEADER_START_MARKER) + 1
+                self.bytes_discarded += self._read - read
                 break
-            elif frame_start_offset > 0:
+            elif frame_start > read:
                 # The next candidate frame header is not at the start of the buffer: skip forward to that position
                 _logger.warning(
-                    f'Candidate frame found {frame_start_offset} bytes into buffer, '
-                    f'discarding leading garbage: 0x{self._buffer[:frame_start_offset].hex()}'
+                    f'Candidate frame found {frame_start - read} bytes into buffer, '
+                    f'discarding leading garbage: 0x{view[read:frame_start].hex()}'
                 )
-                self._buffer = self._buffer[frame_start_offset:]
+                self._read = frame_start
+                self.bytes_discarded += frame_start - read
+                self.resyncs += 1
                 continue
 
-            _logger.debug(f'Found next frame: 0x{self._buffer[:8].hex()}..., buffer_len={len(self._buffer)}')
+            if debug:
+                _logger.debug(f'Found next frame: 0x{view[read:read + 8].hex()}..., buffer_len={write - read}')
 
             # check that the current frame isn't invalid / weirdly truncated
-            next_frame_start_offset = self._buffer.find(HEADER_START_MARKER, 1)
-            if 0 < next_frame_start_offset < 18:
+            next_frame_start = buffer.find(HEADER_START_MARKER, read + 1, min(write, read + 18 + 3))
+            if 0 < next_frame_start - read < 18:
                 _logger.error(
                     'Next frame start found implausibly near, current frame likely corrupt/invalid. '
-                    f'Skipping forward {next_frame_start_offset}b. '
-                    f'Buffer={len(self._buffer)}b: 0x{self._buffer.hex()}'
+                    f'Skipping forward {next_frame_start - read}b. '
+                    f'Buffer={write - read}b: 0x{view[read:write].hex()}'
                 )
-                self._buffer = self._buffer[next_frame_start_offset:]
+                self._read = next_frame_start
+                self.bytes_discarded += next_frame_start - read
+                self.resyncs += 1
                 continue
 
             # sanity check the rest of the MBAP header
-            hdr_len, u_id, f_id = int.from_bytes(self._buffer[4:6], byteorder='big'), self._buffer[6], self._buffer[7]
+            hdr_len, u_id, f_id = (buffer[read + 4] << 8) | buffer[read + 5], buffer[read + 6], buffer[read + 7]
             if hdr_len > 300 or u_id not in (0, 1) or f_id not in (1, 2):
                 _logger.warning(
                     f'Unexpected header values found (len={hdr_len:04x}, u_id={u_id:02x}, f_id={f_id:02x}), '
                     f'discarding candidate frame and resuming search'
                 )
-                self._buffer = self._buffer[4:]
+                self._read = read + 4
+                self.bytes_discarded += 4
+                self.resyncs += 1
                 continue
 
             # Calculate how many bytes is needed to read the current frame completely and await more data if necessary
             frame_len = 6 + hdr_len
-            if len(self._buffer) < frame_len:
-                _logger.debug(
-                    f'Buffer ({len(self._buffer)}b) insufficient for frame of length {frame_len}b, await more data'
-                )
+            if write - read < frame_len:
+                self._awaiting = frame_len
+                if debug:
+                    _logger.debug(
+                        f'Buffer ({write - read}b) insufficient for frame of length {frame_len}b, await more data'
+                    )
                 break
 
             # Extract the frame and try to decode it
-            frame = self._buffer[:frame_len]
-            self._buffer = self._buffer[frame_len:]
+            self._read = read + frame_len
+            if self._read == self._write:
+                # buffer fully drained: rewind the cursors so the next read lands at the start again
+                self._read = self._write = 0
             try:
-                yield self.pdu_class.decode_bytes(frame)
+                message = self.pdu_class.decode_bytes(view[read : read + frame_len])
             except (InvalidPduState, InvalidFrame) as e:
+                self.decode_errors += 1
                 yield e
+            else:
+                self.frames += 1
+                yield message
 
 
 class ClientFramer(Framer):
     """Framer implementation for client-side use."""
 
-    def __init__(self):
+    def __init__(self, buffer_size: int = 4096) -> None:
+        super().__init__(buffer_size)
         self.pdu_class = ClientIncomingMessage
 
 
 class ServerFramer(Framer):
     """Framer implementation for server-side use."""
 
-    def __init__(self):
+    def __init__(self, buffer_size: int = 4096) -> None:
+        super().__init__(buffer_size)
         self.pdu_class = ServerIncomingMessage
@@ -1,11 +1,23 @@
+from dataclasses import dataclass
 import logging
-from typing import Any
+import time
+from typing import Any, Optional, Union
+
+try:
+    from pydantic.v1 import PrivateAttr, ValidationError
+except ImportError:
+    from pydantic import PrivateAttr, ValidationError
 
 from custom_components.givenergy_local.givenergy_modbus.model import GivEnergyBaseModel
 from custom_components.givenergy_local.givenergy_modbus.model.battery import Battery
 from custom_components.givenergy_local.givenergy_modbus.model.inverter import Inverter
-from custom_components.givenergy_local.givenergy_modbus.model.register import HR, IR
+from custom_components.givenergy_local.givenergy_modbus.model.register import (
+    HR,
+    IR,
+    Register,
+)
 from custom_components.givenergy_local.givenergy_modbus.model.register_cache import (
+    ArrayRegisterCache,
     RegisterCache,
 )
 from custom_components.givenergy_local.givenergy_modbus.pdu import (
@@ -15,20 +27,74 @@ from custom_components.givenergy_local.givenergy_modbus.pdu import (
     ReadInputRegistersResponse,
     TransparentResponse,
     WriteHoldingRegisterResponse,
+    WriteHoldingRegistersResponse,
 )
 
 _logger = logging.getLogger(__name__)
 
 
+def canonical_slave_address(slave_address: int) -> int:
+    """Map cloud and mobile app slave addresses to the "normal" inverter address."""
+    return 0x32 if slave_address in (0x11, 0x00) else slave_address
+
+
+@dataclass
+class RegisterDelta:
+    """Registers changed by applying one response to a plant."""
+
+    slave_address: int
+    # register -> (old value, or None if not seen before; new value)
+    changes: dict[Register, tuple[Optional[int], int]]
+    received_at: float
+
+    def merge(self, later: "RegisterDelta") -> None:
+        """Fold a later delta for the same slave address into this one."""
+        for register, (old, new) in later.changes.items():
+            if register in self.changes:
+                old = self.changes[register][0]
+            self.changes[register] = (old, new)
+        self.received_at = later.received_at
+
+
+class ModelMemo:
+    """A model derived from a register cache, and what is needed to bring it up to date incrementally."""
+
+    __slots__ = (
+        "register_cache",
+        "version",
+        "model",
+        "fields",
+        "changed_fields",
+        "dirty_registers",
+        "tracked_version",
+    )
+
+    def __init__(self, register_cache: Any, model: Any) -> None:
+        self.register_cache = register_cache
+        self.version = register_cache.version
+        self.model = model
+        self.fields = dict(model.__dict__)
+        self.changed_fields: frozenset[str] = frozenset(self.fields)
+        # registers changed by Plant.update() since the model was built
+        self.dirty_registers: set[Register] = set()
+        # the cache version those changes bring it to; if the cache was modified any other way, it will differ
+        self.tracked_version = self.version
+
+
 class Plant(GivEnergyBaseModel):
     """Representation of a complete GivEnergy plant."""
 
-    register_caches: dict[int, RegisterCache] = {}
+    # ArrayRegisterCache first, or pydantic would coerce it into a RegisterCache-typed plain dict
+    register_caches: dict[int, Union[ArrayRegisterCache, RegisterCache]] = {}
+    # keep register values in array-backed caches instead of dicts
+    array_register_caches: bool = False
     additional_holding_registers: list[int] = []
     inverter_serial_number: str = ""
     data_adapter_serial_number: str = ""
     number_batteries: int = 0
 
+    _models: dict[tuple[type, int], ModelMemo] = PrivateAttr(default_factory=dict)
+
     class Config:  # noqa: D106
         allow_mutation = True
         frozen = False
@@ -36,51 +102,134 @@ class Plant(GivEnergyBaseModel):
     def __init__(self, **data: Any) -> None:
         super().__init__(**data)
         if not self.register_caches:
-            self.register_caches = {0x32: RegisterCache()}
+            self.register_caches = {0x32: self._new_register_cache()}
+
+    def _model(self, model_class, slave_address: int):
+        """Build a model from a slave's register cache, or reuse the last one if the cache has not changed since.
 
-    def update(self, pdu: ClientIncomingMessage):
-        """Update the Plant state from a PDU message."""
+        When the cache has only been changed by `update()`, just the fields derived from the changed registers are
+        recomputed. Models are shared between callers, so treat them as read-only."""
+        register_cache = self.register_caches[slave_address]
+        key = (model_class, slave_address)
+        memo = self._models.get(key)
+        if memo is None or memo.register_cache is not register_cache:
+            memo = self._models[key] = ModelMemo(
+                register_cache, model_class.from_orm(register_cache)
+            )
+            return memo.model
+        if memo.version == register_cache.version:
+            return memo.model
+
+        if memo.tracked_version == register_cache.version:
+            fields, recomputed = self._recompute_fields(model_class, memo)
+        else:
+            fields = dict(model_class.from_orm(register_cache).__dict__)
+            recomputed = fields.keys()
+        memo.changed_fields = frozenset(
+            k for k in recomputed if memo.fields.get(k) != fields[k]
+        )
+        memo.model = model_class.construct(**fields)
+        memo.fields = fields
+        memo.version = memo.tracked_version = register_cache.version
+        memo.dirty_registers = set()
+        return memo.model
+
+    @staticmethod
+    def _recompute_fields(
+        model_class, memo: ModelMemo
+    ) -> tuple[dict[str, Any], set[str]]:
+        """The memo's fields with those depending on its dirty registers derived and validated afresh, and their names."""
+        getter = model_class.__config__.getter_dict
+        fields = dict(memo.fields)
+        recomputed = getter.fields_depending_on(memo.dirty_registers)
+        for name in recomputed:
+            value, errors = model_class.__fields__[name].validate(
+                getter.ACCESSORS[name](memo.register_cache),
+                fields,
+                loc=name,
+                cls=model_class,
+            )
+            if errors:
+                raise ValidationError([errors], model_class)
+            fields[name] = value
+        return fields, recomputed
+
+    def changed_fields(
+        self, model_class: type = Inverter, slave_address: int = 0x32
+    ) -> frozenset[str]:
+        """Names of the fields that changed value when a model was last brought up to date.
+
+        All of them when the model was first built, and none if it has not been built yet."""
+        memo = self._models.get((model_class, slave_address))
+        return memo.changed_fields if memo else frozenset()
+
+    def _new_register_cache(self) -> Union[ArrayRegisterCache, RegisterCache]:
+        if self.array_register_caches:
+            return ArrayRegisterCache()
+        return RegisterCache()
+
+    def update(self, pdu: ClientIncomingMessage) -> Optional[RegisterDelta]:
+        """Update the Plant state from a PDU message.
+
+        Returns the registers whose values changed as a result, or None if the message was ignored."""
         if not isinstance(pdu, TransparentResponse):
             _logger.debug(f"Ignoring non-Transparent response {pdu}")
-            return
+            return None
         if isinstance(pdu, NullResponse):
             _logger.debug(f"Ignoring Null response {pdu}")
-            return
+            return None
         if pdu.error:
             _logger.debug(f"Ignoring error response {pdu}")
-            return
+            return None
         _logger.debug(f"Handling {pdu}")
 
-        if pdu.slave_address in (0x11, 0x00):
-            # rewrite cloud and mobile app responses to "normal" inverter address
-            slave_address = 0x32
-        else:
-            slave_address = pdu.slave_address
+        # rewrite cloud and mobile app responses to "normal" inverter address
+        slave_address = canonical_slave_address(pdu.slave_address)
 
         if slave_address not in self.register_caches:
             _logger.debug(
                 f"First time encountering slave address 0x{slave_address:02x}"
             )
-            self.register_caches[slave_address] = RegisterCache()
+            self.register_caches[slave_address] = self._new_register_cache()
 
         self.inverter_serial_number = pdu.inverter_serial_number
         self.data_adapter_serial_number = pdu.data_adapter_serial_number
 
+        register_class: type[Register]
         if isinstance(pdu, ReadHoldingRegistersResponse):
-            self.register_caches[slave_address].update(
-                {HR(k): v for k, v in pdu.to_dict().items()}
-            )
+            register_class, base_register = HR, pdu.base_register
+            values = pdu.register_values
         elif isinstance(pdu, ReadInputRegistersResponse):
-            self.register_caches[slave_address].update(
-                {IR(k): v for k, v in pdu.to_dict().items()}
-            )
+            register_class, base_register = IR, pdu.base_register
+            values = pdu.register_values
         elif isinstance(pdu, WriteHoldingRegisterResponse):
             if pdu.register == 0:
                 _logger.warning(f"Ignoring, likely corrupt: {pdu}")
-            else:
-                self.register_caches[slave_address].update(
-                    {HR(pdu.register): pdu.value}
-                )
+                return None
+            register_class, base_register = HR, pdu.register
+            values = [pdu.value]
+        elif isinstance(pdu, WriteHoldingRegistersResponse):
+            if not pdu.register_values:
+                # the response alone does not say what was written
+                return None
+            register_class, base_register = HR, pdu.base_register
+            values = pdu.register_values
+        else:
+            return None
+
+        register_cache = self.register_caches[slave_address]
+        version = register_cache.version
+        changes = register_cache.update_block(register_class, base_register, values)
+        if changes:
+            for (_, memo_slave_address), memo in self._models.items():
+                if (
+                    memo_slave_address == slave_address
+                    and memo.register_cache is register_cache
+                    and memo.tracked_version == version
+                ):
+                    memo.dirty_registers.update(changes)
+                    memo.tracked_version = register_cache.version
+        return RegisterDelta(slave_address, changes, time.time())
 
     def detect_batteries(self) -> None:
         """Determine the number of batteries based on whether the register data is valid.
@@ -91,7 +240,7 @@ class Plant(GivEnergyBaseModel):
         i = 0
         for i in range(6):
             try:
-                assert Battery.from_orm(self.register_caches[i + 0x32]).is_valid()
+                assert self._model(Battery, i + 0x32).is_valid()
             except (KeyError, AssertionError):
                 break
         self.number_batteries = i
@@ -99,12 +248,9 @@ class Plant(GivEnergyBaseModel):
     @property
     def inverter(self) -> Inverter:
         """Return Inverter model for the Plant."""
-        return Inverter.from_orm(self.register_caches[0x32])
+        return self._model(Inverter, 0x32)
 
     @property
     def batteries(self) -> list[Battery]:
         """Return Battery models for the Plant."""
-        return [
-            Battery.from_orm(self.register_caches[i + 0x32])
-            for i in range(self.number_batteries)
-        ]
+        return [self._model(Battery, i + 0x32) for i in range(self.number_batteries)]
@@ -0,0 +1,42 @@
+import time
+from typing import Optional
+
+from custom_components.givenergy_local.givenergy_modbus.model import GivEnergyBaseModel
+from custom_components.givenergy_local.givenergy_modbus.model.inverter import (
+    Generation,
+    Model,
+)
+from custom_components.givenergy_local.givenergy_modbus.model.plant import Plant
+
+
+class PlantProfile(GivEnergyBaseModel):
+    """Capabilities of a plant, as found by `Client.detect_plant`.
+
+    Detection takes several full refreshes and probes that time out on unsupported devices, so a profile can be
+    persisted (`dict()` is JSON serialisable and `parse_obj` reads it back) and handed to `Client.load_profile` on
+    later connections instead. The inverter serial number identifies which plant a profile belongs to.
+    """
+
+    inverter_serial_number: str
+    model: Model
+    generation: Generation
+    number_batteries: int
+    additional_holding_registers: list[int] = []
+    detected_at: float = 0.0
+
+    @classmethod
+    def from_plant(cls, plant: Plant, detected_at: Optional[float] = None):
+        """Capture the capabilities of a plant that has just been detected."""
+        inverter = plant.inverter
+        return cls(
+            inverter_serial_number=plant.inverter_serial_number,
+            model=inverter.model,
+            generation=inverter.generation,
+            number_batteries=plant.number_batteries,
+            additional_holding_registers=list(plant.additional_holding_registers),
+            detected_at=time.time() if detected_at is None else detected_at,
+        )
+
+    def is_stale(self, max_age: float, now: Optional[float] = None) -> bool:
+        """Whether the profile was detected more than `max_age` seconds ago."""
+        return (time.time() if now is None else now) - self.detected_at > max_age
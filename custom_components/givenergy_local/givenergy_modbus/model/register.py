@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from json import JSONEncoder
 import math
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Iterable, Optional, Union
 
 try:
     from pydantic.v1.utils import GetterDict
@@ -158,43 +158,124 @@ class RegisterDefinition:
         return hash(self.registers)
 
 
+# Converters simple enough to be inlined into compiled accessors, as source taking the source of their arguments.
+# Only valid where every argument is known not to be None.
+_INLINE_CONVERTERS: dict[Callable, Callable[..., str]] = {
+    Converter.uint16: lambda val: f"int({val})",
+    Converter.int16: lambda val: f"({val} - 0x10000 if {val} & 0x8000 else {val})",
+    Converter.duint8: lambda val, idx: f"({val} >> 8)"
+    if idx == 0
+    else f"({val} & 0xFF)",
+    Converter.uint32: lambda high_val, low_val: f"(({high_val} << 16) + {low_val})",
+    Converter.bool: lambda val: f"bool({val})",
+    Converter.hex: lambda val, width=4: f"format({val}, {f'0{width}x'!r})",
+    Converter.milli: lambda val: f"({val} / 1000)",
+    Converter.centi: lambda val: f"({val} / 100)",
+    Converter.deci: lambda val: f"({val} / 10)",
+}
+
+
+def compile_accessor(key: str, definition: RegisterDefinition) -> Callable[[Any], Any]:
+    """Turn a register definition into a function deriving the attribute from a register cache.
+
+    The function is generated from source specialised to the definition, so the register lookups, conversion
+    arguments and `None` checks are all spelled out instead of being interpreted on every call, and the simplest
+    conversions are inlined. It behaves exactly like interpreting the definition: `None` if any source register is
+    missing, and a `ConversionError` if a conversion raises `ValueError`.
+    """
+    namespace: dict[str, Any] = {"ConversionError": ConversionError, "key": key}
+    if None in definition.registers:
+        # a source register that can never be read
+        return lambda register_cache: None
+
+    regs = [f"r{i}" for i in range(len(definition.registers))]
+    namespace.update(zip(map("R{}".format, range(len(regs))), definition.registers))
+    lines = [
+        "def accessor(register_cache):",
+        "    get = register_cache.get",
+        *(f"    r{i} = get(R{i})" for i in range(len(regs))),
+        f"    if {' or '.join(f'{r} is None' for r in regs)}:",
+        "        return None",
+        "    try:",
+    ]
+
+    def call(
+        name: str, conv: Union[Callable, tuple], first_args: list[str], inline: bool
+    ) -> tuple[str, bool]:
+        """Source for a conversion, and whether it was inlined."""
+        func, args = (conv[0], conv[1:]) if isinstance(conv, tuple) else (conv, ())
+        if inline and func in _INLINE_CONVERTERS:
+            return _INLINE_CONVERTERS[func](*first_args, *args), True
+        namespace[name] = func
+        extra = [f"{name}_{i}" for i in range(len(args))]
+        namespace.update(zip(extra, args))
+        return f"{name}({', '.join(first_args + extra)})", False
+
+    inlined = False
+    if definition.pre_conv:
+        val, inlined = call("pre", definition.pre_conv, regs, inline=True)
+    else:
+        val = f"[{', '.join(regs)}]"
+    if definition.post_conv:
+        # the result of a pre-conversion is only known not to be None if it was one of the inlined ones
+        val, _ = call("post", definition.post_conv, [val], inline=inlined)
+    lines += [
+        f"        return {val}",
+        "    except ValueError as err:",
+        f"        raise ConversionError(key, [{', '.join(regs)}], str(err)) from err",
+    ]
+    exec("\n".join(lines), namespace)  # nosec B102 - source built from REGISTER_LUT only
+    accessor = namespace["accessor"]
+    accessor.__name__ = accessor.__qualname__ = f"get_{key}"
+    return accessor
+
+
 class RegisterGetter(GetterDict):
-    """Specifies how device attributes are derived from raw register values."""
+    """Specifies how device attributes are derived from raw register values.
+
+    Subclasses have their REGISTER_LUT compiled into ACCESSORS, one function per attribute, and indexed into
+    DEPENDENT_FIELDS, the attributes derived from each register, when they are defined."""
 
     REGISTER_LUT: dict[str, RegisterDefinition]
+    ACCESSORS: dict[str, Callable[[Any], Any]]
+    DEPENDENT_FIELDS: dict["Register", tuple[str, ...]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.ACCESSORS = {
+            key: compile_accessor(key, definition)
+            for key, definition in cls.REGISTER_LUT.items()
+        }
+        dependents: dict[Register, list[str]] = {}
+        for key, definition in cls.REGISTER_LUT.items():
+            for register in definition.registers:
+                if register is not None:
+                    dependents.setdefault(register, []).append(key)
+        cls.DEPENDENT_FIELDS = {k: tuple(v) for k, v in dependents.items()}
 
     def get(self, key: str, default: Any = None) -> Any:
         """Return a named register's value, after pre- and post-conversion."""
         try:
-            r = self.REGISTER_LUT[key]
+            accessor = self.ACCESSORS[key]
         except KeyError:
             return default
+        return accessor(self._obj)
 
-        regs = [self._obj.get(r) for r in r.registers]
-
-        if None in regs:
-            return None
-
-        try:
-            if r.pre_conv:
-                if isinstance(r.pre_conv, tuple):
-                    args = regs + list(r.pre_conv[1:])
-                    val = r.pre_conv[0](*args)
-                else:
-                    val = r.pre_conv(*regs)
-            else:
-                val = regs
+    @classmethod
+    def decode(cls, register_cache: Any) -> dict[str, Any]:
+        """Derive every attribute from a register cache at once."""
+        return {
+            key: accessor(register_cache) for key, accessor in cls.ACCESSORS.items()
+        }
 
-            if r.post_conv:
-                if isinstance(r.post_conv, tuple):
-                    return r.post_conv[0](val, *r.post_conv[1:])
-                else:
-                    if not isinstance(r.post_conv, Callable):  # type: ignore[arg-type]
-                        pass
-                    return r.post_conv(val)
-            return val
-        except ValueError as err:
-            raise ConversionError(key, regs, str(err)) from err
+    @classmethod
+    def fields_depending_on(cls, registers: Iterable["Register"]) -> set[str]:
+        """Names of the attributes derived from any of the given registers."""
+        fields: set[str] = set()
+        dependents = cls.DEPENDENT_FIELDS
+        for register in registers:
+            fields.update(dependents.get(register, ()))
+        return fields
 
     @classmethod
     def to_fields(cls) -> dict[str, tuple[Any, None]]:
@@ -243,40 +324,55 @@ class RegisterEncoder(JSONEncoder):
 
 
 class Register:
-    """Register base class."""
+    """Register base class.
+
+    Registers are flyweights: there is only ever one instance per type and index, so equality and hashing are by
+    identity, and looking a register up costs no allocation or tuple hashing.
+    """
+
+    __slots__ = ("_idx",)
 
     TYPE_HOLDING = "HR"
     TYPE_INPUT = "IR"
 
     _type: str
     _idx: int
+    _interned: dict[int, "Register"]
 
-    def __init__(self, idx):
-        self._idx = idx
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._interned = {}
+
+    def __new__(cls, idx: int) -> "Register":
+        try:
+            return cls._interned[idx]
+        except KeyError:
+            pass
+        register = super().__new__(cls)
+        register._idx = idx
+        return cls._interned.setdefault(idx, register)
+
+    def __reduce__(self):
+        # unpickled and copied registers are interned too
+        return type(self), (self._idx,)
 
     def __str__(self):
         return "%s_%d" % (self._type, int(self._idx))
 
     __repr__ = __str__
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, Register)
-            and self._type == other._type
-            and self._idx == other._idx
-        )
-
-    def __hash__(self):
-        return hash((self._type, self._idx))
-
 
 class HR(Register):
     """Holding Register."""
 
+    __slots__ = ()
+
     _type = Register.TYPE_HOLDING
 
 
 class IR(Register):
     """Input Register."""
 
+    __slots__ = ()
+
     _type = Register.TYPE_INPUT
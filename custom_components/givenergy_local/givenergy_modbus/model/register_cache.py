@@ -1,6 +1,9 @@
+from array import array
+from collections.abc import MutableMapping
 import datetime
 import json
-from typing import TYPE_CHECKING, DefaultDict, Optional
+import time
+from typing import TYPE_CHECKING, Callable, DefaultDict, Iterator, Optional, Sequence
 
 from custom_components.givenergy_local.givenergy_modbus.model.register import (
     HR,
@@ -13,12 +16,54 @@ if TYPE_CHECKING:
 
 
 class RegisterCache(DefaultDict[Register, int]):
-    """Holds a cache of Registers populated after querying a device."""
+    """Holds a cache of Registers populated after querying a device.
+
+    `version` is bumped whenever the cache is modified, so anything derived from it can be reused until it changes.
+    """
+
+    # a class default, as copies made through defaultdict's pickling support do not carry instance attributes over
+    version = 0
 
     def __init__(self, registers: Optional[dict[Register, int]] = None) -> None:
         if registers is None:
             registers = {}
         super().__init__(lambda: 0, registers)
+        self.version = 0
+
+    def __setitem__(self, register: Register, value: int) -> None:
+        # also reached when indexing inserts the default for a missing register
+        super().__setitem__(register, value)
+        self.version += 1
+
+    def __delitem__(self, register: Register) -> None:
+        super().__delitem__(register)
+        self.version += 1
+
+    def update(self, *args, **kwargs) -> None:
+        """Update registers like `dict.update()`."""
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def setdefault(self, register: Register, default: int = 0) -> int:  # type: ignore[override]
+        """Like `dict.setdefault()`."""
+        if register not in self:
+            self[register] = default
+        return self[register]
+
+    def pop(self, *args):  # type: ignore[override]
+        """Like `dict.pop()`."""
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self) -> tuple[Register, int]:
+        """Like `dict.popitem()`."""
+        self.version += 1
+        return super().popitem()
+
+    def clear(self) -> None:
+        """Like `dict.clear()`."""
+        super().clear()
+        self.version += 1
 
     def json(self) -> str:
         """Return JSON representation of the register cache, to mirror `from_json()`."""  # noqa: D402,D202,E501
@@ -49,6 +94,19 @@ class RegisterCache(DefaultDict[Register, int]):
 
         return cls(registers=(json.loads(data, object_hook=register_object_hook)))
 
+    def update_block(
+        self, register_class: type[Register], base_register: int, values: Sequence[int]
+    ) -> dict[Register, tuple[Optional[int], int]]:
+        """Set consecutive registers, returning the ones that changed as (old value or None, new value)."""
+        changes = {}
+        for idx, value in enumerate(values, start=base_register):
+            register = register_class(idx)
+            old = self.get(register)
+            if old != value:
+                changes[register] = (old, value)
+                self[register] = value
+        return changes
+
     # helper methods to convert register data types
 
     def to_string(self, *registers: Register) -> str:
@@ -98,3 +156,141 @@ class RegisterCache(DefaultDict[Register, int]):
         from custom_components.givenergy_local.givenergy_modbus.model import TimeSlot
 
         return TimeSlot.from_repr(self[start], self[end])
+
+
+class ArrayRegisterCache(MutableMapping):
+    """Register cache that keeps each register bank in an `array('H')` indexed by register number.
+
+    Alongside the values, every bank has a validity bitmap and the time each register was last written, so registers
+    that were never read are absent rather than 0: indexing them raises KeyError, `get()` returns the default and
+    iteration skips them. `update_block()` applies a whole response as slice assignments instead of one dict insertion
+    per register, and hashes nothing. Like `RegisterCache`, it has a `version` that modifications bump.
+    """
+
+    _REGISTER_CLASSES = {HR._type: HR, IR._type: IR}
+
+    def __init__(
+        self,
+        registers: Optional[dict[Register, int]] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.clock = clock
+        self._values = {t: array("H") for t in self._REGISTER_CLASSES}
+        self._valid = {t: bytearray() for t in self._REGISTER_CLASSES}
+        self._updated_at = {t: array("d") for t in self._REGISTER_CLASSES}
+        self._count = 0
+        self.version = 0
+        if registers:
+            self.update(registers)
+
+    @classmethod
+    def __get_validators__(cls):
+        # stop pydantic from copying the cache into a plain dict when it is given to Plant
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: "ArrayRegisterCache") -> "ArrayRegisterCache":
+        """Accept only instances, as they are."""
+        if not isinstance(value, cls):
+            raise TypeError(f"{cls.__name__} required")
+        return value
+
+    def _reserve(self, bank: str, size: int) -> None:
+        """Grow a bank to hold at least `size` registers."""
+        missing = size - len(self._valid[bank])
+        if missing > 0:
+            self._values[bank].frombytes(bytes(2 * missing))
+            self._valid[bank].extend(bytes(missing))
+            self._updated_at[bank].frombytes(bytes(8 * missing))
+
+    def __getitem__(self, register: Register) -> int:
+        valid = self._valid.get(register._type)
+        idx = register._idx
+        if valid is None or idx >= len(valid) or not valid[idx]:
+            raise KeyError(register)
+        return self._values[register._type][idx]
+
+    def get(self, register: Register, default: Optional[int] = None) -> Optional[int]:  # type: ignore[override]
+        """Return a register's value, or `default` if it was never read."""
+        try:
+            bank, idx = register._type, register._idx
+            if self._valid[bank][idx]:
+                return self._values[bank][idx]
+        except IndexError:
+            pass
+        except AttributeError:
+            # not a register, like the None in i_battery's definition, which dict.get() allows
+            pass
+        return default
+
+    def __contains__(self, register: object) -> bool:
+        return self.get(register) is not None  # type: ignore[arg-type]
+
+    def __setitem__(self, register: Register, value: int) -> None:
+        bank, idx = register._type, register._idx
+        self._reserve(bank, idx + 1)
+        if not self._valid[bank][idx]:
+            self._valid[bank][idx] = 1
+            self._count += 1
+        self._values[bank][idx] = value
+        self._updated_at[bank][idx] = self.clock()
+        self.version += 1
+
+    def __delitem__(self, register: Register) -> None:
+        if register not in self:
+            raise KeyError(register)
+        self._valid[register._type][register._idx] = 0
+        self._count -= 1
+        self.version += 1
+
+    def __iter__(self) -> Iterator[Register]:
+        for bank, valid in self._valid.items():
+            register_class = self._REGISTER_CLASSES[bank]
+            idx = valid.find(1)
+            while idx >= 0:
+                yield register_class(idx)
+                idx = valid.find(1, idx + 1)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())})"
+
+    def updated_at(self, register: Register) -> Optional[float]:
+        """When a register was last written, by `clock`, or None if it never was."""
+        if register not in self:
+            return None
+        return self._updated_at[register._type][register._idx]
+
+    def update_block(
+        self, register_class: type[Register], base_register: int, values: Sequence[int]
+    ) -> dict[Register, tuple[Optional[int], int]]:
+        """Set consecutive registers, returning the ones that changed as (old value or None, new value)."""
+        bank = register_class._type
+        end = base_register + len(values)
+        self._reserve(bank, end)
+        new_values = array("H", values)
+        old_values = self._values[bank][base_register:end]
+        old_valid = self._valid[bank][base_register:end]
+        previously_valid = old_valid.count(1)
+
+        changes: dict[Register, tuple[Optional[int], int]] = {}
+        if old_values != new_values or previously_valid != len(values):
+            for i, (old, new, valid) in enumerate(
+                zip(old_values, new_values, old_valid)
+            ):
+                if not valid:
+                    changes[register_class(base_register + i)] = (None, new)
+                elif old != new:
+                    changes[register_class(base_register + i)] = (old, new)
+
+        self._values[bank][base_register:end] = new_values
+        self._valid[bank][base_register:end] = b"\x01" * len(values)
+        self._updated_at[bank][base_register:end] = array("d", [self.clock()]) * len(
+            values
+        )
+        self._count += len(values) - previously_valid
+        if changes:
+            self.version += 1
+        return changes
@@ -37,6 +37,9 @@ from custom_components.givenergy_local.givenergy_modbus.pdu.write_registers impo
     WriteHoldingRegister,
     WriteHoldingRegisterRequest,
     WriteHoldingRegisterResponse,
+    WriteHoldingRegisters,
+    WriteHoldingRegistersRequest,
+    WriteHoldingRegistersResponse,
 )
 
 __all__ = [
@@ -67,4 +70,7 @@ __all__ = [
     "WriteHoldingRegister",
     "WriteHoldingRegisterRequest",
     "WriteHoldingRegisterResponse",
+    "WriteHoldingRegisters",
+    "WriteHoldingRegistersRequest",
+    "WriteHoldingRegistersResponse",
 ]
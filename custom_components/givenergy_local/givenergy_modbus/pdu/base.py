@@ -60,17 +60,21 @@ class BasePDU(ABC):
         return self.raw_frame
 
     @classmethod
-    def decode_bytes(cls, data: bytes) -> "BasePDU":
-        """Decode raw byte frame to populated PDU instance."""
+    def decode_bytes(cls, data: bytes | memoryview) -> "BasePDU":
+        """Decode raw byte frame to populated PDU instance.
+
+        `data` may be a view over the framer's receive buffer, which gets reused once framing moves on. Decoding
+        reads straight from it, and only the finished PDU's `raw_frame` is materialised as an independent copy.
+        """
         decoder = PayloadDecoder(data)
 
         t_id = decoder.decode_16bit_uint()
         if t_id != 0x5959:
-            raise InvalidFrame(f"Transaction ID 0x{t_id:04x} != 0x5959", data)
+            raise InvalidFrame(f"Transaction ID 0x{t_id:04x} != 0x5959", bytes(data))
 
         p_id = decoder.decode_16bit_uint()
         if p_id != 0x0001:
-            raise InvalidFrame(f"Protocol ID 0x{p_id:04x} != 0x0001", data)
+            raise InvalidFrame(f"Protocol ID 0x{p_id:04x} != 0x0001", bytes(data))
 
         header_len = decoder.decode_16bit_uint()
         remaining_frame_len = (
@@ -79,19 +83,19 @@ class BasePDU(ABC):
         if header_len != remaining_frame_len:
             raise InvalidFrame(
                 f"Header length {header_len} != remaining frame length {remaining_frame_len}",
-                data,
+                bytes(data),
             )
 
         u_id = decoder.decode_8bit_uint()
         if u_id not in (0x00, 0x01):
-            raise InvalidFrame(f"Unit ID 0x{u_id:02x} != 0x00/0x01", data)
+            raise InvalidFrame(f"Unit ID 0x{u_id:02x} != 0x00/0x01", bytes(data))
 
         function_code = decoder.decode_8bit_uint()
         decoder_class = cls.lookup_main_function_decoder(function_code)
 
         try:
             pdu = decoder_class.decode_main_function(decoder)
-            pdu.raw_frame = data
+            pdu.raw_frame = bytes(data)
             pdu.ensure_valid_state()
         except InvalidPduState:
             raise
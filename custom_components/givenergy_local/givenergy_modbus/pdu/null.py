@@ -35,7 +35,7 @@ class NullResponse(TransparentResponse):
             _logger.warning(
                 f"remaining bytes: {decoder.remaining_bytes}b 0x{decoder.remaining_payload.hex()} attrs: {attrs}"
             )
-        attrs["nulls"] = [decoder.decode_16bit_uint() for _ in range(62)]
+        attrs["nulls"] = list(decoder.decode_16bit_uint_array(62))
         attrs["check"] = decoder.decode_16bit_uint()
         return cls(**attrs)
 
@@ -1,9 +1,11 @@
 import logging
+import struct
 from abc import ABC
 
-from custom_components.givenergy_local.givenergy_modbus.codec import (
-    PayloadDecoder,
-    PayloadEncoder,
+from custom_components.givenergy_local.givenergy_modbus.codec import PayloadDecoder
+from custom_components.givenergy_local.givenergy_modbus.crc import (
+    crc16_modbus,
+    crc16_modbus_check,
 )
 from custom_components.givenergy_local.givenergy_modbus.exceptions import (
     InvalidPduState,
@@ -35,9 +37,9 @@ class ReadRegistersMessage(TransparentMessage, ABC):
         attrs["base_register"] = decoder.decode_16bit_uint()
         attrs["register_count"] = decoder.decode_16bit_uint()
         if issubclass(cls, ReadRegistersResponse) and not attrs.get("error", False):
-            attrs["register_values"] = [
-                decoder.decode_16bit_uint() for _ in range(attrs["register_count"])
-            ]
+            attrs["register_values"] = list(
+                decoder.decode_16bit_uint_array(attrs["register_count"])
+            )
         attrs["check"] = decoder.decode_16bit_uint()
         return cls(**attrs)
 
@@ -69,13 +71,17 @@ class ReadRegistersRequest(ReadRegistersMessage, TransparentRequest, ABC):
         self._update_check_code()
 
     def _update_check_code(self):
-        crc_builder = PayloadEncoder()
-        crc_builder.add_8bit_uint(self.slave_address)
-        crc_builder.add_8bit_uint(self.transparent_function_code)
-        crc_builder.add_16bit_uint(self.base_register)
-        crc_builder.add_16bit_uint(self.register_count)
-        self.check = crc_builder.crc
-        self.check = int.from_bytes(self.check.to_bytes(2, "little"), "big")
+        self.check = crc16_modbus_check(
+            crc16_modbus(
+                struct.pack(
+                    ">BBHH",
+                    self.slave_address,
+                    self.transparent_function_code,
+                    self.base_register,
+                    self.register_count,
+                )
+            )
+        )
         self._builder.add_16bit_uint(self.check)
 
     def ensure_valid_state(self):
@@ -123,23 +129,47 @@ class ReadRegistersResponse(ReadRegistersMessage, TransparentResponse, ABC):
                 f"Expected padding 0x{expected_padding:02x}, found 0x{self.padding:02x} instead: {self}"
             )
 
-        crc_builder = PayloadEncoder()
-        crc_builder.add_8bit_uint(self.slave_address)
-        crc_builder.add_8bit_uint(self.transparent_function_code)
-        crc_builder.add_string(
-            self.inverter_serial_number, len(self.inverter_serial_number)
-        )
-        crc_builder.add_16bit_uint(self.base_register)
-        crc_builder.add_16bit_uint(self.register_count)
-        [crc_builder.add_16bit_uint(r) for r in self.register_values]
-        crc = crc_builder.crc
-        crc = int.from_bytes(crc.to_bytes(2, "little"), "big")
-
-        if self.check != crc:
-            raise InvalidPduState(
-                f"supplied CRC 0x{self.check:04x} does not match calculated CRC 0x{crc:04x}",
-                self,
+        if getattr(self, "raw_frame", None) is not None:
+            # only frames off the wire need checking: `_update_check_code()` sets the CRC when encoding
+            crc = self._calculate_check()
+            if self.check != crc:
+                raise InvalidPduState(
+                    f"supplied CRC 0x{self.check:04x} does not match calculated CRC 0x{crc:04x}",
+                    self,
+                )
+
+    def _update_check_code(self):
+        # encode from the fields, which may no longer match any frame this PDU was decoded from
+        if hasattr(self, "raw_frame"):
+            del self.raw_frame
+        self.check = self._calculate_check()
+        self._builder.add_16bit_uint(self.check)
+
+    def _calculate_check(self) -> int:
+        """Calculate the CRC for this response.
+
+        The CRC covers the slave address, the function code (without its error bit), the inverter serial number, the
+        register range and the register values. When this PDU was decoded from the wire, everything after the function
+        code is already contiguous in `raw_frame` and is checked in place; otherwise the fields are packed first.
+        """
+        crc = crc16_modbus(bytes((self.slave_address, self.transparent_function_code)))
+        raw_frame = getattr(self, "raw_frame", None)
+        if raw_frame is not None:
+            # MBAP header (8b), data adapter serial (10b), padding (8b), slave address & function code (2b) precede
+            # the covered fields; the check itself trails the frame
+            crc = crc16_modbus(memoryview(raw_frame)[28:-2], crc)
+        else:
+            crc = crc16_modbus(self.inverter_serial_number.encode("latin1"), crc)
+            crc = crc16_modbus(
+                struct.pack(
+                    f">HH{len(self.register_values)}H",
+                    self.base_register,
+                    self.register_count,
+                    *self.register_values,
+                ),
+                crc,
             )
+        return crc16_modbus_check(crc)
 
     def to_dict(self) -> dict[int, int]:
         """Return the registers as a dict of register_index:value. Accounts for base_register offsets."""
@@ -1,9 +1,11 @@
 import logging
+import struct
 from abc import ABC
 
-from custom_components.givenergy_local.givenergy_modbus.codec import (
-    PayloadDecoder,
-    PayloadEncoder,
+from custom_components.givenergy_local.givenergy_modbus.codec import PayloadDecoder
+from custom_components.givenergy_local.givenergy_modbus.crc import (
+    crc16_modbus,
+    crc16_modbus_check,
 )
 from custom_components.givenergy_local.givenergy_modbus.exceptions import (
     InvalidPduState,
@@ -128,13 +130,17 @@ class WriteHoldingRegisterRequest(WriteHoldingRegister, TransparentRequest):
             raise InvalidPduState(f"HR({self.register}) is not safe to write to", self)
 
     def _update_check_code(self):
-        crc_builder = PayloadEncoder()
-        crc_builder.add_8bit_uint(self.slave_address)
-        crc_builder.add_8bit_uint(self.transparent_function_code)
-        crc_builder.add_16bit_uint(self.register)
-        crc_builder.add_16bit_uint(self.value)
-        self.check = crc_builder.crc
-        self.check = int.from_bytes(self.check.to_bytes(2, "little"), "big")
+        self.check = crc16_modbus_check(
+            crc16_modbus(
+                struct.pack(
+                    ">BBHH",
+                    self.slave_address,
+                    self.transparent_function_code,
+                    self.register,
+                    self.value,
+                )
+            )
+        )
         self._builder.add_16bit_uint(self.check)
 
     def expected_response(self):
@@ -153,4 +159,152 @@ class WriteHoldingRegisterResponse(WriteHoldingRegister, TransparentResponse):
             _logger.warning(f"{self} is not safe for writing")
 
 
+class WriteHoldingRegisters(TransparentMessage, ABC):
+    """Request & Response PDUs for function #16/Write Multiple Holding Registers."""
+
+    transparent_function_code = 0x10
+
+    base_register: int
+    register_count: int
+
+    def __init__(self, **kwargs):
+        kwargs["slave_address"] = kwargs.get("slave_address", 0x11)
+        super().__init__(**kwargs)
+        self.base_register = kwargs.get("base_register", 0)
+        self.register_values: list[int] = [
+            int(v) for v in kwargs.get("register_values", [])
+        ]
+        self.register_count = kwargs.get("register_count", len(self.register_values))
+
+    def _extra_shape_hash_keys(self) -> tuple:
+        return super()._extra_shape_hash_keys() + (
+            self.base_register,
+            self.register_count,
+        )
+
+    def to_dict(self) -> dict[int, int]:
+        """Return the written registers as a dict of register_index:value."""
+        return {
+            k: v for k, v in enumerate(self.register_values, start=self.base_register)
+        }
+
+    def ensure_valid_state(self):
+        """Sanity check our internal state."""
+        super().ensure_valid_state()
+        if self.base_register is None:
+            raise InvalidPduState("Base register must be set", self)
+        if self.register_count is None or not 0 < self.register_count <= 123:
+            raise InvalidPduState("Register count must be in (0,123]", self)
+
+
+class WriteHoldingRegistersRequest(WriteHoldingRegisters, TransparentRequest):
+    """Concrete PDU implementation for handling function #16/Write Multiple Holding Registers request messages.
+
+    Every register in the range must be safe to write to, exactly as for single register writes.
+    """
+
+    def ensure_valid_state(self):
+        """Sanity check our internal state."""
+        super().ensure_valid_state()
+        if self.register_count != len(self.register_values):
+            raise InvalidPduState(
+                f"register_count={self.register_count} but len(register_values)={len(self.register_values)}",
+                self,
+            )
+        for register, value in self.to_dict().items():
+            if register not in WRITE_SAFE_REGISTERS:
+                raise InvalidPduState(f"HR({register}) is not safe to write to", self)
+            if not 0 <= value <= 0xFFFF:
+                raise InvalidPduState(
+                    f"Value {value} for HR({register}) must be an unsigned 16-bit int",
+                    self,
+                )
+
+    def _encode_function_data(self):
+        super()._encode_function_data()
+        self._builder.add_16bit_uint(self.base_register)
+        self._builder.add_16bit_uint(self.register_count)
+        self._builder.add_8bit_uint(2 * self.register_count)
+        for value in self.register_values:
+            self._builder.add_16bit_uint(value)
+        self._update_check_code()
+
+    @classmethod
+    def decode_transparent_function(
+        cls, decoder: PayloadDecoder, **attrs
+    ) -> "WriteHoldingRegistersRequest":
+        attrs["base_register"] = decoder.decode_16bit_uint()
+        attrs["register_count"] = decoder.decode_16bit_uint()
+        decoder.decode_8bit_uint()  # byte count
+        attrs["register_values"] = list(
+            decoder.decode_16bit_uint_array(attrs["register_count"])
+        )
+        attrs["check"] = decoder.decode_16bit_uint()
+        return cls(**attrs)
+
+    def _update_check_code(self):
+        self.check = crc16_modbus_check(
+            crc16_modbus(
+                struct.pack(
+                    f">BBHHB{self.register_count}H",
+                    self.slave_address,
+                    self.transparent_function_code,
+                    self.base_register,
+                    self.register_count,
+                    2 * self.register_count,
+                    *self.register_values,
+                )
+            )
+        )
+        self._builder.add_16bit_uint(self.check)
+
+    def expected_response(self):
+        return WriteHoldingRegistersResponse(
+            base_register=self.base_register,
+            register_count=self.register_count,
+            slave_address=self.slave_address,
+        )
+
+    def split(self) -> list[WriteHoldingRegisterRequest]:
+        """The equivalent single register writes, in register order."""
+        return [
+            WriteHoldingRegisterRequest(
+                register, value, slave_address=self.slave_address
+            )
+            for register, value in self.to_dict().items()
+        ]
+
+
+class WriteHoldingRegistersResponse(WriteHoldingRegisters, TransparentResponse):
+    """Concrete PDU implementation for handling function #16/Write Multiple Holding Registers response messages.
+
+    The response only echoes the register range, so `register_values` stays empty unless the client fills it in from
+    the request it answers.
+    """
+
+    def _encode_function_data(self):
+        super()._encode_function_data()
+        self._builder.add_16bit_uint(self.base_register)
+        self._builder.add_16bit_uint(self.register_count)
+        self._update_check_code()
+
+    @classmethod
+    def decode_transparent_function(
+        cls, decoder: PayloadDecoder, **attrs
+    ) -> "WriteHoldingRegistersResponse":
+        attrs["base_register"] = decoder.decode_16bit_uint()
+        attrs["register_count"] = decoder.decode_16bit_uint()
+        attrs["check"] = decoder.decode_16bit_uint()
+        return cls(**attrs)
+
+    def _update_check_code(self):
+        crc = crc16_modbus(bytes((self.slave_address, self.transparent_function_code)))
+        crc = crc16_modbus(self.inverter_serial_number.encode("latin1"), crc)
+        crc = crc16_modbus(
+            struct.pack(">HH", self.base_register, self.register_count), crc
+        )
+        self.check = crc16_modbus_check(crc)
+        self._builder.add_16bit_uint(self.check)
+
+
 __all__ = ()
@@ -0,0 +1,5 @@
+"""Development tools for the givenergy_modbus library, not shipped with the integration.
+
+Each module is runnable on its own from the repository root, e.g. `python -m devtools.proxy`, or importable from
+tests and benchmarks.
+"""
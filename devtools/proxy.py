@@ -0,0 +1,55 @@
+"""Share one connection to a data adapter between many local clients.
+
+Run from the repository root with e.g. `python -m devtools.proxy 192.168.1.10`, then point the integration, the debug
+CLI and any other tools at the proxy instead of the adapter.
+"""
+
+import argparse
+import asyncio
+import logging
+
+from custom_components.givenergy_local.givenergy_modbus.client.client import Client
+from custom_components.givenergy_local.givenergy_modbus.client.proxy import (
+    InverterProxy,
+)
+
+
+async def main() -> None:
+    """Run a proxy from the command line."""
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("inverter_host", help="Hostname or IP address of the inverter")
+    parser.add_argument("--inverter-port", type=int, default=8899)
+    parser.add_argument("--listen", default="127.0.0.1", help="Address to listen on")
+    parser.add_argument("--port", type=int, default=8899, help="Port to listen on")
+    parser.add_argument(
+        "--max-age",
+        type=float,
+        default=5.0,
+        help="Serve reads from cache if refreshed within this many seconds",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Also log low-level messages"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(
+        format="%(asctime)s %(name)s %(levelname)s %(message)s",
+        level=logging.DEBUG if args.verbose else logging.INFO,
+    )
+
+    proxy = InverterProxy(
+        Client(args.inverter_host, args.inverter_port),
+        host=args.listen,
+        port=args.port,
+        max_age=args.max_age,
+    )
+    try:
+        await proxy.serve_forever()
+    finally:
+        await proxy.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
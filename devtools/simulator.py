@@ -0,0 +1,282 @@
+"""A simulated inverter and data adapter, to exercise clients without hardware."""
+
+import asyncio
+from asyncio import StreamReader, StreamWriter
+from dataclasses import dataclass
+import logging
+import random
+from typing import Dict, Optional
+
+from custom_components.givenergy_local.givenergy_modbus.exceptions import (
+    ExceptionBase,
+)
+from custom_components.givenergy_local.givenergy_modbus.framer import ServerFramer
+from custom_components.givenergy_local.givenergy_modbus.model.plant import (
+    canonical_slave_address,
+)
+from custom_components.givenergy_local.givenergy_modbus.model.register import (
+    HR,
+    IR,
+)
+from custom_components.givenergy_local.givenergy_modbus.model.register_cache import (
+    RegisterCache,
+)
+from custom_components.givenergy_local.givenergy_modbus.pdu import (
+    HeartbeatRequest,
+    HeartbeatResponse,
+    NullResponse,
+    ReadHoldingRegistersRequest,
+    ReadHoldingRegistersResponse,
+    ReadInputRegistersResponse,
+    ReadRegistersRequest,
+    TransparentRequest,
+    TransparentResponse,
+    WriteHoldingRegisterRequest,
+    WriteHoldingRegisterResponse,
+    WriteHoldingRegistersRequest,
+    WriteHoldingRegistersResponse,
+)
+
+_logger = logging.getLogger(__name__)
+
+
+def string_registers(value: str, count: int = 5) -> list[int]:
+    """Pack a string into `count` registers, two characters each."""
+    data = value.encode("latin1").ljust(2 * count, b"\x00")
+    return [int.from_bytes(data[i : i + 2], "big") for i in range(0, 2 * count, 2)]
+
+
+def example_register_caches(
+    number_batteries: int = 1, inverter_serial_number: str = "SA1234G567"
+) -> Dict[int, RegisterCache]:
+    """Register banks for a plausible Gen 1 hybrid inverter with some batteries."""
+    inverter = RegisterCache()
+    for i in range(360):
+        inverter[HR(i)] = 0
+    for i in range(240):
+        inverter[IR(i)] = 0
+    inverter[HR(0)] = 0x2001  # device type code: hybrid
+    inverter.update(
+        zip(map(HR, range(13, 18)), string_registers(inverter_serial_number))
+    )
+    inverter[HR(21)] = 449  # ARM firmware version
+    inverter.update(zip(map(HR, range(35, 41)), (24, 1, 1, 12, 0, 0)))  # system time
+    inverter[IR(22)] = 12345  # grid export total, 0.1kWh
+    inverter[IR(33)] = 23456  # grid import total, 0.1kWh
+    inverter[IR(41)] = 350  # heatsink temperature, 0.1C
+    inverter[IR(46)] = 34567  # inverter output total, 0.1kWh
+    inverter[IR(55)] = 300  # charger temperature, 0.1C
+    inverter[IR(56)] = 200  # battery temperature, 0.1C
+    inverter[IR(59)] = 50  # battery percent
+
+    register_caches = {0x32: inverter}
+    for n in range(number_batteries):
+        # the first battery's BMS answers at the inverter's own slave address
+        battery = register_caches.setdefault(0x32 + n, RegisterCache())
+        battery.update({IR(i): 0 for i in range(60, 120)})
+        battery.update(
+            zip(map(IR, range(110, 115)), string_registers(f"BG1234G{n:03d}"))
+        )
+        battery[IR(98)] = 3005  # BMS firmware version
+    return register_caches
+
+
+@dataclass
+class Faults:
+    """Misbehaviour to inject. Rates are probabilities per request."""
+
+    latency: float = 0.0  # seconds before every response
+    jitter: float = 0.0  # up to this many extra seconds, uniformly distributed
+    fragment_size: int = 0  # write responses in chunks of up to this many bytes, if set
+    garbage: float = 0.0  # random bytes before a response
+    null_responses: float = 0.0  # a NullResponse instead of the real response
+    bad_crc: float = 0.0  # a response with a corrupt CRC
+    timeouts: float = 0.0  # no response at all
+
+
+class SimulatedInverter:
+    """An asyncio TCP server that behaves like a data adapter with an inverter and batteries behind it.
+
+    Reads and writes are served from (and applied to) per-slave register banks, with the cloud and app slave addresses
+    (0x11, 0x00) mapping to the inverter at 0x32 as they do for `Plant`. Battery slave addresses without a register bank
+    answer with zeros, like those of missing batteries do; any other unknown slave address goes unanswered. With
+    `heartbeat_interval` set, every connection gets sent heartbeat requests like a real adapter would. `faults`
+    configures misbehaviour, drawn from a seeded random generator so runs are reproducible.
+    """
+
+    register_caches: Dict[int, RegisterCache]
+
+    def __init__(
+        self,
+        register_caches: Optional[Dict[int, RegisterCache]] = None,
+        inverter_serial_number: str = "SA1234G567",
+        data_adapter_serial_number: str = "WF1234G567",
+        faults: Optional[Faults] = None,
+        heartbeat_interval: Optional[float] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        if register_caches is None:
+            register_caches = example_register_caches(
+                inverter_serial_number=inverter_serial_number
+            )
+        self.register_caches = register_caches
+        self.inverter_serial_number = inverter_serial_number
+        self.data_adapter_serial_number = data_adapter_serial_number
+        self.faults = faults or Faults()
+        self.heartbeat_interval = heartbeat_interval
+        self.rng = random.Random(seed)
+        self.host = "127.0.0.1"
+        self.port = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self.connections = 0
+        self.requests = 0
+        self.responses = 0
+        self.ignored_requests = 0
+        self.null_responses = 0
+        self.corrupted_responses = 0
+        self.heartbeats_sent = 0
+        self.heartbeats_answered = 0
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Start listening; with port 0, pick a free port and record it in `self.port`."""
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        self.host = host
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """Stop listening."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "SimulatedInverter":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def respond(self, request: TransparentRequest) -> Optional[TransparentResponse]:
+        """Serve a request from the register banks, or return None if nothing would answer it."""
+        slave_address = canonical_slave_address(request.slave_address)
+        register_cache = self.register_caches.get(slave_address)
+        if register_cache is None:
+            if not 0x32 <= slave_address <= 0x37:
+                return None
+            # BMS addresses of missing batteries still answer, with all zeros
+            register_cache = RegisterCache()
+        attrs = {
+            "inverter_serial_number": self.inverter_serial_number,
+            "data_adapter_serial_number": self.data_adapter_serial_number,
+            "slave_address": request.slave_address,
+            "padding": 0x8A,
+        }
+        if isinstance(request, ReadRegistersRequest):
+            if isinstance(request, ReadHoldingRegistersRequest):
+                response_class, register_class = ReadHoldingRegistersResponse, HR
+            else:
+                response_class, register_class = ReadInputRegistersResponse, IR
+            registers = range(
+                request.base_register, request.base_register + request.register_count
+            )
+            return response_class(
+                base_register=request.base_register,
+                register_count=request.register_count,
+                register_values=[
+                    register_cache.get(register_class(i), 0) for i in registers
+                ],
+                **attrs,
+            )
+        if isinstance(request, WriteHoldingRegisterRequest):
+            register_cache[HR(request.register)] = request.value
+            return WriteHoldingRegisterResponse(
+                register=request.register, value=request.value, **attrs
+            )
+        if isinstance(request, WriteHoldingRegistersRequest):
+            register_cache.update({HR(k): v for k, v in request.to_dict().items()})
+            return WriteHoldingRegistersResponse(
+                base_register=request.base_register,
+                register_count=request.register_count,
+                **attrs,
+            )
+        return None
+
+    async def _handle_connection(
+        self, reader: StreamReader, writer: StreamWriter
+    ) -> None:
+        self.connections += 1
+        heartbeats = None
+        if self.heartbeat_interval:
+            heartbeats = asyncio.create_task(self._send_heartbeats(writer))
+        framer = ServerFramer()
+        try:
+            while not reader.at_eof():
+                data = await reader.read(300)
+                for message in framer.decode_frames(data):
+                    if isinstance(message, HeartbeatResponse):
+                        self.heartbeats_answered += 1
+                    elif isinstance(message, TransparentRequest):
+                        await self._serve(message, writer)
+                    elif isinstance(message, ExceptionBase):
+                        _logger.debug("Ignoring bad frame: %s", message)
+        except (ConnectionError, OSError) as e:
+            _logger.debug("Connection lost: %s", e)
+        finally:
+            if heartbeats:
+                heartbeats.cancel()
+            writer.close()
+
+    async def _send_heartbeats(self, writer: StreamWriter) -> None:
+        assert self.heartbeat_interval
+        while not writer.is_closing():
+            await asyncio.sleep(self.heartbeat_interval)
+            writer.write(
+                HeartbeatRequest(
+                    data_adapter_serial_number=self.data_adapter_serial_number
+                ).encode()
+            )
+            self.heartbeats_sent += 1
+
+    async def _serve(self, request: TransparentRequest, writer: StreamWriter) -> None:
+        """Answer a request, subject to the configured faults. Requests are served one at a time, as on the bus."""
+        self.requests += 1
+        faults = self.faults
+        rng = self.rng
+        if rng.random() < faults.timeouts:
+            self.ignored_requests += 1
+            return
+        response: Optional[TransparentResponse] = self.respond(request)
+        if response is None:
+            self.ignored_requests += 1
+            return
+        if rng.random() < faults.null_responses:
+            self.null_responses += 1
+            response = NullResponse(
+                inverter_serial_number="\x00" * 10,
+                data_adapter_serial_number=self.data_adapter_serial_number,
+            )
+        frame = response.encode()
+        if rng.random() < faults.bad_crc:
+            self.corrupted_responses += 1
+            frame = frame[:-2] + bytes(b ^ 0xFF for b in frame[-2:])
+        if rng.random() < faults.garbage:
+            frame = bytes(rng.randrange(256) for _ in range(rng.randint(1, 40))) + frame
+
+        delay = faults.latency + rng.uniform(0, faults.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if writer.is_closing():
+            return
+        if faults.fragment_size:
+            i = 0
+            while i < len(frame):
+                size = rng.randint(1, faults.fragment_size)
+                writer.write(frame[i : i + size])
+                await writer.drain()
+                # give the receiving end a chance to read each fragment separately
+                await asyncio.sleep(0)
+                i += size
+        else:
+            writer.write(frame)
+        self.responses += 1
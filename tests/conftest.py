@@ -1,10 +1,21 @@
 """Global fixtures for givenergy_local integration."""
 
 from datetime import time
+from typing import Callable, Iterable, Optional
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from custom_components.givenergy_local.givenergy_modbus.model.plant import (
+    Plant,
+    RegisterDelta,
+)
+from custom_components.givenergy_local.givenergy_modbus.pdu import (
+    ReadHoldingRegistersRequest,
+    ReadInputRegistersRequest,
+)
+from devtools.simulator import SimulatedInverter
+
 pytest_plugins = "pytest_homeassistant_custom_component"
 
 
@@ -81,3 +92,56 @@ def mock_plant_fixture():
         plant_instance.batteries = [battery1, battery2]
 
         yield mock_ge_plant
+
+
+class FakeClock:
+    """A clock that only moves when a test sets `now`."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# A stand-in for time.monotonic, for the trackers, breakers and schedulers that take a clock.
+@pytest.fixture(name="fake_clock")
+def fake_clock_fixture() -> FakeClock:
+    """Provide a clock starting at 0 that tests advance by hand."""
+    return FakeClock()
+
+
+# Feed a plant responses straight from a simulated inverter, without a client or a socket.
+@pytest.fixture(name="refresh_from_simulator")
+def refresh_from_simulator_fixture() -> Callable[..., list[Optional[RegisterDelta]]]:
+    """Provide a function that refreshes a plant from a simulator's register banks and returns the deltas.
+
+    Every 60-register block starting at `holding_blocks` and `input_blocks` is read from each of `slave_addresses`
+    (by default, every slave address the simulator has register banks for) and applied to the plant in turn.
+    """
+
+    def refresh(
+        plant: Plant,
+        inverter: SimulatedInverter,
+        slave_addresses: Optional[Iterable[int]] = None,
+        holding_blocks: Iterable[int] = range(0, 360, 60),
+        input_blocks: Iterable[int] = range(0, 240, 60),
+    ) -> list[Optional[RegisterDelta]]:
+        if slave_addresses is None:
+            slave_addresses = list(inverter.register_caches)
+        deltas = []
+        for slave_address in slave_addresses:
+            for request_class, blocks in (
+                (ReadHoldingRegistersRequest, holding_blocks),
+                (ReadInputRegistersRequest, input_blocks),
+            ):
+                for base_register in blocks:
+                    request = request_class(
+                        slave_address=slave_address,
+                        base_register=base_register,
+                        register_count=60,
+                    )
+                    deltas.append(plant.update(inverter.respond(request)))
+        return deltas
+
+    return refresh
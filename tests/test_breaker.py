@@ -0,0 +1,101 @@
+"""Test circuit breakers for unresponsive register blocks."""
+
+import asyncio
+
+import pytest
+
+from custom_components.givenergy_local.givenergy_modbus.client.breaker import (
+    BreakerState,
+    CircuitBreakers,
+)
+from custom_components.givenergy_local.givenergy_modbus.client.client import Client
+from custom_components.givenergy_local.givenergy_modbus.pdu import (
+    ReadInputRegistersRequest,
+    WriteHoldingRegisterRequest,
+)
+from devtools.simulator import SimulatedInverter
+
+
+def test_breaker_opens_after_repeated_failures_and_probes_when_half_open(fake_clock):
+    """A dead battery is skipped after a few failures, and retried on a backing-off schedule."""
+    breakers = CircuitBreakers(failure_threshold=3, reset_after=30, clock=fake_clock)
+    inverter = ReadInputRegistersRequest(base_register=0, register_count=60)
+    battery = ReadInputRegistersRequest(
+        slave_address=0x33, base_register=60, register_count=60
+    )
+
+    for _ in range(2):
+        breakers.on_failure(battery)
+    assert breakers.failing(battery) and not breakers.failing(inverter)
+    assert breakers.filter([inverter, battery]) == [inverter, battery]
+    breakers.on_failure(battery)
+    assert breakers.state(battery) is BreakerState.OPEN
+    assert breakers.filter([inverter, battery]) == [inverter]
+
+    fake_clock.now = 30
+    assert breakers.filter([battery]) == [battery]
+    assert breakers.state(battery) is BreakerState.HALF_OPEN
+    breakers.on_failure(battery)  # the probe failed too
+    fake_clock.now = 89
+    assert breakers.filter([battery]) == []
+    assert breakers.stats()["blocks"]["0x33/4/60"] == {
+        "state": "open",
+        "failures": 4,
+        "trips": 1,
+        "retry_in": 1,
+    }
+
+    fake_clock.now = 90
+    assert breakers.filter([battery]) == [battery]
+    breakers.on_success(battery)
+    assert breakers.state(battery) is BreakerState.CLOSED
+    assert not breakers.failing(battery)
+    assert breakers.stats()["skipped_requests"] == 2
+
+
+def test_writes_are_never_skipped():
+    """Breakers only apply to reads."""
+    breakers = CircuitBreakers(failure_threshold=1)
+    write = WriteHoldingRegisterRequest(96, 4)
+    breakers.on_failure(write)
+    assert breakers.filter([write]) == [write]
+
+
+class NoBatteries(SimulatedInverter):
+    def respond(self, request):
+        if request.slave_address != 0x32:
+            return None
+        return super().respond(request)
+
+
+async def test_pacer_ignores_timeouts_that_are_not_congestion(socket_enabled):
+    """Missing batteries, and blocks already failing, time out without backing off the transmit gap."""
+    async with NoBatteries() as inverter:
+        client = Client("127.0.0.1", inverter.port, adaptive_timeouts=False)
+        client.pacer.max_gap = 0.25
+        await client.connect()
+
+        async def read(slave_address: int, base_register: int) -> None:
+            with pytest.raises(asyncio.TimeoutError):
+                await client.send_request_and_await_response(
+                    ReadInputRegistersRequest(
+                        slave_address=slave_address,
+                        base_register=base_register,
+                        register_count=60,
+                    ),
+                    timeout=0.1,
+                    retries=1,
+                )
+
+        try:
+            await read(0x33, 60)
+            assert client.pacer.timeouts == 0
+            # not a battery: the first failed exchange counts, the next ones are put down to the block
+            await read(0x11, 0)
+            assert client.pacer.timeouts == 2
+            await read(0x11, 0)
+            assert client.pacer.timeouts == 2
+        finally:
+            await client.close()
+
+    assert client.metrics.timeouts == 6
@@ -0,0 +1,117 @@
+"""Test how the client shares exchanges between identical requests, against a simulated inverter."""
+
+import asyncio
+
+import pytest
+
+from custom_components.givenergy_local.givenergy_modbus.client.client import Client
+from custom_components.givenergy_local.givenergy_modbus.pdu import (
+    ReadInputRegistersRequest,
+)
+from devtools.simulator import Faults, SimulatedInverter
+
+READ = ReadInputRegistersRequest(base_register=0, register_count=60)
+
+
+async def test_identical_requests_share_one_exchange(socket_enabled):
+    """Concurrent callers of the same request all get the one response to a single frame."""
+    async with SimulatedInverter(faults=Faults(latency=0.05)) as inverter:
+        client = Client("127.0.0.1", inverter.port)
+        await client.connect()
+        try:
+            responses = await asyncio.gather(
+                *[
+                    client.send_request_and_await_response(READ, timeout=1.0, retries=0)
+                    for _ in range(3)
+                ]
+            )
+        finally:
+            await client.close()
+
+    assert responses[0] is responses[1] is responses[2]
+    assert client.coalesced_requests == 2
+    assert inverter.requests == 1
+    assert not client.in_flight_requests
+
+
+async def test_cancelling_one_caller_leaves_the_exchange_running(socket_enabled):
+    """A caller giving up does not cancel the exchange other callers are waiting on."""
+    async with SimulatedInverter(faults=Faults(latency=0.1)) as inverter:
+        client = Client("127.0.0.1", inverter.port)
+        await client.connect()
+        try:
+            impatient = asyncio.create_task(
+                client.send_request_and_await_response(READ, timeout=1.0, retries=0)
+            )
+            patient = asyncio.create_task(
+                client.send_request_and_await_response(READ, timeout=1.0, retries=0)
+            )
+            await asyncio.sleep(0.02)
+            impatient.cancel()
+            response = await patient
+        finally:
+            await client.close()
+
+    assert impatient.cancelled()
+    assert response.base_register == 0
+    assert inverter.requests == 1
+    assert client.metrics.timeouts == 0
+
+
+async def test_duplicate_of_a_queued_frame_is_dropped(socket_enabled):
+    """A request identical to a frame still waiting to go out rides along with it instead of queueing a copy."""
+    async with SimulatedInverter() as inverter:
+        client = Client(
+            "127.0.0.1", inverter.port, adaptive_timeouts=False, max_in_flight=1
+        )
+        await client.connect()
+        loop = asyncio.get_running_loop()
+        try:
+            # nothing answers slave 0x40, so this holds the only in-flight slot for a while
+            blocker = asyncio.create_task(
+                client.send_request_and_await_response(
+                    ReadInputRegistersRequest(
+                        base_register=0, register_count=60, slave_address=0x40
+                    ),
+                    timeout=0.5,
+                    retries=0,
+                )
+            )
+            await asyncio.sleep(0.05)
+            # gives up while its frame is still queued, leaving the frame behind
+            with pytest.raises(asyncio.TimeoutError):
+                await client.send_request_and_await_response(
+                    READ, timeout=1.0, retries=0, deadline=loop.time() + 0.1
+                )
+            response = await client.send_request_and_await_response(
+                READ, timeout=1.0, retries=0
+            )
+            with pytest.raises(asyncio.TimeoutError):
+                await blocker
+        finally:
+            await client.close()
+
+    assert response.base_register == 0
+    assert client.dropped_duplicate_frames == 1
+    assert inverter.requests == 2
+
+
+async def test_late_response_is_not_a_passive_refresh(socket_enabled):
+    """A reply that arrives after its request timed out is not mistaken for someone else's traffic."""
+    async with SimulatedInverter(faults=Faults(latency=0.3)) as inverter:
+        client = Client("127.0.0.1", inverter.port, adaptive_timeouts=False)
+        await client.connect()
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await client.send_request_and_await_response(
+                    READ, timeout=0.1, retries=0
+                )
+            await asyncio.sleep(0.4)
+        finally:
+            await client.close()
+
+    assert inverter.requests == 1
+    assert client.late_responses == 1
+    assert client.passive_refreshes.responses == 0
+    # the registers it carries are still applied
+    assert client.plant_updates == 1
@@ -0,0 +1,19 @@
+"""Test the CRC-16/Modbus implementation."""
+
+from custom_components.givenergy_local.givenergy_modbus.crc import (
+    crc16_modbus,
+    crc16_modbus_check,
+)
+
+
+def test_crc16_modbus_check_value():
+    """The standard check input produces the published CRC-16/Modbus value."""
+    assert crc16_modbus(b"123456789") == 0x4B37
+    assert crc16_modbus_check(0x4B37) == 0x374B
+
+
+def test_crc16_modbus_incremental():
+    """Continuing a CRC over a view gives the same result as a single pass."""
+    data = bytes(range(256)) * 2
+    partial = crc16_modbus(data[:100])
+    assert crc16_modbus(memoryview(data)[100:], partial) == crc16_modbus(data)
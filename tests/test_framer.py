@@ -0,0 +1,44 @@
+"""Test the givenergy_modbus framer."""
+
+from custom_components.givenergy_local.givenergy_modbus.framer import ClientFramer
+from custom_components.givenergy_local.givenergy_modbus.pdu import HeartbeatRequest
+
+
+def _heartbeat_frame(data_adapter_type: int) -> bytes:
+    return HeartbeatRequest(
+        data_adapter_serial_number="WF1234G567", data_adapter_type=data_adapter_type
+    ).encode()
+
+
+async def _decode_all(framer: ClientFramer, reads: list[bytes]) -> list:
+    return [
+        message for data in reads for message in [m async for m in framer.decode(data)]
+    ]
+
+
+async def test_fragmented_frames_across_buffer_wrap():
+    """Frames split into single bytes decode correctly, even when the buffer must compact and grow."""
+    stream = b"".join(_heartbeat_frame(i) for i in range(20))
+    framer = ClientFramer(buffer_size=32)
+
+    messages = await _decode_all(
+        framer, [stream[i : i + 1] for i in range(len(stream))]
+    )
+
+    assert [m.data_adapter_type for m in messages] == list(range(20))
+    assert all(isinstance(m.raw_frame, bytes) for m in messages)
+    assert messages[3].raw_frame == _heartbeat_frame(3)
+    assert framer.buffered_bytes == 0
+
+
+async def test_garbage_is_skipped():
+    """Leading garbage and truncated headers are discarded before resyncing on the next frame."""
+    frame = _heartbeat_frame(7)
+    framer = ClientFramer()
+
+    messages = await _decode_all(
+        framer, [b"\x00garbage" + frame[:10] + frame, b"\xff" * 50, frame]
+    )
+
+    assert [m.data_adapter_type for m in messages] == [7, 7]
+    assert framer.buffered_bytes == 0
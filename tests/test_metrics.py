@@ -0,0 +1,45 @@
+"""Test client metrics."""
+
+from custom_components.givenergy_local.givenergy_modbus.client.metrics import (
+    RequestMetrics,
+)
+from custom_components.givenergy_local.givenergy_modbus.framer import ClientFramer
+from custom_components.givenergy_local.givenergy_modbus.pdu import (
+    HeartbeatRequest,
+    ReadInputRegistersRequest,
+)
+
+
+def test_latency_histograms_are_keyed_by_request_shape():
+    """Latencies land in fixed buckets per slave address, function and base register."""
+    metrics = RequestMetrics()
+    request = ReadInputRegistersRequest(
+        slave_address=0x32, base_register=60, register_count=60
+    )
+    for seconds in (0.03, 0.2, 0.2, 12.0):
+        metrics.observe(request, seconds)
+
+    histogram = metrics.snapshot()["latency"]["0x32/4/60"]
+
+    assert histogram["buckets"]["le_0.05"] == 1
+    assert histogram["buckets"]["le_0.25"] == 2
+    assert histogram["buckets"]["le_inf"] == 1
+    assert histogram["count"] == 4
+    assert histogram["max"] == 12.0
+
+
+def test_framer_counts_discarded_garbage():
+    """Bytes skipped while resynchronising are counted."""
+    frame = HeartbeatRequest(
+        data_adapter_serial_number="WF1234G567", data_adapter_type=1
+    ).encode()
+    framer = ClientFramer()
+
+    messages = list(framer.decode_frames(b"\x00" * 7 + frame + frame[:10] + frame))
+
+    assert len(messages) == 2
+    stats = framer.stats()
+    assert stats["frames"] == 2
+    assert stats["bytes_discarded"] == 17
+    assert stats["resyncs"] == 2
+    assert stats["bytes_received"] == 7 + 2 * len(frame) + 10
@@ -0,0 +1,73 @@
+"""Test adaptive transmit pacing."""
+
+from custom_components.givenergy_local.givenergy_modbus.client.pacing import (
+    TransmitPacer,
+)
+from custom_components.givenergy_local.givenergy_modbus.client.timeouts import (
+    AdaptiveTimeouts,
+)
+
+
+def test_gap_tightens_on_healthy_responses():
+    """Healthy responses shrink the gap towards the minimum and track RTT."""
+    pacer = TransmitPacer(initial_gap=0.25, min_gap=0.05)
+    for _ in range(50):
+        pacer.on_response(0.1)
+
+    assert pacer.gap == 0.05
+    assert pacer.stats()["srtt"] == 0.1
+    assert pacer.stats()["responses"] == 50
+
+
+def test_gap_backs_off_and_learns_floor_on_loss():
+    """A timeout backs the gap off and keeps it above the gap that caused the loss."""
+    pacer = TransmitPacer(initial_gap=0.1, min_gap=0.05)
+    pacer.on_timeout()
+
+    assert pacer.gap == 0.2
+    for _ in range(10):
+        pacer.on_response(0.1)
+    assert pacer.gap > 0.1
+    assert pacer.stats()["timeouts"] == 1
+
+
+def test_rtt_estimate_shared_with_timeouts():
+    """The pacer feeds the adapter-wide RTT estimate that timeouts fall back on, sampling each response once."""
+    pacer = TransmitPacer()
+    timeouts = AdaptiveTimeouts(min_timeout=0.1, adapter=pacer.rtt)
+    for _ in range(5):
+        pacer.on_response(0.2)
+        timeouts.on_response(0x32, 0.2)
+    # a response after a retry still tightens the gap, but is not sampled
+    gap = pacer.gap
+    pacer.on_response(5.0, ambiguous=True)
+
+    assert pacer.gap < gap
+    assert pacer.rtt.samples == 5
+    assert timeouts.stats()["adapter"]["srtt"] == pacer.stats()["srtt"] == 0.2
+    assert timeouts.timeout(0x33, 1.0) == pacer.rtt.rto(timeouts.granularity)
+
+
+def test_rising_latency_stops_tightening():
+    """Responses that keep slowing down, with no losses at all, hold the gap and then back it off."""
+    pacer = TransmitPacer(initial_gap=0.25, min_gap=0.05)
+    for _ in range(5):
+        pacer.on_response(0.1)
+    gaps = []
+    for i in range(30):
+        pacer.on_response(0.1 + 0.02 * i)
+        gaps.append(pacer.gap)
+
+    # jitter within the slack still tightens, until responses are clearly slower than the base RTT
+    assert gaps[4] < gaps[0]
+    assert gaps[10] == gaps[5]
+    assert gaps[-1] > gaps[10]
+    assert pacer.stats()["latency_holds"] > 0
+    assert pacer.stats()["latency_backoffs"] > 0
+    assert pacer.stats()["timeouts"] == pacer.stats()["errors"] == 0
+
+    # responses expected to be slower, e.g. from battery BMSs, are not mistaken for queueing
+    gap = pacer.gap
+    for _ in range(5):
+        pacer.on_response(5.0, judge_latency=False)
+    assert pacer.gap < gap
@@ -0,0 +1,64 @@
+"""Test passive ingestion of cloud and app traffic."""
+
+from custom_components.givenergy_local.givenergy_modbus.client.client import Client
+from custom_components.givenergy_local.givenergy_modbus.client.commands import (
+    CommandBuilder,
+)
+from custom_components.givenergy_local.givenergy_modbus.client.passive import (
+    PassiveRefreshTracker,
+)
+from custom_components.givenergy_local.givenergy_modbus.model.register import IR
+from custom_components.givenergy_local.givenergy_modbus.pdu import (
+    ReadHoldingRegistersRequest,
+    ReadInputRegistersRequest,
+    ReadInputRegistersResponse,
+)
+
+
+def _cloud_response(base_register: int, register_count: int = 60):
+    return ReadInputRegistersResponse(
+        inverter_serial_number="SA1234G567",
+        data_adapter_serial_number="WF1234G567",
+        slave_address=0x11,
+        base_register=base_register,
+        register_count=register_count,
+        register_values=[1] * register_count,
+    )
+
+
+def test_poller_skips_recently_refreshed_blocks(fake_clock):
+    """Only blocks that unsolicited traffic refreshed recently enough are skipped."""
+    tracker = PassiveRefreshTracker(clock=fake_clock)
+    tracker.record(_cloud_response(0))
+    tracker.record(_cloud_response(120, register_count=30))
+    fake_clock.now = 5.0
+
+    requests = CommandBuilder().refresh_plant_data(True, 0)
+    remaining = tracker.filter(requests, max_age=10.0)
+
+    # IR(0) skipped; IR(120) was only partly covered; holding registers were never seen
+    assert [(type(r), r.base_register) for r in remaining] == [
+        (ReadHoldingRegistersRequest, 0),
+        (ReadHoldingRegistersRequest, 60),
+        (ReadInputRegistersRequest, 120),
+    ]
+    assert tracker.filter(requests, max_age=4.0) == requests
+    assert tracker.stats() == {"responses": 2, "skipped_requests": 1, "blocks": 2}
+
+
+def test_client_tracks_unsolicited_responses_only():
+    """Responses nobody asked for are tracked and still applied to the plant."""
+    client = Client("localhost", 8899)
+
+    client.dispatch(_cloud_response(0))
+
+    assert client.passive_refreshes.responses == 1
+    assert client.plant.register_caches[0x32][IR(59)] == 1
+    assert (
+        client.passive_refreshes.age(
+            ReadInputRegistersRequest(
+                slave_address=0x32, base_register=0, register_count=60
+            )
+        )
+        is not None
+    )
@@ -0,0 +1,83 @@
+"""Test memoization and incremental updates of the models a plant derives from its register caches."""
+
+import random
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.givenergy_local.givenergy_modbus.model.battery import Battery
+from custom_components.givenergy_local.givenergy_modbus.model.inverter import Inverter
+from custom_components.givenergy_local.givenergy_modbus.model.plant import Plant
+from custom_components.givenergy_local.givenergy_modbus.model.register import IR
+from devtools.simulator import SimulatedInverter, example_register_caches
+
+
+@pytest.mark.parametrize("array_register_caches", (False, True))
+def test_models_are_built_once_per_version(
+    array_register_caches, refresh_from_simulator
+):
+    """Repeated access reuses models, and changes only recompute the fields that depend on changed registers."""
+    inverter = SimulatedInverter(example_register_caches(number_batteries=3))
+    plant = Plant(array_register_caches=array_register_caches)
+    refresh_from_simulator(plant, inverter)
+    plant.detect_batteries()
+    assert plant.number_batteries == 3
+    previous = plant.inverter
+
+    with (
+        patch.object(Inverter, "from_orm", wraps=Inverter.from_orm) as inverter_builds,
+        patch.object(Battery, "from_orm", wraps=Battery.from_orm) as battery_builds,
+    ):
+        # a coordinator tick: a refresh, then many entities reading the models
+        refresh_from_simulator(plant, inverter)
+        for _ in range(10):
+            assert plant.inverter.serial_number == "SA1234G567"
+            assert len(plant.batteries) == 3
+        assert inverter_builds.call_count == 0
+        assert battery_builds.call_count == 0
+        assert plant.inverter is previous
+
+        inverter.register_caches[0x32][IR(59)] = 51
+        refresh_from_simulator(plant, inverter)
+        for _ in range(10):
+            assert plant.inverter.battery_percent == 51
+            assert len(plant.batteries) == 3
+        assert inverter_builds.call_count == 0
+        assert battery_builds.call_count == 0
+        assert plant.changed_fields() == {"battery_percent"}
+        # the first battery shares the inverter's slave address and register cache, but not that field
+        assert plant.changed_fields(Battery, 0x32) == frozenset()
+
+        # modifying a cache directly, rather than through update(), forces a full rebuild
+        plant.register_caches[0x32][IR(59)] = 52
+        assert plant.inverter.battery_percent == 52
+        assert inverter_builds.call_count == 1
+        assert plant.changed_fields() == {"battery_percent"}
+
+    assert plant.inverter is plant.inverter
+    assert plant.batteries[0] is not plant.inverter
+
+
+@pytest.mark.parametrize("array_register_caches", (False, True))
+def test_incremental_models_match_full_builds(
+    array_register_caches, refresh_from_simulator
+):
+    """Models brought up to date incrementally equal ones built from scratch."""
+    rng = random.Random(1)
+    inverter = SimulatedInverter(example_register_caches(number_batteries=2))
+    plant = Plant(array_register_caches=array_register_caches)
+    refresh_from_simulator(plant, inverter)
+    plant.detect_batteries()
+    assert plant.inverter
+    for _ in range(30):
+        for register_cache in inverter.register_caches.values():
+            # measurements, rather than the enums, time slots and strings that not every value converts to
+            for idx in rng.sample(range(1, 110), 5):
+                register_cache[IR(idx)] = rng.randrange(0x10000)
+        refresh_from_simulator(plant, inverter)
+        expected = Inverter.from_orm(plant.register_caches[0x32])
+        with patch.object(Inverter, "from_orm", wraps=Inverter.from_orm) as builds:
+            assert plant.inverter == expected
+            assert builds.call_count == 0
+        for battery, slave_address in zip(plant.batteries, (0x32, 0x33)):
+            assert battery == Battery.from_orm(plant.register_caches[slave_address])
@@ -0,0 +1,95 @@
+"""Test refreshing several simulated inverters through a ClientPool."""
+
+import asyncio
+import logging
+
+from custom_components.givenergy_local.givenergy_modbus.client.pool import ClientPool
+from custom_components.givenergy_local.givenergy_modbus.exceptions import (
+    CommunicationError,
+)
+from custom_components.givenergy_local.givenergy_modbus.model.plant import Plant
+from devtools.simulator import Faults, SimulatedInverter
+
+
+async def test_refresh_all(socket_enabled):
+    """Every reachable plant is detected and refreshed; an unreachable one reports its error without holding up the rest."""
+    async with SimulatedInverter() as gone:
+        unreachable_port = gone.port
+    async with (
+        SimulatedInverter(inverter_serial_number="SA0000G001") as first,
+        SimulatedInverter(inverter_serial_number="SA0000G002") as second,
+    ):
+        pool = ClientPool(detect_timeout=0.5, detect_retries=1)
+        pool.add("127.0.0.1", first.port, name="first")
+        pool.add("127.0.0.1", second.port, name="second")
+        pool.add("127.0.0.1", unreachable_port, name="unreachable")
+        try:
+            detected = await pool.refresh_all(timeout=0.5, deadline=5)
+            refreshed = await pool.refresh_all(full_refresh=True, timeout=0.5)
+        finally:
+            await pool.close()
+
+    for results in (detected, refreshed):
+        assert results["first"].inverter.serial_number == "SA0000G001"
+        assert results["second"].inverter.serial_number == "SA0000G002"
+        assert isinstance(results["unreachable"], CommunicationError)
+    assert refreshed["first"] is detected["first"]
+
+
+async def test_refresh_all_deadline(socket_enabled):
+    """A plant that misses the deadline times out and is disconnected, while the others still refresh."""
+    async with (
+        SimulatedInverter() as fast,
+        SimulatedInverter(faults=Faults(timeouts=1.0)) as silent,
+    ):
+        pool = ClientPool(detect_timeout=2.0)
+        pool.add("127.0.0.1", fast.port, name="fast")
+        try:
+            await pool.refresh_all()
+            pool.add("127.0.0.1", silent.port, name="silent")
+            results = await pool.refresh_all(deadline=0.5)
+            assert isinstance(results["fast"], Plant)
+            assert isinstance(results["silent"], asyncio.TimeoutError)
+            # cut short halfway through detecting the plant, so the connection is not reused
+            assert pool.clients["fast"].connected
+            assert not pool.clients["silent"].connected
+        finally:
+            await pool.close()
+
+
+async def test_watch_skips_plants_still_refreshing(socket_enabled, caplog):
+    """Ticks keep refreshing a responsive plant while a slow one is left to finish, and stopping cancels it."""
+    results = []
+    async with (
+        SimulatedInverter() as fast,
+        SimulatedInverter(faults=Faults(timeouts=1.0)) as silent,
+    ):
+        pool = ClientPool(detect_timeout=2.0)
+        pool.add("127.0.0.1", fast.port, name="fast")
+        await pool.refresh_all()
+        pool.add("127.0.0.1", silent.port, name="silent")
+        with caplog.at_level(
+            logging.DEBUG,
+            logger="custom_components.givenergy_local.givenergy_modbus.client.pool",
+        ):
+            watcher = asyncio.create_task(
+                pool.watch(
+                    lambda name, result: results.append((name, result)),
+                    refresh_period=0.2,
+                    timeout=0.5,
+                )
+            )
+            await asyncio.sleep(1.1)
+            watcher.cancel()
+            await asyncio.gather(watcher, return_exceptions=True)
+            await asyncio.sleep(0)
+        try:
+            # detection never finished within a tick, and was abandoned when the watch stopped
+            assert not pool.clients["silent"].connected
+        finally:
+            await pool.close()
+
+    assert len([r for name, r in results if name == "fast"]) >= 4
+    assert all(isinstance(r, Plant) for _, r in results)
+    assert not [name for name, _ in results if name == "silent"]
+    assert caplog.text.count("silent is still refreshing") >= 4
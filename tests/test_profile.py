@@ -0,0 +1,42 @@
+"""Test persisted plant capability profiles."""
+
+import json
+
+from custom_components.givenergy_local.givenergy_modbus.model.inverter import (
+    Generation,
+    Model,
+)
+from custom_components.givenergy_local.givenergy_modbus.model.profile import (
+    PlantProfile,
+)
+
+
+def test_profile_round_trips_through_json():
+    """A profile survives being stored as JSON and read back."""
+    profile = PlantProfile(
+        inverter_serial_number="SA1234G567",
+        model=Model.HYBRID,
+        generation=Generation.GEN2,
+        number_batteries=2,
+        additional_holding_registers=[300],
+        detected_at=1700000000.0,
+    )
+
+    restored = PlantProfile.parse_obj(json.loads(json.dumps(profile.dict())))
+
+    assert restored == profile
+    assert Model(restored.model) == Model.HYBRID
+
+
+def test_profile_staleness():
+    """Profiles go stale once older than the given age."""
+    profile = PlantProfile(
+        inverter_serial_number="SA1234G567",
+        model=Model.ALL_IN_ONE,
+        generation=Generation.GEN3,
+        number_batteries=0,
+        detected_at=1000.0,
+    )
+
+    assert not profile.is_stale(60, now=1060.0)
+    assert profile.is_stale(60, now=1061.0)
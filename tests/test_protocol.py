@@ -0,0 +1,116 @@
+"""Test the asyncio protocol transport for the client."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from custom_components.givenergy_local.givenergy_modbus.client.client import Client
+from custom_components.givenergy_local.givenergy_modbus.client.protocol import (
+    ClientProtocol,
+)
+from custom_components.givenergy_local.givenergy_modbus.pdu import (
+    HeartbeatRequest,
+    ReadInputRegistersResponse,
+)
+
+
+class FakeTransport(asyncio.Transport):
+    def __init__(self) -> None:
+        super().__init__()
+        self.written = b""
+        self.closing = False
+
+    def write(self, data) -> None:
+        self.written += data
+
+    def is_closing(self) -> bool:
+        return self.closing
+
+    def close(self) -> None:
+        self.closing = True
+
+
+def _connected_protocol() -> tuple[ClientProtocol, list]:
+    client = Client("127.0.0.1", 8899)
+    dispatched: list = []
+    client.dispatch = dispatched.append  # type: ignore[method-assign]
+    protocol = ClientProtocol(client)
+    protocol.connection_made(FakeTransport())
+    return protocol, dispatched
+
+
+def _receive(protocol: ClientProtocol, data: bytes) -> None:
+    """Deliver data the way the event loop does: straight into the buffer the protocol hands out."""
+    buffer = protocol.get_buffer(len(data))
+    buffer[: len(data)] = data
+    protocol.buffer_updated(len(data))
+
+
+async def test_fragmented_frames_are_dispatched_once_complete():
+    """Frames split across reads, and several frames in one read, are each dispatched as soon as they complete."""
+    protocol, dispatched = _connected_protocol()
+    response = ReadInputRegistersResponse(
+        base_register=0,
+        register_count=60,
+        register_values=list(range(60)),
+        inverter_serial_number="SA1234G567",
+        data_adapter_serial_number="WF1234G567",
+        slave_address=0x32,
+        padding=0x8A,
+    ).encode()
+    heartbeat = HeartbeatRequest(
+        data_adapter_serial_number="WF1234G567", data_adapter_type=1
+    ).encode()
+
+    for i in range(0, len(response) - 1, 7):
+        _receive(protocol, response[i : min(i + 7, len(response) - 1)])
+    assert dispatched == []
+    _receive(protocol, response[-1:] + heartbeat + heartbeat[:5])
+    _receive(protocol, heartbeat[5:])
+
+    assert [type(m) for m in dispatched] == [
+        ReadInputRegistersResponse,
+        HeartbeatRequest,
+        HeartbeatRequest,
+    ]
+    assert dispatched[0].register_values == list(range(60))
+    assert protocol.client.framer.buffered_bytes == 0
+
+
+async def test_drain_waits_while_writing_is_paused():
+    """drain() returns straight away unless the transport paused writing, then waits for it to resume."""
+    protocol, _ = _connected_protocol()
+    await protocol.drain()
+
+    protocol.pause_writing()
+    drain = asyncio.create_task(protocol.drain())
+    await asyncio.sleep(0)
+    assert not drain.done()
+    protocol.resume_writing()
+    await drain
+
+    protocol.pause_writing()
+    drain = asyncio.create_task(protocol.drain())
+    await asyncio.sleep(0)
+    protocol.transport.closing = True  # type: ignore[union-attr]
+    protocol.connection_lost(ConnectionResetError("reset by peer"))
+    with pytest.raises(ConnectionResetError):
+        await drain
+    with pytest.raises(ConnectionResetError):
+        await protocol.drain()
+
+
+async def test_connection_lost_closes_the_client():
+    """Losing the connection closes the client from a task the protocol keeps hold of."""
+    protocol, _ = _connected_protocol()
+    protocol.client.close = AsyncMock()  # type: ignore[method-assign]
+    protocol.transport.closing = True  # type: ignore[union-attr]
+
+    protocol.connection_lost(None)
+    assert protocol.close_task is not None
+    await protocol.close_task
+    await protocol.wait_closed()
+
+    protocol.client.close.assert_awaited_once()
+    assert protocol.is_closing()
@@ -0,0 +1,78 @@
+"""Test the multiplexing proxy."""
+
+import asyncio
+
+from custom_components.givenergy_local.givenergy_modbus.client.client import Client
+from custom_components.givenergy_local.givenergy_modbus.client.proxy import (
+    InverterProxy,
+)
+from custom_components.givenergy_local.givenergy_modbus.framer import ServerFramer
+from custom_components.givenergy_local.givenergy_modbus.model.register import HR, IR
+from custom_components.givenergy_local.givenergy_modbus.pdu import (
+    ReadInputRegistersRequest,
+    ReadInputRegistersResponse,
+    WriteHoldingRegisterRequest,
+    WriteHoldingRegisterResponse,
+)
+
+
+async def _start_inverter(received: list):
+    async def handle(reader, writer):
+        framer = ServerFramer()
+        while not reader.at_eof():
+            for request in framer.decode_frames(await reader.read(300)):
+                received.append(request)
+                if isinstance(request, ReadInputRegistersRequest):
+                    response = ReadInputRegistersResponse(
+                        slave_address=request.slave_address,
+                        base_register=request.base_register,
+                        register_count=request.register_count,
+                        register_values=list(range(request.register_count)),
+                    )
+                else:
+                    response = WriteHoldingRegisterResponse(
+                        slave_address=request.slave_address,
+                        register=request.register,
+                        value=request.value,
+                    )
+                response.inverter_serial_number = "SA1234G567"
+                response.data_adapter_serial_number = "WF1234G567"
+                writer.write(response.encode())
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+async def test_local_clients_share_one_upstream_connection(socket_enabled):
+    """Fresh reads are answered from cache; writes and misses are forwarded upstream."""
+    received: list = []
+    inverter = await _start_inverter(received)
+    upstream = Client("127.0.0.1", inverter.sockets[0].getsockname()[1])
+    proxy = InverterProxy(upstream, port=0, max_age=60)
+    await proxy.start()
+
+    local_clients = [Client("127.0.0.1", proxy.port) for _ in range(2)]
+    for client in local_clients:
+        await client.connect()
+    try:
+        read = ReadInputRegistersRequest(base_register=0, register_count=60)
+        first = await local_clients[0].send_request_and_await_response(read, 1, 0)
+        second = await local_clients[1].send_request_and_await_response(read, 1, 0)
+        await local_clients[1].send_request_and_await_response(
+            WriteHoldingRegisterRequest(96, 4), 1, 0
+        )
+    finally:
+        for client in local_clients:
+            await client.close()
+        await proxy.close()
+        inverter.close()
+
+    assert first.register_values == second.register_values == list(range(60))
+    assert [type(r).__name__ for r in received] == [
+        "ReadInputRegistersRequest",
+        "WriteHoldingRegisterRequest",
+    ]
+    assert proxy.cache_hits == 1
+    assert proxy.forwarded_requests == 2
+    assert upstream.plant.register_caches[0x32][IR(59)] == 59
+    assert upstream.plant.register_caches[0x32][HR(96)] == 4
+    assert local_clients[1].plant.register_caches[0x32][HR(96)] == 4
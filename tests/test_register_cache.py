@@ -0,0 +1,83 @@
+"""Test the array-backed register cache against the dict-backed one, and register interning."""
+
+import copy
+import pickle
+
+import pytest
+
+from custom_components.givenergy_local.givenergy_modbus.model.plant import Plant
+from custom_components.givenergy_local.givenergy_modbus.model.register import HR, IR
+from custom_components.givenergy_local.givenergy_modbus.model.register_cache import (
+    ArrayRegisterCache,
+    RegisterCache,
+)
+from devtools.simulator import SimulatedInverter, example_register_caches
+
+
+def test_plant_models_match_dict_backend(refresh_from_simulator):
+    """Both backends produce the same deltas, register values and models."""
+    inverter = SimulatedInverter(example_register_caches(number_batteries=2))
+    plants = [Plant(), Plant(array_register_caches=True)]
+    slave_addresses = (0x32, 0x33)
+    deltas = [
+        refresh_from_simulator(plant, inverter, slave_addresses) for plant in plants
+    ]
+    inverter.register_caches[0x32][IR(59)] = 51
+    deltas = [
+        d + refresh_from_simulator(plant, inverter, slave_addresses)
+        for d, plant in zip(deltas, plants)
+    ]
+
+    assert isinstance(plants[1].register_caches[0x33], ArrayRegisterCache)
+    assert [d.changes for d in deltas[0]] == [d.changes for d in deltas[1]]
+    assert [d.changes for d in deltas[1][20:] if d.changes] == [{IR(59): (50, 51)}]
+    for slave_address in slave_addresses:
+        assert dict(plants[0].register_caches[slave_address]) == dict(
+            plants[1].register_caches[slave_address]
+        )
+    for plant in plants:
+        plant.detect_batteries()
+    assert plants[0].inverter == plants[1].inverter
+    assert plants[0].batteries == plants[1].batteries
+
+
+def test_unread_registers_are_absent(fake_clock):
+    """Registers that were never written are missing, not 0."""
+    cache = ArrayRegisterCache(clock=fake_clock)
+    fake_clock.now = 10.0
+    assert cache.update_block(HR, 100, [1, 2, 3]) == {
+        HR(100): (None, 1),
+        HR(101): (None, 2),
+        HR(102): (None, 3),
+    }
+    assert len(cache) == 3
+    assert list(cache) == [HR(100), HR(101), HR(102)]
+    assert cache.get(HR(99)) is None
+    assert IR(100) not in cache
+    with pytest.raises(KeyError):
+        cache[HR(103)]
+    assert cache.updated_at(HR(101)) == 10.0
+    assert cache.updated_at(HR(103)) is None
+
+    fake_clock.now = 20.0
+    assert cache.update_block(HR, 101, [2, 4]) == {HR(102): (3, 4)}
+    assert len(cache) == 3
+    assert cache.updated_at(HR(101)) == 20.0
+    assert cache.updated_at(HR(100)) == 10.0
+
+    del cache[HR(100)]
+    assert len(cache) == 2
+    assert cache.get(HR(100), 0) == 0
+    assert dict(cache) == dict(RegisterCache({HR(101): 2, HR(102): 4}))
+
+
+def test_registers_are_interned():
+    """There is one instance per register type and index, which survives copying and pickling."""
+    register = HR(21)
+    assert HR(21) is register
+    assert copy.deepcopy(register) is register
+    assert pickle.loads(pickle.dumps(register)) is register
+    assert IR(21) is not register
+    assert IR(21) != register
+    with pytest.raises(AttributeError):
+        register.foo = 1
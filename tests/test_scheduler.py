@@ -0,0 +1,146 @@
+"""Test priority scheduling of transmitted frames."""
+
+import asyncio
+
+from custom_components.givenergy_local.givenergy_modbus.client.scheduler import (
+    Priority,
+    TransmitScheduler,
+)
+
+GAP = 0.25
+
+
+def simulate(clock, arrivals, ticks=2000, aging_interval=2.0):
+    """Serve one frame per `GAP` while `arrivals(tick)` yields frames to queue, returning the worst wait per class.
+
+    Background polls are topped up every tick until the queue refuses them, so the transmitter is always saturated.
+    """
+    scheduler = TransmitScheduler(
+        maxsize=20, aging_interval=aging_interval, clock=clock
+    )
+    worst = {p: 0.0 for p in Priority}
+    served = {p: 0 for p in Priority}
+    for tick in range(ticks):
+        clock.now = tick * GAP
+        for priority in arrivals(tick):
+            scheduler.put_nowait((priority, clock.now), priority)
+        while True:
+            try:
+                scheduler.put_nowait(
+                    (Priority.BACKGROUND, clock.now), Priority.BACKGROUND
+                )
+            except asyncio.QueueFull:
+                break
+        priority, enqueued_at = scheduler.get_nowait()
+        scheduler.task_done()
+        worst[priority] = max(worst[priority], clock.now - enqueued_at)
+        served[priority] += 1
+    return worst, served
+
+
+def test_heartbeats_and_writes_jump_a_saturated_poll(fake_clock):
+    """Heartbeat replies and writes go out next, however many polls are queued."""
+
+    def arrivals(tick):
+        if tick % 20 == 0:
+            yield Priority.HEARTBEAT
+        if tick % 13 == 5:
+            yield Priority.WRITE
+
+    worst, served = simulate(fake_clock, arrivals)
+
+    assert served[Priority.HEARTBEAT] == 100
+    assert worst[Priority.HEARTBEAT] == 0
+    # at worst, a write arrives alongside a heartbeat and goes out straight after it
+    assert worst[Priority.WRITE] <= GAP
+    # a FIFO queue of 20 polls would make every one of these wait 5s
+    assert worst[Priority.BACKGROUND] <= 25 * GAP
+
+
+def test_heartbeat_latency_under_write_burst(fake_clock):
+    """A burst of writes does not hold up a heartbeat reply."""
+
+    def arrivals(tick):
+        if tick % 100 == 0:
+            yield from [Priority.WRITE] * 10
+        if tick % 20 == 7:
+            yield Priority.HEARTBEAT
+
+    worst, _ = simulate(fake_clock, arrivals)
+
+    assert worst[Priority.HEARTBEAT] == 0
+    assert worst[Priority.WRITE] <= 10 * GAP
+
+
+def test_aging_prevents_starvation(fake_clock):
+    """Background polls still get served while interactive reads alone would saturate the transmitter."""
+
+    def arrivals(tick):
+        yield Priority.INTERACTIVE
+
+    _, served = simulate(fake_clock, arrivals, ticks=400, aging_interval=2.0)
+
+    # the background class goes overdue after three aging intervals without service, then gets a frame out
+    assert served[Priority.BACKGROUND] >= 400 * GAP // (3 * 2.0)
+    assert served[Priority.INTERACTIVE] > 300
+
+
+def test_queue_bounds_reads_only(fake_clock):
+    """Writes and heartbeats can always be queued, even when reads have filled the queue."""
+    scheduler = TransmitScheduler(maxsize=2, clock=fake_clock)
+    scheduler.put_nowait("poll 1", Priority.BACKGROUND)
+    scheduler.put_nowait("read", Priority.INTERACTIVE)
+    assert scheduler.full()
+    try:
+        scheduler.put_nowait("poll 2", Priority.BACKGROUND)
+    except asyncio.QueueFull:
+        pass
+    else:
+        raise AssertionError("expected QueueFull")
+    scheduler.put_nowait("write", Priority.WRITE)
+    scheduler.put_nowait("heartbeat", Priority.HEARTBEAT)
+
+    assert scheduler.qsize() == 4
+    assert [scheduler.get_nowait() for _ in range(4)] == [
+        "heartbeat",
+        "write",
+        "read",
+        "poll 1",
+    ]
+    assert scheduler.empty()
+
+
+def test_full_window_serves_only_heartbeats(fake_clock):
+    """While every in-flight slot is taken, requests stay queued and heartbeat replies are still served."""
+    scheduler = TransmitScheduler(maxsize=20, clock=fake_clock, max_in_flight=1)
+    scheduler.put_nowait("read 1", Priority.INTERACTIVE)
+    scheduler.put_nowait("write", Priority.WRITE)
+    assert scheduler.get_nowait() == "write"
+    assert scheduler.window_full()
+
+    scheduler.put_nowait("heartbeat", Priority.HEARTBEAT)
+    assert scheduler.get_nowait() == "heartbeat"
+    try:
+        scheduler.get_nowait()
+    except asyncio.QueueEmpty:
+        pass
+    else:
+        raise AssertionError("expected QueueEmpty")
+
+    scheduler.release()
+    assert scheduler.get_nowait() == "read 1"
+    assert scheduler.in_flight == 1
+
+
+def test_overdue_class_preempts_heartbeats(fake_clock):
+    """A flood of heartbeat replies cannot hold up a write for more than one aging interval."""
+    scheduler = TransmitScheduler(maxsize=20, aging_interval=2.0, clock=fake_clock)
+    scheduler.put_nowait("write", Priority.WRITE)
+    served = []
+    for tick in range(20):
+        fake_clock.now = tick * GAP
+        scheduler.put_nowait("heartbeat", Priority.HEARTBEAT)
+        served.append((fake_clock.now, scheduler.get_nowait()))
+
+    assert [t for t, item in served if item == "write"] == [2.0]
+    assert scheduler.promoted == 1
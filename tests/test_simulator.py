@@ -0,0 +1,61 @@
+"""Test the client end-to-end against a simulated inverter."""
+
+import asyncio
+
+import pytest
+
+from custom_components.givenergy_local.givenergy_modbus.client.client import Client
+from custom_components.givenergy_local.givenergy_modbus.client.commands import (
+    CommandBuilder,
+)
+from custom_components.givenergy_local.givenergy_modbus.model.inverter import Model
+from custom_components.givenergy_local.givenergy_modbus.model.register import HR
+from custom_components.givenergy_local.givenergy_modbus.pdu import (
+    ReadInputRegistersRequest,
+)
+from devtools.simulator import Faults, SimulatedInverter
+
+
+async def test_detect_plant_over_a_noisy_link(socket_enabled):
+    """Detection copes with fragmented responses, garbage on the wire and heartbeats."""
+    faults = Faults(latency=0.005, fragment_size=16, garbage=0.3)
+    async with SimulatedInverter(
+        faults=faults, heartbeat_interval=0.5, seed=1
+    ) as inverter:
+        client = Client("127.0.0.1", inverter.port)
+        await client.connect()
+        try:
+            await client.detect_plant(timeout=0.5, retries=2)
+            await client.write(
+                CommandBuilder.set_battery_soc_reserve(20), timeout=0.5, retries=2
+            )
+        finally:
+            await client.close()
+
+    assert client.plant.inverter.model == Model.HYBRID
+    assert client.plant.inverter.serial_number == "SA1234G567"
+    assert client.plant.number_batteries == 1
+    assert inverter.register_caches[0x32][HR(110)] == 20
+    assert client.plant.register_caches[0x32][HR(110)] == 20
+    assert inverter.heartbeats_answered >= 1
+    assert client.framer.resyncs > 0
+
+
+async def test_ignored_requests_time_out(socket_enabled):
+    """Requests the simulator drops, or answers with a corrupt CRC, go unanswered as far as the client is concerned."""
+    for faults in (Faults(timeouts=1.0), Faults(bad_crc=1.0)):
+        async with SimulatedInverter(faults=faults) as inverter:
+            client = Client("127.0.0.1", inverter.port)
+            await client.connect()
+            try:
+                with pytest.raises(asyncio.TimeoutError):
+                    await client.send_request_and_await_response(
+                        ReadInputRegistersRequest(base_register=0, register_count=60),
+                        timeout=0.1,
+                        retries=1,
+                    )
+            finally:
+                await client.close()
+        assert inverter.requests == 2
+        assert inverter.responses == 2 - inverter.ignored_requests
+        assert client.metrics.failures == 1
@@ -0,0 +1,80 @@
+"""Test register change subscriptions."""
+
+from custom_components.givenergy_local.givenergy_modbus.client.client import Client
+from custom_components.givenergy_local.givenergy_modbus.model.plant import Plant
+from custom_components.givenergy_local.givenergy_modbus.model.register import HR, IR
+from custom_components.givenergy_local.givenergy_modbus.pdu import (
+    ReadHoldingRegistersResponse,
+    ReadInputRegistersResponse,
+)
+
+
+def _input_registers(slave_address: int, values: list[int]):
+    return ReadInputRegistersResponse(
+        inverter_serial_number="SA1234G567",
+        data_adapter_serial_number="WF1234G567",
+        slave_address=slave_address,
+        base_register=0,
+        register_count=len(values),
+        register_values=values,
+    )
+
+
+def test_plant_update_reports_changed_registers():
+    """Applying a response reports only the registers whose value changed."""
+    plant = Plant()
+
+    first = plant.update(_input_registers(0x32, [1, 2, 3]))
+    second = plant.update(_input_registers(0x32, [1, 5, 3]))
+
+    assert first is not None and second is not None
+    assert first.changes == {IR(0): (None, 1), IR(1): (None, 2), IR(2): (None, 3)}
+    assert second.slave_address == 0x32
+    assert second.changes == {IR(1): (2, 5)}
+    assert second.received_at >= first.received_at
+
+
+async def test_subscription_yields_deltas_per_slave():
+    """Subscribers receive deltas as responses are dispatched, filtered by slave address."""
+    client = Client("localhost", 8899)
+    everything = client.subscribe()
+    batteries = client.subscribe(slave_addresses=[0x33])
+
+    client.dispatch(_input_registers(0x32, [1, 2]))
+    client.dispatch(_input_registers(0x33, [7]))
+    client.dispatch(_input_registers(0x32, [1, 2]))  # nothing changed
+    client.dispatch(
+        ReadHoldingRegistersResponse(
+            inverter_serial_number="SA1234G567",
+            data_adapter_serial_number="WF1234G567",
+            slave_address=0x32,
+            base_register=0,
+            register_count=1,
+            register_values=[9],
+        )
+    )
+    everything.close()
+    batteries.close()
+
+    assert client.subscriptions == []
+    assert [(d.slave_address, d.changes) async for d in everything] == [
+        (0x32, {IR(0): (None, 1), IR(1): (None, 2)}),
+        (0x33, {IR(0): (None, 7)}),
+        (0x32, {HR(0): (None, 9)}),
+    ]
+    assert [d.changes async for d in batteries] == [{IR(0): (None, 7)}]
+
+
+async def test_slow_subscriber_merges_instead_of_losing_changes():
+    """Once a subscriber's buffer is full, new deltas are merged into buffered ones."""
+    client = Client("localhost", 8899)
+    async with client.subscribe(maxsize=2) as deltas:
+        for value in range(1, 5):
+            client.dispatch(_input_registers(0x32, [value]))
+
+    assert deltas.merged == 2
+    assert deltas.dropped == 0
+    assert [d.changes async for d in deltas] == [
+        {IR(0): (None, 1)},
+        {IR(0): (1, 4)},
+    ]
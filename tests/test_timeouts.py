@@ -0,0 +1,56 @@
+"""Test adaptive response timeouts."""
+
+import random
+
+from custom_components.givenergy_local.givenergy_modbus.client.timeouts import (
+    AdaptiveTimeouts,
+)
+
+
+def test_timeout_follows_rtt_per_slave():
+    """Each slave address gets a timeout from its own RTT, falling back to the adapter's and then the default."""
+    timeouts = AdaptiveTimeouts(min_timeout=0.1)
+    assert timeouts.timeout(0x32, 1.0) == 1.0
+
+    for _ in range(20):
+        timeouts.on_response(0x32, 0.1)
+    assert 0.1 <= timeouts.timeout(0x32, 1.0) < 0.2
+    # nothing heard from the battery yet, so the adapter-wide estimate applies
+    assert timeouts.timeout(0x33, 1.0) == timeouts.adapter.rto(timeouts.granularity)
+
+    for _ in range(20):
+        timeouts.on_response(0x33, 2.0)
+    assert timeouts.timeout(0x33, 1.0) > 2.0
+    assert timeouts.timeout(0x32, 1.0) < 0.2
+
+
+def test_timeout_backs_off_until_next_response_and_is_clamped():
+    """Every unanswered attempt doubles the timeout, within bounds; a response resets it."""
+    timeouts = AdaptiveTimeouts(min_timeout=0.5, max_timeout=3.0)
+    for _ in range(20):
+        timeouts.on_response(0x32, 0.05)
+    assert timeouts.timeout(0x32, 1.0) == 0.5
+
+    timeouts.on_timeout(0x32)
+    timeouts.on_timeout(0x32)
+    assert timeouts.timeout(0x32, 1.0) == 2.0
+    # other slave addresses are unaffected
+    assert timeouts.timeout(0x31, 1.0) == 0.5
+    for _ in range(3):
+        timeouts.on_timeout(0x32)
+    assert timeouts.timeout(0x32, 1.0) == 3.0
+
+    timeouts.on_response(0x32, 0.05)
+    assert timeouts.timeout(0x32, 1.0) == 0.5
+
+
+def test_retry_delay_is_jittered_exponential():
+    """Retry delays are random, with a ceiling that doubles per attempt up to a cap."""
+    timeouts = AdaptiveTimeouts(
+        retry_base_delay=0.25, retry_max_delay=1.0, rng=random.Random(1)
+    )
+    for attempt, ceiling in ((1, 0.25), (2, 0.5), (3, 1.0), (6, 1.0)):
+        delays = [timeouts.retry_delay(attempt) for _ in range(200)]
+        assert all(0 <= d <= ceiling for d in delays)
+        assert max(delays) > ceiling / 2
+        assert len(set(delays)) == len(delays)
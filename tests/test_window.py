@@ -0,0 +1,111 @@
+"""Test the client's in-flight window against a simulated inverter."""
+
+import asyncio
+
+from custom_components.givenergy_local.givenergy_modbus.client.client import Client
+from custom_components.givenergy_local.givenergy_modbus.pdu import (
+    ReadInputRegistersRequest,
+)
+from devtools.simulator import Faults, SimulatedInverter
+
+
+async def test_large_batch_without_spurious_timeouts(socket_enabled):
+    """A batch bigger than the transmit queue completes, with timeouts that only start once a frame is sent."""
+    async with SimulatedInverter(faults=Faults(latency=0.1)) as inverter:
+        client = Client(
+            "127.0.0.1", inverter.port, adaptive_timeouts=False, max_in_flight=2
+        )
+        await client.connect()
+        in_flight = []
+
+        async def sample() -> None:
+            while True:
+                in_flight.append(len(client.in_flight_frames))
+                await asyncio.sleep(0.005)
+
+        sampler = asyncio.create_task(sample())
+        try:
+            # 24 distinct requests, so none are coalesced; unwindowed, the later ones would wait behind the
+            # simulator's one-at-a-time backlog for far longer than the timeout
+            requests = [
+                ReadInputRegistersRequest(base_register=60 * i, register_count=60)
+                for i in range(24)
+            ]
+            responses = await client.execute(requests, timeout=0.4, retries=0)
+        finally:
+            sampler.cancel()
+            await client.close()
+
+    assert len(responses) == 24
+    assert client.metrics.timeouts == 0
+    assert max(in_flight) == 2
+    assert not client.in_flight_frames
+    assert inverter.requests == 24
+
+
+async def test_heartbeat_replies_while_window_is_full(socket_enabled):
+    """Heartbeat replies still go out while a request waits for the only in-flight slot."""
+    async with SimulatedInverter(heartbeat_interval=0.3) as inverter:
+        client = Client(
+            "127.0.0.1", inverter.port, adaptive_timeouts=False, max_in_flight=1
+        )
+        await client.connect()
+        try:
+            # nothing answers slave 0x40, so the first read holds the slot until it times out and the second waits
+            requests = [
+                ReadInputRegistersRequest(
+                    base_register=0, register_count=60, slave_address=0x40
+                ),
+                ReadInputRegistersRequest(base_register=0, register_count=60),
+            ]
+            pending = client.execute(
+                requests, timeout=2.0, retries=0, return_exceptions=True
+            )
+            await asyncio.sleep(1.0)
+            assert client.tx_queue.window_full()
+            assert client.tx_queue.qsizes()["interactive"] == 1
+            assert inverter.heartbeats_sent >= 3
+            assert inverter.heartbeats_answered >= inverter.heartbeats_sent - 1
+            await pending
+        finally:
+            await client.close()
+
+
+async def test_send_deadline(socket_enabled):
+    """A request still waiting for an in-flight slot at its deadline times out without being sent."""
+    async with SimulatedInverter() as inverter:
+        client = Client(
+            "127.0.0.1", inverter.port, adaptive_timeouts=False, max_in_flight=1
+        )
+        await client.connect()
+        loop = asyncio.get_running_loop()
+        try:
+            # nothing answers slave 0x40, so this holds the only slot for its whole timeout
+            blocker = asyncio.create_task(
+                client.send_request_and_await_response(
+                    ReadInputRegistersRequest(
+                        base_register=0, register_count=60, slave_address=0x40
+                    ),
+                    timeout=2.0,
+                    retries=0,
+                )
+            )
+            await asyncio.sleep(0.1)
+            started = loop.time()
+            try:
+                await client.send_request_and_await_response(
+                    ReadInputRegistersRequest(base_register=0, register_count=60),
+                    timeout=2.0,
+                    retries=0,
+                    deadline=started + 0.3,
+                )
+            except asyncio.TimeoutError:
+                pass
+            else:
+                raise AssertionError("expected TimeoutError")
+            assert 0.3 <= loop.time() - started < 0.5
+            blocker.cancel()
+        finally:
+            await client.close()
+
+    assert inverter.requests == 1
@@ -0,0 +1,192 @@
+"""Test writing multiple holding registers."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from custom_components.givenergy_local.givenergy_modbus.client.client import Client
+from custom_components.givenergy_local.givenergy_modbus.client.commands import (
+    CommandBuilder,
+    RegisterMap,
+)
+from custom_components.givenergy_local.givenergy_modbus.exceptions import (
+    InvalidPduState,
+)
+from custom_components.givenergy_local.givenergy_modbus.framer import (
+    ClientFramer,
+    ServerFramer,
+)
+from custom_components.givenergy_local.givenergy_modbus.model import TimeSlot
+from custom_components.givenergy_local.givenergy_modbus.model.inverter import Model
+from custom_components.givenergy_local.givenergy_modbus.model.register import HR
+from custom_components.givenergy_local.givenergy_modbus.pdu import (
+    ReadInputRegistersRequest,
+    WriteHoldingRegisterRequest,
+    WriteHoldingRegistersRequest,
+    WriteHoldingRegistersResponse,
+)
+from devtools.simulator import SimulatedInverter
+
+
+def test_request_and_response_round_trip():
+    """Both PDUs survive encoding and decoding."""
+    request = WriteHoldingRegistersRequest(
+        base_register=35, register_values=[24, 3, 17, 12, 30, 0]
+    )
+    response = WriteHoldingRegistersResponse(
+        inverter_serial_number="SA1234G567",
+        data_adapter_serial_number="WF1234G567",
+        slave_address=0x11,
+        base_register=35,
+        register_count=6,
+    )
+
+    (decoded_request,) = ServerFramer().decode_frames(request.encode())
+    (decoded_response,) = ClientFramer().decode_frames(response.encode())
+
+    assert isinstance(decoded_request, WriteHoldingRegistersRequest)
+    assert decoded_request.to_dict() == {35: 24, 36: 3, 37: 17, 38: 12, 39: 30, 40: 0}
+    assert decoded_request.check == request.check
+    assert isinstance(decoded_response, WriteHoldingRegistersResponse)
+    assert decoded_response.shape_hash() == request.expected_response().shape_hash()
+
+
+def test_every_register_must_be_safe_to_write():
+    """A range that includes any unsafe register is refused, like single writes are."""
+    with pytest.raises(InvalidPduState, match="HR\\(58\\) is not safe"):
+        WriteHoldingRegistersRequest(
+            base_register=57, register_values=[700, 0, 1]
+        ).encode()
+
+
+def test_batch_writes_merges_consecutive_registers_in_order():
+    """Runs of writes to consecutive registers become one request; everything else is left as it was."""
+    requests = CommandBuilder.set_system_date_time(datetime(2024, 3, 17, 12, 30, 5))
+    read = ReadInputRegistersRequest(base_register=0, register_count=60)
+
+    (batched,) = CommandBuilder.batch_writes(requests)
+    assert isinstance(batched, WriteHoldingRegistersRequest)
+    assert batched.base_register == RegisterMap.SYSTEM_TIME_YEAR
+    assert batched.register_values == [24, 3, 17, 12, 30, 5]
+    assert [(r.register, r.value) for r in batched.split()] == [
+        (r.register, r.value) for r in requests
+    ]
+
+    mixed = [
+        WriteHoldingRegisterRequest(RegisterMap.BATTERY_POWER_MODE, 1),
+        WriteHoldingRegisterRequest(RegisterMap.DISCHARGE_SLOT_1_START, 1600),
+        WriteHoldingRegisterRequest(RegisterMap.DISCHARGE_SLOT_1_END, 700),
+        read,
+        WriteHoldingRegisterRequest(RegisterMap.ENABLE_DISCHARGE, 1),
+    ]
+    batched_mixed = CommandBuilder.batch_writes(mixed)
+    assert [type(r).__name__ for r in batched_mixed] == [
+        "WriteHoldingRegisterRequest",
+        "WriteHoldingRegistersRequest",
+        "ReadInputRegistersRequest",
+        "WriteHoldingRegisterRequest",
+    ]
+    assert batched_mixed[1].to_dict() == {56: 1600, 57: 700}
+
+
+def test_readback_covers_only_blocks_written():
+    """Only the 60-register blocks that contain written registers are read back."""
+    requests = CommandBuilder.batch_writes(
+        CommandBuilder.set_discharge_slot_1(TimeSlot.from_repr(1600, 700))
+        + CommandBuilder.set_battery_soc_reserve(4)
+        + CommandBuilder.set_enable_charge(True)
+    )
+
+    readback = CommandBuilder(Model.HYBRID).refresh_written_registers(requests)
+
+    # HR(56), HR(57) and HR(96), HR(110)
+    assert [(r.slave_address, r.base_register) for r in readback] == [
+        (0x32, 0),
+        (0x32, 60),
+    ]
+    assert CommandBuilder().refresh_written_registers([]) == []
+
+
+class MultiWriteFaults(SimulatedInverter):
+    """Leaves the first `drop` multi-register writes unanswered, and rejects them with an error if `client` is set."""
+
+    def __init__(self, drop: int, client: "Client | None" = None) -> None:
+        super().__init__()
+        self.drop = drop
+        self.client = client
+        self.multi_writes = 0
+
+    def respond(self, request):
+        if isinstance(request, WriteHoldingRegistersRequest):
+            self.multi_writes += 1
+            if self.multi_writes <= self.drop:
+                if self.client is not None:
+                    error = WriteHoldingRegistersResponse(
+                        base_register=request.base_register,
+                        register_count=request.register_count,
+                        slave_address=request.slave_address,
+                        error=True,
+                    )
+                    asyncio.get_running_loop().call_soon(self.client.dispatch, error)
+                return None
+        return super().respond(request)
+
+
+SLOT = CommandBuilder.set_discharge_slot_1(TimeSlot.from_repr(1600, 700))
+
+
+async def test_batching_survives_a_lost_response(socket_enabled):
+    """One unanswered merged write falls back to single writes for that write only."""
+    async with MultiWriteFaults(drop=1) as inverter:
+        client = Client("127.0.0.1", inverter.port, adaptive_timeouts=False)
+        await client.connect()
+        try:
+            await client.execute(SLOT, timeout=0.2, retries=0)
+            assert client.batch_writes
+            await client.execute(SLOT, timeout=0.2, retries=0)
+        finally:
+            await client.close()
+
+    assert inverter.multi_writes == 2
+    assert client.batch_write_failures == 0
+    assert inverter.register_caches[0x32][HR(56)] == 1600
+
+
+async def test_batching_off_after_repeated_failures(socket_enabled):
+    """Batching is switched off after several unanswered merged writes in a row, until the next connection."""
+    async with MultiWriteFaults(drop=5) as inverter:
+        client = Client("127.0.0.1", inverter.port, adaptive_timeouts=False)
+        # keep the pacer from backing off for seconds after each timeout
+        client.pacer.max_gap = 0.25
+        await client.connect()
+        try:
+            for _ in range(Client.max_batch_write_failures):
+                assert client.batch_writes
+                await client.execute(SLOT, timeout=0.1, retries=0)
+            assert not client.batch_writes
+            await client.execute(SLOT, timeout=0.1, retries=0)
+            assert inverter.multi_writes == Client.max_batch_write_failures
+        finally:
+            await client.close()
+        await client.connect()
+        try:
+            assert client.batch_writes
+        finally:
+            await client.close()
+
+
+async def test_batching_off_after_error_response(socket_enabled):
+    """An error response to a merged write switches batching off straight away."""
+    async with MultiWriteFaults(drop=1) as inverter:
+        client = Client("127.0.0.1", inverter.port, adaptive_timeouts=False)
+        inverter.client = client
+        await client.connect()
+        try:
+            await client.execute(SLOT, timeout=0.5, retries=0)
+        finally:
+            await client.close()
+
+    assert not client.batch_writes
+    assert client.metrics.error_responses == 1
+    assert inverter.register_caches[0x32][HR(57)] == 700